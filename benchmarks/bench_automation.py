@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Automation routes at scale: alchemy stations each fed by a herb and a
+mana generator, two routes per station. The batched Automation tick is
+compared with a script polling every route on its own timer, which is
+what driving stations from outside the simulation used to take."""
+
+import time
+
+from wizards_workshop.automation import Automation, Conveyor
+from wizards_workshop.simulation import Workshop
+
+SECONDS = 60
+TICK_RATE = 60
+INTERVAL = 0.1
+
+
+def build(stations):
+    workshop = Workshop(tick_rate=TICK_RATE, seed=1)
+    lines = []
+    for i in range(stations):
+        x, z = (i % 25) * 10, (i // 25) * 10
+        station = workshop.add_verb("alchemy", (x, 0, z), scale=(1.5, 1.5, 1.5), slots=2)
+        herb = workshop.add_generator("herb", (x + 4, 0.5, z), interval=1.0)
+        mana = workshop.add_generator("mana", (x - 4, 0.5, z), interval=1.0)
+        lines.append((station, herb, mana))
+    return workshop, lines
+
+
+def run_batched(stations, conveyors=False):
+    workshop, lines = build(stations)
+    automation = Automation(workshop, interval=INTERVAL)
+    for station, herb, mana in lines:
+        for generator in (herb, mana):
+            belt = Conveyor((generator.position, station.position), speed=4) if conveyors else None
+            automation.route(generator, station, conveyor=belt)
+    tick_time = 0.0
+    tick = automation.tick
+
+    def timed_tick():
+        nonlocal tick_time
+        start = time.perf_counter()
+        tick()
+        tick_time += time.perf_counter() - start
+
+    automation.tick = timed_tick
+    return measure(workshop, lambda: tick_time)
+
+
+def run_polling(stations):
+    # One callback per route per interval, finding its generator's cards on the table
+    workshop, lines = build(stations)
+    book = workshop.recipe_book
+    poll_time = 0.0
+
+    def poll(generator, station):
+        nonlocal poll_time
+        start = time.perf_counter()
+        for card in list(workshop.card_grid.nearby(generator.position, 2.5)):
+            if card.verb is None and card.title == generator.card_title:
+                titles = [placed.title for placed in station.active_cards] + [card.title]
+                if len(station.backlog) < 2 and book.completions(station.name, titles):
+                    workshop.place_card(card, station)
+        workshop.scheduler.schedule_in(INTERVAL, poll, generator, station)
+        poll_time += time.perf_counter() - start
+
+    for station, herb, mana in lines:
+        for generator in (herb, mana):
+            workshop.scheduler.schedule_in(INTERVAL, poll, generator, station)
+    return measure(workshop, lambda: poll_time)
+
+
+def measure(workshop, routing_time):
+    start = time.perf_counter()
+    workshop.run(SECONDS * TICK_RATE)
+    elapsed = time.perf_counter() - start
+    frames = SECONDS * TICK_RATE
+    return elapsed / frames * 1000, routing_time() / (SECONDS / INTERVAL) * 1000, workshop.crafted_count
+
+
+def main():
+    print(f"{SECONDS} simulated seconds at {TICK_RATE} Hz, routes served every {INTERVAL} s")
+    print(f"{'routes':>7} {'mode':<16} {'ms/tick':>8} {'routing ms/pass':>16} {'crafted':>8}")
+    for stations in (50, 500):
+        for mode, run in (("polling", run_polling), ("batched", run_batched),
+                          ("batched+belts", lambda count: run_batched(count, conveyors=True))):
+            per_tick, per_pass, crafted = run(stations)
+            print(f"{stations * 2:>7} {mode:<16} {per_tick:>8.3f} {per_pass:>16.3f} {crafted:>8}")
+
+
+if __name__ == "__main__":
+    main()
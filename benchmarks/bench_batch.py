@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Batch runner scaling: the same set of workshop instances (ten simulated
+minutes each, a crafting bot heading for the Potion of Fire Resistance)
+inline and across process pools of growing size, up to the core count.
+
+    cd src && python ../benchmarks/bench_batch.py [instances] [max processes]
+"""
+
+import os
+import sys
+import time
+
+from wizards_workshop.batch import InstanceSpec, run_batch, summarize
+
+INSTANCES = 400
+
+
+def specs(count):
+    # Seeds crossed with a few generator speeds
+    return [InstanceSpec(seed=i, interval_scale=(0.5, 1.0, 2.0)[i % 3]) for i in range(count)]
+
+
+def timed(batch, processes):
+    start = time.perf_counter()
+    first = None
+    results = []
+    for result in run_batch(batch, processes=processes):
+        if first is None:
+            first = time.perf_counter() - start
+        results.append(result)
+    return time.perf_counter() - start, first, results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else INSTANCES
+    cores = os.cpu_count() or 1
+    most = int(sys.argv[2]) if len(sys.argv) > 2 else cores
+    batch = specs(count)
+
+    pools = [1]
+    while pools[-1] * 2 <= most:
+        pools.append(pools[-1] * 2)
+    if pools[-1] != most:
+        pools.append(most)
+
+    print(f"{count} instances, {cores} cores")
+    print(f"{'processes':>9} {'wall':>8} {'instances/s':>12} {'speedup':>8} {'efficiency':>11} {'first result':>13}")
+    inline = None
+    for processes in pools:
+        elapsed, first, results = timed(batch, processes)
+        assert sorted(result.index for result in results) == list(range(count))
+        inline = inline or elapsed
+        label = "inline" if processes == 1 else str(processes)
+        print(f"{label:>9} {elapsed:>7.2f}s {count / elapsed:>12.1f} {inline / elapsed:>7.2f}x "
+              f"{inline / elapsed / processes * 100:>10.0f}% {first * 1000:>10.0f} ms")
+    if len(pools) == 1:
+        # Still go through a pool once, to show its overhead
+        elapsed, first, results = timed(batch, 2)
+        print(f"{'2 (pool)':>9} {elapsed:>7.2f}s {count / elapsed:>12.1f} {inline / elapsed:>7.2f}x "
+              f"{inline / elapsed / 2 * 100:>10.0f}% {first * 1000:>10.0f} ms  (more processes than cores)")
+
+    print(f"\n{'interval x':>10} {'crafted':>8} {'reached':>8} {'first potion p50':>17} {'p90':>7} {'peak cards':>11}")
+    for scale, stats in sorted(summarize(results, by=lambda spec: spec.interval_scale).items()):
+        median = stats["first_target_median"]
+        p90 = stats["first_target_p90"]
+        print(f"{scale:>10} {stats['crafted_mean']:>8.1f} {stats['target_reached'] * 100:>7.0f}% "
+              f"{median if median is not None else float('nan'):>16.0f}s {p90 if p90 is not None else float('nan'):>6.0f}s "
+              f"{stats['peak_cards_mean']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
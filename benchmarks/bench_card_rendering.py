@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Scene nodes, draw calls and frame time for 10k cards: one Entity tree
+per card vs the batched CardRenderer. Renders offscreen."""
+
+import statistics
+import subprocess
+import sys
+import time as wall
+
+from panda3d.core import loadPrcFileData
+
+loadPrcFileData("", "window-type offscreen\naudio-library-name null\nsync-video false")
+
+from ursina import Ursina, scene  # noqa: E402
+
+from wizards_workshop.card import Card  # noqa: E402
+from wizards_workshop.card_renderer import CardRenderer, render_stats  # noqa: E402
+from wizards_workshop.content import content_pack  # noqa: E402
+from wizards_workshop.simulation import Workshop  # noqa: E402
+
+CARDS = 10_000
+FRAMES = 60
+TITLES = list(content_pack().card_types)
+
+
+def measure(batched):
+    app = Ursina(window_type="offscreen", development_mode=False, size=(640, 480))
+    empty_scene = render_stats(scene)
+    renderer = CardRenderer() if batched else None
+    workshop = Workshop()
+
+    start = wall.perf_counter()
+    views = []
+    for i in range(CARDS):
+        title = TITLES[i % len(TITLES)]
+        state = workshop.create_card(position=(i % 100 - 50, 0.1, i // 100 - 50), title=title,
+                                     is_resource=title == "Mana", lifetime=30.0 if title == "Mana" else None)
+        views.append(Card(state, workshop=workshop, renderer=renderer))
+    build = wall.perf_counter() - start
+
+    for _ in range(5):
+        app.step()
+
+    frames = []
+    for _ in range(FRAMES):
+        start = wall.perf_counter()
+        workshop.advance(1 / 60)
+        app.step()
+        frames.append(wall.perf_counter() - start)
+
+    # Dragging one card rewrites only its rows in the batch
+    start = wall.perf_counter()
+    for view in views[:1000]:
+        view.is_held = True
+        view.drag_to(view.position)
+    drag = (wall.perf_counter() - start) / 1000
+
+    stats = render_stats(scene)
+    return (stats["nodes"] - empty_scene["nodes"], stats["draw_calls"] - empty_scene["draw_calls"],
+            build, statistics.median(frames) * 1000, drag * 1e6)
+
+
+def main():
+    if len(sys.argv) > 1:
+        # Child run: one Ursina app per mode
+        print(*measure(sys.argv[1] == "batched"))
+        return
+
+    print(f"{CARDS} cards       {'nodes':>8} {'draws':>8} {'build':>9} {'frame':>11} {'drag':>10}")
+    for mode in ("entities", "batched"):
+        output = subprocess.run([sys.executable, __file__, mode], capture_output=True, text=True, check=True)
+        nodes, draws, build, frame, drag = output.stdout.strip().splitlines()[-1].split()
+        print(f"  {mode:<14} {int(nodes):>8} {int(draws):>8} {float(build):>7.2f} s "
+              f"{float(frame):>8.2f} ms {float(drag):>7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
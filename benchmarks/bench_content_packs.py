@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Content pack loading: parsing TOML/JSON mod packs vs the memory-mapped
+compiled cache on later startups."""
+
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from wizards_workshop.content_pack import BASE_PACK, load_packs
+
+VERBS = ["forge", "study", "ritual", "alchemy"]
+SIZES = (1_000, 10_000, 100_000)
+RUNS = 5
+
+
+def write_mod(folder, size, suffix):
+    rng = random.Random(size)
+    recipes = [
+        {"verb": rng.choice(VERBS), "inputs": [f"Item {rng.randrange(size)}" for _ in range(rng.randint(1, 3))],
+         "output": f"Item {i}", "time": round(rng.uniform(1, 8), 1), "description": f"Makes item {i}"}
+        for i in range(size)
+    ]
+    card_types = {f"Item {i}": rng.choice(["ingredient", "tool", "potion", "essence"]) for i in range(size)}
+    path = Path(folder) / f"mod_{size}{suffix}"
+    if suffix == ".json":
+        path.write_text(json.dumps({"card_types": card_types, "recipes": recipes}))
+    else:
+        lines = ["[card_types]"] + [f"{json.dumps(title)} = {json.dumps(kind)}" for title, kind in card_types.items()]
+        for recipe in recipes:
+            lines += ["", "[[recipes]]"] + [f"{key} = {json.dumps(value)}" for key, value in recipe.items()]
+        path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def timed(function):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, result
+
+
+def main():
+    print(f"{'recipes':>8} {'format':>7} {'pack size':>10} {'first':>10} {'cached':>10} {'cache size':>11}")
+    with tempfile.TemporaryDirectory() as folder:
+        for size in SIZES:
+            for suffix in (".toml", ".json"):
+                mod = write_mod(folder, size, suffix)
+                paths = [BASE_PACK, mod]
+                # First startup: parse, merge and compile into an empty cache
+                runs = iter(range(RUNS))
+                parse_ms, parsed = timed(lambda: load_packs(paths, cache_dir=Path(folder) / f"{mod.name}.{next(runs)}"))
+                cache_dir = Path(folder) / f"{mod.name}.0"
+                cached_ms, cached = timed(lambda: load_packs(paths, cache_dir=cache_dir))
+                assert cached == parsed
+                cache_size = sum(file.stat().st_size for file in cache_dir.iterdir())
+                print(f"{len(cached.recipes):>8} {suffix[1:]:>7} {mod.stat().st_size / 1024:>7.0f} KB "
+                      f"{parse_ms:>7.1f} ms {cached_ms:>7.1f} ms {cache_size / 1024:>8.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
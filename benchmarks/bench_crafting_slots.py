@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Crafted items per simulated minute at one alchemy station as its
+crafting slots go from 1 to 16, with a steady stream of Herb + Mana sets
+dropped on it faster than one slot can brew them."""
+
+import time
+
+from wizards_workshop.simulation import Workshop
+
+MINUTES = 10
+SETS_PER_MINUTE = 240  # a Minor Potion takes 3 s, so 20 a minute per slot
+TICK_RATE = 60
+
+
+def run(slots):
+    workshop = Workshop(tick_rate=TICK_RATE, seed=1)
+    station = workshop.add_verb("alchemy", (0, 0, 0), scale=(1.5, 1.5, 1.5), slots=slots)
+    every = TICK_RATE * 60 // SETS_PER_MINUTE
+    peak_queue = 0
+
+    start = time.perf_counter()
+    for tick in range(MINUTES * 60 * TICK_RATE):
+        if tick % every == 0:
+            for title in ("Herb", "Mana"):
+                workshop.place_card(workshop.create_card(station.position, title), station)
+            peak_queue = max(peak_queue, station.queue_depth)
+        workshop.step()
+    elapsed = time.perf_counter() - start
+    return station.metrics(workshop.time), peak_queue, elapsed
+
+
+def main():
+    print(f"{SETS_PER_MINUTE} sets a minute offered for {MINUTES} simulated minutes")
+    print(f"{'slots':>5} {'crafted/min':>12} {'utilisation':>12} {'queued at end':>14} {'peak queue':>11} {'wall':>8}")
+    for slots in (1, 2, 4, 8, 12, 16):
+        metrics, peak_queue, elapsed = run(slots)
+        print(f"{slots:>5} {metrics['per_minute']:>12.1f} {metrics['utilisation'] * 100:>11.1f}% "
+              f"{metrics['queue_depth']:>14} {peak_queue:>11} {elapsed:>6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
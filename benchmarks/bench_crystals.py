@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Per-frame cost of the Playmat crystal animation: the old walk over
+children and grandchildren with property setters vs the crystal registry."""
+
+import math
+import statistics
+import time as wall
+
+from panda3d.core import loadPrcFileData
+
+loadPrcFileData("", "window-type none\naudio-library-name null")
+
+from ursina import Entity, Ursina, color, time  # noqa: E402
+
+from wizards_workshop.playmat import Playmat  # noqa: E402
+
+COUNTS = (8, 1_000, 10_000)
+FRAMES = 50
+
+
+def tree_walk(root):
+    # The old Playmat.update loop, with crystals where it looked for them
+    for child in root.children:
+        if hasattr(child, 'children'):
+            for crystal in child.children:
+                if crystal.scale_y > 0.5:
+                    crystal.rotation_y += 30 * time.dt
+                    pulse = 1 + 0.1 * math.sin(wall.time() * 2)
+                    crystal.scale = (crystal.scale_x, crystal.scale_y * pulse, crystal.scale_z)
+
+
+def per_frame(function):
+    samples = []
+    for _ in range(FRAMES):
+        start = wall.perf_counter()
+        function()
+        samples.append(wall.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    Ursina(window_type="none", development_mode=False)
+    time.dt = 1 / 60
+
+    print(f"{'crystals':>10} {'tree walk':>12} {'registry':>12}")
+    for count in COUNTS:
+        root = Entity()
+        for i in range(count):
+            stone = Entity(parent=root, scale=(0.8, 0.4, 0.8))
+            Entity(parent=stone, scale=(0.3, 0.6, 0.3), position=(0, 1, 0))
+
+        playmat = Playmat()
+        for i in range(count - len(playmat.crystals)):
+            playmat.add_crystal(position=(i % 100, 1, i // 100), color=color.azure)
+
+        walk = per_frame(lambda: tree_walk(root))
+        registry = per_frame(playmat.animate_crystals)
+        print(f"{count:>10} {walk:>9.3f} ms {registry:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
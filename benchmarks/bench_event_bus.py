@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Workshop events at 100x speed: per-type dispatch latency from the bus,
+and how many view effects run per frame with per-event vs batched
+subscribers."""
+
+import time
+
+from bench_simulation import busy_workshop, feed_alchemy
+from wizards_workshop.events import (
+    CardConsumed,
+    CardCreated,
+    CardDropped,
+    CardExpired,
+    CardSpawned,
+    RecipeCompleted,
+    RecipeRejected,
+    RecipeStarted,
+)
+
+FRAMES = 600  # ten seconds at 60 fps
+TICKS_PER_FRAME = 100  # 100x speed
+
+
+def run(workshop, batched):
+    effects = 0
+
+    def effect(event):
+        nonlocal effects
+        effects += 1
+
+    def effects_once_per_generator(events):
+        nonlocal effects
+        effects += len({event.generator for event in events})
+
+    # Stand-ins for the card and station views
+    for event_type in (CardCreated, CardDropped, CardExpired, CardConsumed, RecipeStarted, RecipeCompleted, RecipeRejected):
+        workshop.events.subscribe(event_type, lambda event: None)
+    if batched:
+        workshop.events.subscribe(CardSpawned, effects_once_per_generator, batched=True)
+    else:
+        workshop.events.subscribe(CardSpawned, effect)
+
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        workshop.run(TICKS_PER_FRAME)
+        feed_alchemy(workshop)
+        workshop.events.flush()
+    elapsed = time.perf_counter() - start
+    return elapsed / FRAMES * 1000, effects / FRAMES
+
+
+def main():
+    quiet = busy_workshop(100)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        quiet.run(TICKS_PER_FRAME)
+        feed_alchemy(quiet)
+    no_subscribers = (time.perf_counter() - start) / FRAMES * 1000
+
+    sync_ms, sync_effects = run(busy_workshop(100), batched=False)
+    workshop = busy_workshop(100)
+    batched_ms, batched_effects = run(workshop, batched=True)
+
+    print(f"100 generators, {TICKS_PER_FRAME} ticks per frame, {FRAMES} frames")
+    print(f"no subscribers      {no_subscribers:>7.2f} ms/frame")
+    print(f"per-event flashes   {sync_ms:>7.2f} ms/frame {sync_effects:>7.1f} spawn flashes/frame")
+    print(f"batched flashes     {batched_ms:>7.2f} ms/frame {batched_effects:>7.1f} spawn flashes/frame")
+    print(f"\n{'event':<16} {'events':>8} {'dispatches':>11} {'mean':>9} {'max':>9} {'per event':>10}")
+    for name, stats in sorted(workshop.events.latency().items(), key=lambda item: -item[1]["events"]):
+        print(f"{name:<16} {stats['events']:>8} {stats['dispatches']:>11} {stats['mean_us']:>6.2f} us "
+              f"{stats['max_us']:>6.1f} us {stats['per_event_us']:>7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
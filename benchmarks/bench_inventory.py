@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Per-frame HUD cost with 50k cards on the table: the old update_ui, which
+counted Mana by scanning every card and rebuilt every Text each frame, vs
+inventory counters and text that is only rebuilt when its value changes."""
+
+import statistics
+import time as wall
+
+from panda3d.core import loadPrcFileData
+
+loadPrcFileData("", "window-type none\naudio-library-name null")
+
+from ursina import Ursina, color  # noqa: E402
+
+from wizards_workshop.content import content_pack  # noqa: E402
+from wizards_workshop.environment import Environment  # noqa: E402
+from wizards_workshop.game_manager import GameManager  # noqa: E402
+
+CARDS = 50_000
+FRAMES = 300
+TITLES = list(content_pack().card_types)
+
+
+def scanning_update_ui(game):
+    # GameManager.update_ui before the inventory counters
+    game.mana_count = sum(1 for card in game.workshop.cards.values() if card.title == "Mana")
+    game.mana_text.text = f"Mana: {game.mana_count}"
+    game.clock_text.text = game.environment.get_time_string()
+    game.phase_text.text = game.environment.get_day_phase()
+    phase = game.environment.get_day_phase()
+    if phase in ["Morning", "Afternoon"]:
+        game.time_icon.color = color.yellow
+        game.time_icon.scale = 0.025
+    else:
+        game.time_icon.color = color.light_gray
+        game.time_icon.scale = 0.02
+
+
+def per_frame(game, update_ui):
+    samples = []
+    for i in range(FRAMES):
+        # A card comes and goes every few frames, like a generator would
+        if i % 10 == 0:
+            game.workshop.create_card(position=(0, 0.1, 0), title="Mana")
+        elif i % 10 == 5:
+            game.workshop.remove_card(next(reversed(game.workshop.cards.values())), "consumed")
+        game.environment.update_time_cycle(1 / 60)
+        start = wall.perf_counter()
+        update_ui(game)
+        samples.append(wall.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    Ursina(window_type="none", development_mode=False)
+    game = GameManager(seed=1)
+    for i in range(CARDS):
+        game.workshop.create_card(position=(i % 300 - 150, 0.1, i // 300 - 150), title=TITLES[i % len(TITLES)])
+    game.environment = Environment()
+    # No card views: this measures the HUD alone
+    game.workshop.inventory.watch("Mana", game.on_mana_changed)
+    game.setup_ui()
+    game.setup_time_ui()
+
+    scan = per_frame(game, scanning_update_ui)
+    counted = per_frame(game, GameManager.update_ui)
+    print(f"{len(game.workshop.cards)} cards, {game.mana_count} Mana")
+    print(f"scan + rebuild  {scan:>8.3f} ms/frame")
+    print(f"counters        {counted:>8.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Frame time with 5k decaying cards: per-card update() polling vs expiry
+on the scheduler's timing wheel plus GameManager's throttled pass over the
+lifetime bars. Renders offscreen."""
+
+import statistics
+import subprocess
+import sys
+import time as wall
+
+from panda3d.core import loadPrcFileData
+
+loadPrcFileData("", "window-type offscreen\naudio-library-name null\nsync-video false")
+
+from ursina import Ursina, time  # noqa: E402
+
+from wizards_workshop.card import Card  # noqa: E402
+from wizards_workshop.game_manager import GameManager  # noqa: E402
+from wizards_workshop.simulation import Workshop  # noqa: E402
+
+CARDS = 5000
+FRAMES = 120
+
+
+class PolledCard(Card):
+    # What every card with a lifetime used to do each frame
+    def refresh_lifetime_bar(self):
+        pass
+
+    def update(self):
+        if self.lifetime and not self.is_decaying:
+            elapsed = wall.time() - self.creation_time
+            remaining = max(0, 1 - (elapsed / self.lifetime))
+            if hasattr(self, 'lifetime_bar'):
+                self.lifetime_bar.scale_x = 1.4 * remaining
+            if remaining <= 0:
+                self.start_decay()
+        if hasattr(self, 'resource_symbol'):
+            self.resource_symbol.rotation_y += 50 * time.dt
+
+
+def measure(card_class):
+    app = Ursina(window_type="offscreen", development_mode=False, size=(640, 480))
+    workshop = Workshop()
+    views = []
+    for i in range(CARDS):
+        state = workshop.create_card(position=(i % 100 - 50, 0.1, i // 100 - 25), title="Mana",
+                                     lifetime=30.0, is_resource=True)
+        views.append(card_class(state, workshop=workshop))
+
+    # Building thousands of cards takes a while; start every lifetime now
+    for view in views:
+        view.creation_time = wall.time()
+
+    for _ in range(5):
+        app.step()
+
+    frames = []
+    lifetime_work = []
+    bar_clock = 0.0
+    for _ in range(FRAMES):
+        start = wall.perf_counter()
+        workshop.advance(1 / 60)
+        app.step()
+        frames.append(wall.perf_counter() - start)
+
+        # Lifetime work on its own: the simulation tick (expiry) and the bar
+        # pass as GameManager.update_lifetime_bars runs it, or the pass
+        # Ursina already made over every card's update() above
+        start = wall.perf_counter()
+        if card_class is PolledCard:
+            for view in views:
+                view.update()
+        else:
+            workshop.step()
+            bar_clock += 1 / 60
+            if bar_clock >= GameManager.lifetime_bar_interval:
+                bar_clock = 0.0
+                for view in views:
+                    view.refresh_lifetime_bar()
+        lifetime_work.append(wall.perf_counter() - start)
+    return statistics.median(frames) * 1000, statistics.median(lifetime_work) * 1000
+
+
+def main():
+    if len(sys.argv) > 1:
+        # Child run: one Ursina app per mode
+        card_class = PolledCard if sys.argv[1] == "polled" else Card
+        print(*measure(card_class))
+        return
+
+    results = {}
+    for mode in ("polled", "scheduled"):
+        output = subprocess.run([sys.executable, __file__, mode], capture_output=True, text=True, check=True)
+        results[mode] = [float(value) for value in output.stdout.strip().splitlines()[-1].split()]
+
+    print(f"{CARDS} decaying cards, median per frame   {'frame':>10} {'lifetimes':>10}")
+    for label, mode in (("per-card update()", "polled"), ("timing wheel + throttled bars", "scheduled")):
+        frame, work = results[mode]
+        print(f"  {label:<35} {frame:>7.2f} ms {work:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Crafting planner on synthetic recipe graphs: one-off solve of the book,
+single plans for deep targets, and batches of plans inline vs across a
+process pool."""
+
+import os
+import random
+import time
+
+from wizards_workshop.planner import PlanningError
+from wizards_workshop.recipes import Recipe, RecipeBook
+
+VERBS = ["forge", "study", "ritual", "alchemy"]
+RAW = 500
+BATCH = 200
+
+
+def synthetic_book(size, seed=0):
+    # Layered graph: every item is made from 1-3 earlier ones (or raw titles),
+    # with some alternative recipes and some that loop back to later items
+    rng = random.Random(seed)
+    recipes = []
+    for i in range(size):
+        def pick():
+            if i < 50 or rng.random() < 0.4:
+                return f"Raw {rng.randrange(RAW)}"
+            return f"Item {rng.randrange(max(0, i - 2000), i)}"
+
+        recipes.append(Recipe(verb=rng.choice(VERBS), inputs=[pick() for _ in range(rng.randint(1, 3))],
+                              output=f"Item {i}", time=rng.uniform(1.0, 8.0)))
+        if rng.random() < 0.1:
+            recipes.append(Recipe(verb=rng.choice(VERBS), inputs=[f"Item {rng.randrange(size)}"],
+                                  output=f"Item {i}", time=rng.uniform(1.0, 8.0)))
+    return RecipeBook(recipes)
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    processes = max(2, os.cpu_count() or 1)
+    print(f"{'recipes':>8} {'solve':>10} {'plan':>10} {'steps':>7} {'batch inline':>13} {'batch pool':>11}")
+    for size in (1_000, 10_000, 100_000):
+        book = synthetic_book(size)
+        solve, _ = timed(lambda: book.planner)
+
+        rng = random.Random(1)
+        deep = [f"Item {size - 1 - i}" for i in range(50)]
+        plan_times, steps = [], []
+        for target in deep:
+            elapsed, plan = timed(book.plan, target, inventory={f"Raw {i}": 3 for i in range(0, RAW, 7)})
+            plan_times.append(elapsed)
+            steps.append(len(plan.steps))
+
+        targets = [f"Item {rng.randrange(size)}" for _ in range(BATCH)]
+
+        def inline():
+            results = []
+            for target in targets:
+                try:
+                    results.append(book.plan(target))
+                except PlanningError as error:
+                    results.append(error)
+            return results
+
+        inline_time, inline_plans = timed(inline)
+        pool_time, pool_plans = timed(book.plan_many, targets, processes=processes)
+        assert [type(plan) for plan in inline_plans] == [type(plan) for plan in pool_plans]
+        print(f"{len(book.recipes):>8} {solve * 1000:>7.1f} ms {sum(plan_times) / len(plan_times) * 1000:>7.2f} ms "
+              f"{sum(steps) // len(steps):>7} {inline_time * 1000:>10.0f} ms {pool_time * 1000:>8.0f} ms")
+    print(f"(batches of {BATCH} targets, pool of {processes} processes on {os.cpu_count()} CPUs)")
+
+
+if __name__ == "__main__":
+    main()
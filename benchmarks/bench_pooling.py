@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Cost of a short-lived effect entity created and destroyed every time vs
+taken from and returned to an EntityPool, and the pool's hit rate when a
+burst of effects overlaps (many generators firing at once)."""
+
+import random
+import statistics
+import time
+
+from panda3d.core import loadPrcFileData
+
+loadPrcFileData("", "window-type none\naudio-library-name null")
+
+from ursina import Entity, Ursina, color, destroy  # noqa: E402
+
+from wizards_workshop.pool import EntityPool  # noqa: E402
+
+EFFECTS = 2_000
+RUNS = 5
+BURSTS = 200
+CAPACITY = 64
+
+
+def churn():
+    for i in range(EFFECTS):
+        flash = Entity(model="sphere", color=color.yellow, scale=0.5, position=(i % 10, 1, 0))
+        destroy(flash)
+
+
+def pooled(pool):
+    for i in range(EFFECTS):
+        flash = pool.acquire(color=color.yellow, scale=0.5, position=(i % 10, 1, 0))
+        pool.release(flash)
+
+
+def timed(function, *args):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        function(*args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) / EFFECTS * 1e6
+
+
+def heavy_load():
+    # Each frame some generators fire, each flash living a few frames
+    pool = EntityPool(lambda **attributes: Entity(model="sphere", **attributes), capacity=CAPACITY)
+    rng = random.Random(1)
+    alive = []
+    for frame in range(BURSTS):
+        for _ in range(rng.randint(0, 40)):
+            alive.append((frame + rng.randint(1, 6), pool.acquire(color=color.yellow, scale=0.5)))
+        expired = [flash for until, flash in alive if until <= frame]
+        alive = [(until, flash) for until, flash in alive if until > frame]
+        for flash in expired:
+            pool.release(flash)
+    return pool.stats()
+
+
+def main():
+    Ursina(window_type="none", development_mode=False)
+    pool = EntityPool(lambda **attributes: Entity(model="sphere", **attributes), capacity=CAPACITY)
+    create_us = timed(churn)
+    pooled_us = timed(pooled, pool)
+    print(f"create+destroy {create_us:>7.1f} us/effect")
+    print(f"pooled         {pooled_us:>7.1f} us/effect ({create_us / pooled_us:.1f}x)")
+
+    stats = heavy_load()
+    print(f"heavy load: {stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['discarded']} discarded, hit rate {stats['hit_rate']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
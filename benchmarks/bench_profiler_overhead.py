@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Cost of the frame profiler on a busy headless workshop: never set up,
+set up but disabled, and enabled, plus the JSON/CSV export."""
+
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from bench_simulation import busy_workshop, feed_alchemy
+from wizards_workshop.profiler import FrameProfiler
+from wizards_workshop.scheduler import Scheduler
+from wizards_workshop.simulation import Workshop
+from wizards_workshop.spatial import SpatialGrid
+
+FRAMES = 600
+TICKS_PER_FRAME = 4  # as at 4x speed
+RUNS = 5
+
+
+def run_frames(profiler=None):
+    workshop = busy_workshop(100)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        workshop.run(TICKS_PER_FRAME)
+        if frame % 8 == 0:
+            feed_alchemy(workshop)
+        if profiler is not None:
+            profiler.count("cards", len(workshop.cards))
+            profiler.end_frame()
+    return (time.perf_counter() - start) / FRAMES * 1e6
+
+
+def median_frame(profiler=None):
+    return statistics.median(run_frames(profiler) for _ in range(RUNS))
+
+
+def main():
+    baseline = median_frame()
+
+    profiler = FrameProfiler(window=FRAMES)
+    for owner, attribute, section in [
+        (Workshop, "run", "simulation"),
+        (Scheduler, "step", "tick"),
+        (Workshop, "create_card", "create"),
+        (Workshop, "remove_card", "remove"),
+        (Workshop, "move_card", "move"),
+        (SpatialGrid, "nearby", "spatial"),
+    ]:
+        profiler.watch(owner, attribute, section)
+    disabled = median_frame()
+
+    profiler.enable()
+    enabled = median_frame(profiler)
+    summary = profiler.summary()
+    profiler.disable()
+    assert "timed" not in Workshop.run.__qualname__ and "step" in vars(Scheduler)
+
+    print(f"{FRAMES} frames of {TICKS_PER_FRAME} ticks, 100 generators")
+    print(f"no profiler        {baseline:>8.1f} us/frame")
+    print(f"profiler disabled  {disabled:>8.1f} us/frame ({(disabled / baseline - 1) * 100:+.1f}%)")
+    print(f"profiler enabled   {enabled:>8.1f} us/frame ({(enabled / baseline - 1) * 100:+.1f}%)")
+    for name, section in summary["sections"].items():
+        print(f"  {name:<12} {section['mean_ms'] * 1000:>8.1f} us {section['calls']:>8.1f} calls/frame")
+
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        profiler.export_json(Path(folder) / "profile.json")
+        profiler.export_csv(Path(folder) / "profile.csv")
+        elapsed = (time.perf_counter() - start) * 1000
+        sizes = ", ".join(f"{path.name} {path.stat().st_size / 1024:.0f} KB" for path in sorted(Path(folder).iterdir()))
+    print(f"export of {len(profiler.frames)} frames: {elapsed:.0f} ms ({sizes})")
+
+
+if __name__ == "__main__":
+    main()
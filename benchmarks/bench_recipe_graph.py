@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Reachability and crafting depth over large recipe books: full analysis
+(must stay under a second at 100k recipes) vs adding recipes one at a
+time, checked against a rebuild."""
+
+import random
+import time
+
+from wizards_workshop.content import starting_titles
+from wizards_workshop.recipe_graph import RecipeGraph
+from wizards_workshop.recipes import Recipe
+
+VERBS = ["forge", "study", "ritual", "alchemy"]
+ADDS = 1_000
+BUDGET = 1.0
+
+
+def synthetic_recipes(size, rng):
+    # Mostly built on earlier items; some need titles nobody makes or loop back
+    sources = starting_titles()
+    recipes = []
+    for i in range(size):
+        inputs = []
+        for _ in range(rng.randint(1, 3)):
+            roll = rng.random()
+            if i < 20 or roll < 0.2:
+                inputs.append(rng.choice(sources))
+            elif roll < 0.202:
+                inputs.append(f"Lost {rng.randrange(100)}")
+            elif roll < 0.23:
+                inputs.append(f"Item {rng.randrange(size)}")
+            else:
+                inputs.append(f"Item {rng.randrange(max(0, i - 1000), i)}")
+        recipes.append(Recipe(verb=rng.choice(VERBS), inputs=inputs, output=f"Item {i}"))
+    return recipes
+
+
+def report(graph):
+    return (dict(graph.depth), graph.unreachable_outputs(), graph.missing_inputs(),
+            graph.unused_inputs(), len(graph.dead_recipes()))
+
+
+def main():
+    print(f"{'recipes':>8} {'full':>10} {'reachable':>10} {'unreachable':>12} {'max depth':>10} {'add (us)':>9}")
+    for size in (1_000, 10_000, 100_000):
+        rng = random.Random(size)
+        recipes = synthetic_recipes(size, rng)
+
+        start = time.perf_counter()
+        graph = RecipeGraph(recipes, starting_titles())
+        unreachable = graph.unreachable_outputs()
+        full = time.perf_counter() - start
+        if size >= 100_000:
+            assert full < BUDGET, f"full analysis took {full:.2f} s"
+
+        extra = [Recipe(verb=rng.choice(VERBS), inputs=[f"Item {rng.randrange(size)}", rng.choice(starting_titles())],
+                        output=f"Item {rng.randrange(size + ADDS)}") for _ in range(ADDS)]
+        start = time.perf_counter()
+        for recipe in extra:
+            graph.add_recipe(recipe)
+        add = (time.perf_counter() - start) / ADDS
+
+        assert report(graph) == report(RecipeGraph(recipes + extra, starting_titles()))
+        print(f"{size:>8} {full * 1000:>7.1f} ms {len(graph.depth):>10} {len(unreachable):>12} "
+              f"{max(graph.depth.values()):>10} {add * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
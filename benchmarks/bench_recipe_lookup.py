@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Compare indexed RecipeBook.find_recipe against the old linear scan"""
+
+import random
+import time
+
+from wizards_workshop.recipes import Recipe, RecipeBook
+
+VERBS = ["forge", "study", "ritual", "alchemy"]
+LOOKUPS = 2000
+
+
+def synthetic_book(size, seed=0):
+    rng = random.Random(seed)
+    book = RecipeBook()
+    book.recipes = [
+        Recipe(
+            verb=rng.choice(VERBS),
+            inputs=[f"Item {rng.randrange(size * 2)}" for _ in range(rng.randint(1, 3))],
+            output=f"Item {i}",
+        )
+        for i in range(size)
+    ]
+    book.rebuild_index()
+    return book
+
+
+def linear_find(book, verb_name, card_titles):
+    for recipe in book.recipes:
+        if recipe.matches(verb_name, card_titles):
+            return recipe
+    return None
+
+
+def time_lookups(find, book, queries):
+    start = time.perf_counter()
+    for verb_name, titles in queries:
+        find(verb_name, titles)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    print(f"{'recipes':>8} {'linear (us)':>12} {'indexed (us)':>13} {'speedup':>8}")
+    for size in (10, 1_000, 100_000):
+        book = synthetic_book(size)
+        rng = random.Random(1)
+        # Half hits (shuffled inputs of real recipes), half misses
+        queries = []
+        for i in range(LOOKUPS):
+            if i % 2:
+                recipe = rng.choice(book.recipes)
+                titles = rng.sample(recipe.inputs, len(recipe.inputs))
+                queries.append((recipe.verb, titles))
+            else:
+                queries.append((rng.choice(VERBS), ["Nothing", "At All"]))
+
+        for verb_name, titles in queries:
+            assert linear_find(book, verb_name, titles) is book.find_recipe(verb_name, titles)
+
+        linear_queries = queries if size < 100_000 else queries[:50]
+        linear = time_lookups(lambda v, t: linear_find(book, v, t), book, linear_queries)
+        indexed = time_lookups(book.find_recipe, book, queries)
+        print(f"{size:>8} {linear * 1e6:>12.2f} {indexed * 1e6:>13.2f} {linear / indexed:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Memory and startup for 100 stations over a 50k-recipe book: a private
+mutable book per station (as Verb3D used to build) vs the one shared,
+frozen book with per-verb views."""
+
+import random
+import time
+from sys import intern
+import tracemalloc
+from dataclasses import dataclass
+from typing import List
+
+from wizards_workshop.recipes import Recipe, RecipeBook, recipe_key
+from wizards_workshop.simulation import Workshop
+
+VERBS = ["forge", "study", "ritual", "alchemy"]
+RECIPES = 50_000
+STATIONS = 100
+MEASURED_PRIVATE = 5  # private books actually built; the rest is extrapolated
+
+
+@dataclass
+class LegacyRecipe:
+    verb: str
+    inputs: List[str]
+    output: str
+    time: float = 3.0
+    description: str = ""
+
+
+def content(seed=0):
+    rng = random.Random(seed)
+    return [(rng.choice(VERBS), [f"Item {rng.randrange(RECIPES)}" for _ in range(rng.randint(1, 3))],
+             f"Item {i}", 3.0, f"Makes item {i}") for i in range(RECIPES)]
+
+
+def private_book(rows):
+    # Each station loading the content itself: fresh strings and objects every time
+    recipes = [LegacyRecipe("".join(verb), ["".join(title) for title in inputs], "".join(output), time, "".join(text))
+               for verb, inputs, output, time, text in rows]
+    index = {}
+    for recipe in recipes:
+        index.setdefault(recipe_key(recipe.verb, recipe.inputs), []).append(recipe)
+    return recipes, index
+
+
+def measure(build):
+    # Timed untraced, then built again under tracemalloc for the size
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, elapsed, result
+
+
+def main():
+    rows = content()
+
+    size, elapsed, books = measure(lambda: [private_book(rows) for _ in range(MEASURED_PRIVATE)])
+    private_size = size / MEASURED_PRIVATE * STATIONS
+    private_time = elapsed / MEASURED_PRIVATE * STATIONS
+
+    def shared():
+        # Titles interned as the content pack loader does
+        book = RecipeBook([Recipe(intern(verb), tuple(map(intern, inputs)), intern(output), time, text)
+                           for verb, inputs, output, time, text in rows])
+        book.freeze()
+        workshop = Workshop(recipe_book=book)
+        for i in range(STATIONS):
+            workshop.add_verb(VERBS[i % len(VERBS)], (i * 5, 0, 0))
+        return workshop
+
+    shared_size, shared_time, workshop = measure(shared)
+    assert all(workshop.recipe_book.for_verb(verb.name) for verb in workshop.verbs)
+
+    print(f"{STATIONS} stations, {RECIPES:,} recipes")
+    print(f"private books  {private_size / 2**20:>8.1f} MB {private_time * 1000:>9.0f} ms "
+          f"({size / MEASURED_PRIVATE / 2**20:.1f} MB each, from {MEASURED_PRIVATE} built)")
+    print(f"shared book    {shared_size / 2**20:>8.1f} MB {shared_time * 1000:>9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
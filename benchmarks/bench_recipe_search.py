@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Recipe book search as the player types, one keystroke at a time: the
+inverted word index vs filtering every recipe's text per keystroke."""
+
+import random
+import statistics
+import time
+
+from wizards_workshop.recipe_search import RecipeIndex
+from wizards_workshop.recipes import Recipe
+
+VERBS = ["forge", "study", "ritual", "alchemy"]
+RECIPES = 100_000
+ADJECTIVES = ["iron", "silver", "arcane", "shadow", "glowing", "ancient", "bitter", "crystal", "storm", "ember"]
+NOUNS = ["ore", "ingot", "blade", "wand", "tome", "potion", "essence", "dust", "root", "shard", "rune", "flask"]
+QUERIES = ["iron blade", "crystal shard 12", "glow", "adow ess", "forge ember", "ritual 4817", "wand", "storm root 99"]
+FRAME_MS = 1000 / 60
+
+
+def title(rng, number):
+    return f"{rng.choice(ADJECTIVES).title()} {rng.choice(NOUNS).title()} {number}"
+
+
+def content(seed=0):
+    rng = random.Random(seed)
+    titles = [title(rng, i) for i in range(RECIPES)]
+    return [Recipe(rng.choice(VERBS), tuple(rng.choice(titles) for _ in range(rng.randint(1, 3))), titles[i])
+            for i in range(RECIPES)]
+
+
+def scan(recipes, query):
+    terms = query.lower().split()
+    texts = (f"{recipe.verb} {' '.join(recipe.inputs)} {recipe.output}".lower() for recipe in recipes)
+    return [position for position, text in enumerate(texts) if all(term in text for term in terms)]
+
+
+def main():
+    recipes = content()
+    start = time.perf_counter()
+    index = RecipeIndex(recipes)
+    build = time.perf_counter() - start
+    print(f"{RECIPES:,} recipes, index built in {build * 1000:.0f} ms "
+          f"({len(index.postings):,} words, {len(index.trigrams):,} trigrams)")
+
+    keystrokes = []
+    print(f"{'query':>18} {'results':>8} {'scan':>10} {'index worst':>12} {'index mean':>11}")
+    for query in QUERIES:
+        samples = []
+        for length in range(1, len(query) + 1):
+            start = time.perf_counter()
+            results = index.search(query[:length])
+            samples.append(time.perf_counter() - start)
+        keystrokes += samples
+        start = time.perf_counter()
+        expected = scan(recipes, query)
+        scan_ms = (time.perf_counter() - start) * 1000
+        # Word matching is stricter than raw substrings across word breaks, so only
+        # check that every indexed result is one the scan also finds
+        assert set(results) <= set(expected)
+        print(f"{query:>18} {len(results):>8} {scan_ms:>7.1f} ms {max(samples) * 1000:>9.2f} ms "
+              f"{statistics.mean(samples) * 1000:>8.2f} ms")
+
+    keystrokes.sort()
+    worst = keystrokes[-1] * 1000
+    print(f"per keystroke: p50 {statistics.median(keystrokes) * 1000:.2f} ms, "
+          f"p99 {keystrokes[int(len(keystrokes) * 0.99)] * 1000:.2f} ms, worst {worst:.2f} ms "
+          f"(frame {FRAME_MS:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Partial-match suggestions on a station: the per-verb recipe trie vs
+scanning the verb's recipes for ones the placed cards are a start of."""
+
+import random
+import statistics
+import time
+from collections import Counter
+
+from wizards_workshop.recipes import Recipe, RecipeBook
+
+VERBS = ["forge", "study", "ritual", "alchemy"]
+RECIPES = 100_000
+TITLES = 2_000  # few enough titles that partial sets share many recipes
+QUERIES = 2_000
+
+
+def content(seed=0):
+    rng = random.Random(seed)
+    return [Recipe(rng.choice(VERBS), tuple(f"Item {rng.randrange(TITLES)}" for _ in range(rng.randint(1, 4))),
+                   f"Result {i}") for i in range(RECIPES)]
+
+
+def scan(book, verb, titles):
+    placed = Counter(titles)
+    return [recipe for recipe in book.for_verb(verb) if not placed - Counter(recipe.inputs)]
+
+
+def latency(function, queries):
+    samples = []
+    for verb, titles in queries:
+        start = time.perf_counter()
+        function(verb, titles)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples) * 1e6, samples[int(len(samples) * 0.99)] * 1e6
+
+
+def main():
+    rng = random.Random(1)
+    book = RecipeBook(content())
+
+    start = time.perf_counter()
+    for verb in VERBS:
+        book.trie(verb)
+    build = time.perf_counter() - start
+
+    print(f"{RECIPES:,} recipes over {len(VERBS)} verbs, tries built in {build * 1000:.0f} ms")
+    print(f"{'placed':>6} {'matches':>8} {'scan p50':>10} {'trie p50':>10} {'trie p99':>10}")
+    for size in range(4):
+        # Partial sets taken from real recipes, as a player placing towards one would
+        queries = []
+        for _ in range(QUERIES):
+            recipe = rng.choice(book.recipes)
+            queries.append((recipe.verb, rng.sample(recipe.inputs, min(size, len(recipe.inputs)))))
+        for verb, titles in queries[:50]:
+            assert list(book.completions(verb, titles)) == scan(book, verb, titles)
+        matches = statistics.mean(len(book.completions(verb, titles)) for verb, titles in queries)
+        scan_p50, _ = latency(lambda verb, titles: scan(book, verb, titles), queries[:20])
+        trie_p50, trie_p99 = latency(book.completions, queries)
+        print(f"{size:>6} {matches:>8.0f} {scan_p50:>7.0f} us {trie_p50:>7.2f} us {trie_p99:>7.2f} us")
+
+    suggest = latency(lambda verb, titles: book.trie(verb).suggest(titles), queries)[0]
+    print(f"suggest (3 closest with missing cards) p50 {suggest:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Soak: generate 1M cards through the headless workshop (expiring and
+consumed) and check that memory and per-tick cost stay flat, i.e. nothing
+keeps a dead card around. Prints one row per 100k cards generated."""
+
+import gc
+import resource
+import statistics
+import time
+from itertools import islice
+
+from wizards_workshop.simulation import Workshop
+
+TOTAL = 1_000_000
+PER_TICK = 50
+REPORT_EVERY = 100_000
+
+
+def live_objects():
+    gc.collect()
+    return len(gc.get_objects())
+
+
+def main():
+    workshop = Workshop.default(seed=1)
+    cards = workshop.cards
+    rng = workshop.random
+    generated = 0
+    samples = []
+    print(f"{'generated':>10} {'live':>7} {'slots':>7} {'objects':>9} {'max rss':>10} {'tick':>10}")
+    while generated < TOTAL:
+        start = time.perf_counter()
+        for _ in range(PER_TICK):
+            workshop.create_card(position=(rng.uniform(-20, 20), 0.1, rng.uniform(-20, 20)),
+                                 title=rng.choice(("Mana", "Herb", "Crystal Shard")),
+                                 lifetime=rng.uniform(2.0, 8.0), is_resource=True)
+        # Some cards are consumed before they expire
+        for card in list(islice(cards.with_title("Crystal Shard"), PER_TICK // 5)):
+            workshop.remove_card(card, "consumed")
+        workshop.step()
+        samples.append(time.perf_counter() - start)
+        generated += PER_TICK
+
+        if generated % REPORT_EVERY == 0:
+            rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            tick_us = statistics.median(samples) * 1e6
+            samples.clear()
+            print(f"{generated:>10,} {len(cards):>7} {cards.capacity:>7} {live_objects():>9,} "
+                  f"{rss_mb:>7.1f} MB {tick_us:>7.0f} us")
+
+
+if __name__ == "__main__":
+    main()
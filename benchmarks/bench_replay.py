@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Replay recorder and replayer on a scripted session: a busy workshop (100
+generators) where a player drags Herb and Mana pairs onto the alchemy
+station for ten simulated minutes. Reports the recording overhead and size,
+then replays the session headless with verification, as a deterministic
+workload whose speed can be compared between commits."""
+
+import random
+import time
+
+from bench_simulation import busy_workshop
+from wizards_workshop.replay import ReplayRecorder, replay
+
+MINUTES = 10
+DRAG_TICKS = 20  # a drag lasts a third of a second
+FRAMES_PER_TICK = 2  # the view moves a held card twice per tick, as at 120 fps
+
+
+def play(workshop, recorder=None):
+    # Every half second pick up a loose Herb, then a Mana, and drag them onto alchemy
+    rng = random.Random(1)
+    alchemy = next(verb for verb in workshop.verbs if verb.name == "alchemy")
+    end = workshop.tick + MINUTES * 60 * 60
+    while workshop.tick < end:
+        workshop.run(30)
+        for title in ("Herb", "Mana"):
+            loose = [card for card in workshop.cards.with_title(title) if card.verb is None]
+            if not loose:
+                break
+            card = rng.choice(loose)
+            x, y, z = card.position
+            workshop.move_card(card, (x, y + 0.5, z))
+            if recorder:
+                recorder.pickup(card)
+            for step in range(1, DRAG_TICKS + 1):
+                for _ in range(FRAMES_PER_TICK):
+                    t = step / DRAG_TICKS
+                    workshop.move_card(card, (x + (alchemy.position[0] - x) * t, y + 0.5, z + (alchemy.position[2] - z) * t))
+                    if recorder:
+                        recorder.move(card)
+                workshop.run(1)
+            if not card.alive:
+                continue
+            workshop.move_card(card, (alchemy.position[0], y, alchemy.position[2]))
+            if recorder:
+                recorder.drop(card, alchemy)
+            workshop.place_card(card, alchemy)
+
+
+def main():
+    workshop = busy_workshop(100)
+    start = time.perf_counter()
+    play(workshop)
+    unrecorded = time.perf_counter() - start
+
+    workshop = busy_workshop(100)
+    start = time.perf_counter()
+    recorder = ReplayRecorder(workshop)
+    play(workshop, recorder)
+    data = recorder.finish()
+    recorded = time.perf_counter() - start
+
+    result = replay(data)
+    assert result.workshop.crafted_count == workshop.crafted_count
+
+    print(f"{MINUTES} simulated minutes, 100 generators, {workshop.crafted_count} crafted")
+    print(f"session unrecorded  {unrecorded:>7.2f} s")
+    print(f"session recorded    {recorded:>7.2f} s ({(recorded / unrecorded - 1) * 100:+.1f}%)")
+    print(f"replay file         {len(data) / 1024:>7.1f} KB compressed from {len(recorder.buffer) / 1024:.1f} KB: "
+          f"{recorder.snapshot_size / 1024:.1f} KB starting snapshot and {recorder.entries} entries")
+    print(f"                    {len(data) / MINUTES / 1024:>7.1f} KB per simulated minute")
+    print(f"verified replay     {result.seconds:>7.2f} s for {result.ticks} ticks, "
+          f"{result.speedup:,.0f}x real time, {result.ticks / result.seconds:,.0f} ticks/s")
+
+
+if __name__ == "__main__":
+    main()
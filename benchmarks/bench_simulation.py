@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Headless Workshop throughput in ticks per second"""
+
+import time
+
+from wizards_workshop.simulation import Workshop
+
+TICKS = 60 * 60  # one simulated minute at 60 Hz
+
+
+def busy_workshop(generators):
+    workshop = Workshop.default()
+    for i in range(generators):
+        x, z = (i % 20) * 6 - 60, (i // 20) * 6 + 20
+        workshop.add_generator(("mana", "herb", "crystal")[i % 3], (x, 0.5, z), interval=1.0)
+    return workshop
+
+
+def feed_alchemy(workshop):
+    # Keep the alchemy station brewing Herb + Mana whenever both are around
+    alchemy = next(verb for verb in workshop.verbs if verb.name == "alchemy")
+    if alchemy.is_processing or alchemy.active_cards:
+        return
+    herb = next((card for card in workshop.cards.with_title("Herb") if not card.verb), None)
+    mana = next((card for card in workshop.cards.with_title("Mana") if not card.verb), None)
+    if herb and mana:
+        workshop.place_card(herb, alchemy)
+        workshop.place_card(mana, alchemy)
+
+
+def measure(workshop, ticks, bot=None):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        workshop.step()
+        if bot and workshop.tick % 30 == 0:
+            bot(workshop)
+    return ticks / (time.perf_counter() - start)
+
+
+def main():
+    rate = measure(Workshop.default(), TICKS)
+    print(f"default workshop:        {rate:>10,.0f} ticks/s")
+
+    for generators in (10, 100):
+        workshop = busy_workshop(generators)
+        rate = measure(workshop, TICKS, bot=feed_alchemy)
+        print(f"{generators:>3} generators + bot:   {rate:>10,.0f} ticks/s "
+              f"({len(workshop.cards)} cards, {workshop.crafted_count} crafted)")
+
+    workshop = Workshop.default()
+    for i in range(10_000):
+        workshop.create_card(position=(i % 100, 0.1, i // 100), title="Mana", lifetime=30.0 + i % 600)
+    rate = measure(workshop, TICKS)
+    print(f"10k decaying cards:      {rate:>10,.0f} ticks/s ({len(workshop.cards)} left)")
+
+    start = time.perf_counter()
+    count = 0
+    while time.perf_counter() - start < 2.0:
+        Workshop.default(tick_rate=10).run(10)
+        count += 1
+    print(f"default workshop, 1s @ 10 Hz: {count / (time.perf_counter() - start):>6,.0f} workshops/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Snapshot save/load time and size for large workshops (target: 100k
+cards well under a second each way)."""
+
+import os
+import statistics
+import tempfile
+import time
+
+from wizards_workshop.content import content_pack
+from wizards_workshop.simulation import Workshop
+from wizards_workshop.snapshot import load_snapshot, save_snapshot
+
+SIZES = (1_000, 10_000, 100_000)
+RUNS = 3
+TITLES = list(content_pack().card_types)
+
+
+def build(cards):
+    workshop = Workshop.default(seed=1)
+    for i in range(cards):
+        title = TITLES[i % len(TITLES)]
+        # Every other card is a decaying resource with a pending expiry
+        decays = i % 2 == 0
+        workshop.create_card(position=(i % 300 - 150, 0.1, i // 300 - 150), title=title,
+                             lifetime=30.0 + i % 60 if decays else None, is_resource=decays)
+    workshop.run(600)
+    return workshop
+
+
+def timed(function, *args):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = function(*args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, result
+
+
+def main():
+    print(f"{'cards':>8} {'size':>10} {'save':>10} {'load':>10}")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "workshop.snapshot")
+        for cards in SIZES:
+            workshop = build(cards)
+            save_ms, size = timed(save_snapshot, path, workshop, 12.0)
+            load_ms, snapshot = timed(load_snapshot, path)
+            assert len(snapshot.workshop.cards) == len(workshop.cards)
+            print(f"{len(workshop.cards):>8} {size / 1024:>7.0f} KB {save_ms:>7.1f} ms {load_ms:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
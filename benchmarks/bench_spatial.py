@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Compare SpatialGrid occupancy queries against a scan over every card"""
+
+import math
+import random
+import time
+
+from wizards_workshop.spatial import SpatialGrid
+
+QUERIES = 2000
+THRESHOLD = 1.5
+
+
+def linear_occupied(points, position, threshold=THRESHOLD):
+    for point in points:
+        if math.dist(point, position) < threshold:
+            return True
+    return False
+
+
+def main():
+    print(f"{'cards':>8} {'linear (us)':>12} {'grid (us)':>10} {'move (us)':>10}")
+    for count in (100, 10_000, 100_000):
+        rng = random.Random(0)
+        # Table grows with the card count so density stays roughly constant
+        half = math.sqrt(count) * 1.5
+        points = [(rng.uniform(-half, half), 0.1, rng.uniform(-half, half)) for _ in range(count)]
+        queries = [(rng.uniform(-half, half), 0.6, rng.uniform(-half, half)) for _ in range(QUERIES)]
+
+        grid = SpatialGrid(cell_size=2.0)
+        for i, point in enumerate(points):
+            grid.insert(i, point)
+
+        for query in queries[:200]:
+            assert linear_occupied(points, query) == grid.any_within(query, THRESHOLD)
+
+        linear_queries = queries if count <= 10_000 else queries[:100]
+        start = time.perf_counter()
+        for query in linear_queries:
+            linear_occupied(points, query)
+        linear = (time.perf_counter() - start) / len(linear_queries)
+
+        start = time.perf_counter()
+        for query in queries:
+            grid.any_within(query, THRESHOLD)
+        indexed = (time.perf_counter() - start) / len(queries)
+
+        # Dragging a card: small steps, mostly within one cell
+        start = time.perf_counter()
+        for step in range(QUERIES):
+            x, y, z = points[step % count]
+            grid.move(step % count, (x + 0.05, y, z + 0.05))
+        moved = (time.perf_counter() - start) / QUERIES
+
+        print(f"{count:>8} {linear * 1e6:>12.2f} {indexed * 1e6:>10.2f} {moved * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Startup time, scene nodes and draw calls for the Playmat and Environment
+decoration: one Entity per tile/stone/grass patch vs baked StaticMeshes."""
+
+import statistics
+import subprocess
+import sys
+import time as wall
+
+from panda3d.core import loadPrcFileData
+
+loadPrcFileData("", "window-type offscreen\naudio-library-name null\nsync-video false")
+
+from ursina import Entity, Ursina, scene  # noqa: E402
+
+from wizards_workshop import environment, playmat  # noqa: E402
+from wizards_workshop.card_renderer import render_stats  # noqa: E402
+
+RUNS = 5
+FRAMES = 60
+
+
+class EntityPile:
+    # Same interface as StaticMesh, but one child entity per part (the old way)
+    def __init__(self):
+        self.parts = []
+
+    def add(self, model, position=(0, 0, 0), scale=(1, 1, 1), color=None):
+        self.parts.append(dict(model=model, position=position, scale=scale, color=color))
+
+    def attach(self, entity):
+        for part in self.parts:
+            Entity(parent=entity, **part)
+        return entity
+
+
+def measure(baked):
+    if not baked:
+        playmat.StaticMesh = environment.StaticMesh = EntityPile
+
+    app = Ursina(window_type="offscreen", development_mode=False, size=(640, 480))
+    empty_scene = render_stats(scene)
+
+    start = wall.perf_counter()
+    environment.Environment(), playmat.Playmat()
+    startup = [wall.perf_counter() - start]
+    stats = render_stats(scene)
+
+    for _ in range(5):
+        app.step()
+    frames = []
+    for _ in range(FRAMES):
+        start = wall.perf_counter()
+        app.step()
+        frames.append(wall.perf_counter() - start)
+
+    # More builds for a steadier startup figure (the scenery parents its
+    # sky and lights to the scene, so these just pile up)
+    for _ in range(RUNS - 1):
+        start = wall.perf_counter()
+        environment.Environment(), playmat.Playmat()
+        startup.append(wall.perf_counter() - start)
+
+    return (stats["nodes"] - empty_scene["nodes"], stats["draw_calls"] - empty_scene["draw_calls"],
+            statistics.median(startup) * 1000, statistics.median(frames) * 1000)
+
+
+def main():
+    if len(sys.argv) > 1:
+        # Child run: one Ursina app per mode
+        print(*measure(sys.argv[1] == "baked"))
+        return
+
+    print(f"playmat + environment {'nodes':>7} {'draws':>7} {'startup':>11} {'frame':>10}")
+    for mode in ("entities", "baked"):
+        output = subprocess.run([sys.executable, __file__, mode], capture_output=True, text=True, check=True)
+        nodes, draws, startup, frame = output.stdout.strip().splitlines()[-1].split()
+        print(f"  {mode:<19} {int(nodes):>7} {int(draws):>7} {float(startup):>8.1f} ms {float(frame):>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Offscreen benchmark suite: synthetic workloads through the full game
+(or headless where there is nothing to draw), reporting fps, p50/p99
+frame time, peak RSS and scene node/draw counts to JSON, and comparing
+them with a stored baseline.
+
+    cd src && python ../benchmarks/bench_suite.py                  # run, compare, exit 1 on regression
+    cd src && python ../benchmarks/bench_suite.py --save-baseline  # record this machine's baseline
+    cd src && python ../benchmarks/bench_suite.py generators daynight
+
+Each scenario runs in its own process, so one Ursina app (and one peak
+RSS) per scenario. Baselines are machine specific: record one on the
+machine that compares against it.
+"""
+
+import argparse
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time as wall
+from collections import deque
+from pathlib import Path
+
+FRAMES = 300
+WARMUP = 30
+BASELINE = Path(__file__).with_name("suite_baseline.json")
+RESULTS = Path(__file__).with_name("suite_results.json")
+
+# Allowed change before a metric counts as a regression, and which way is worse
+TOLERANCES = {
+    "fps": (0.15, -1),
+    "frame_p50_ms": (0.15, 1),
+    "frame_p99_ms": (0.30, 1),
+    "peak_rss_mb": (0.10, 1),
+    "nodes": (0.05, 1),
+    "draw_calls": (0.05, 1),
+}
+
+
+# Scenarios: each sets up its workload and returns (per-frame function, extra stats function)
+
+def start_game(before_setup=None):
+    from wizards_workshop.game_manager import GameManager
+    game = GameManager(seed=1)
+    if before_setup:
+        before_setup(game.workshop)
+    game.setup()
+    # The frames below drive the simulation themselves, at a fixed rate
+    game.scheduler.paused = True
+    return game
+
+
+def scenario_generators(generators=60, ticks_per_frame=4):
+    # Generators spawning cards as fast as they can, at 4x speed
+    def add_generators(workshop):
+        for i in range(generators):
+            x, z = (i % 12) * 3 - 18, (i // 12) * 3 - 16
+            workshop.add_generator(("mana", "herb", "crystal")[i % 3], (x, 0.5, z), interval=1.0)
+
+    game = start_game(add_generators)
+    return lambda: game.scheduler.run(ticks_per_frame), lambda: {"cards": len(game.workshop.cards)}
+
+
+def scenario_crafting(stations=24, ticks_per_frame=4, kept_outputs=200):
+    # Stations restocked with their first recipe's inputs whenever they go idle
+    def add_stations(workshop):
+        names = ["forge", "study", "ritual", "alchemy"]
+        for i in range(stations):
+            workshop.add_verb(names[i % 4], ((i % 8) * 5 - 18, 0, (i // 8) * 5 - 20), scale=(1.5, 0.5, 1.5))
+
+    from wizards_workshop.events import RecipeCompleted
+    game = start_game(add_stations)
+    workshop = game.workshop
+    outputs = deque()
+
+    def clear_outputs(event):
+        outputs.append(event.output)
+        if len(outputs) > kept_outputs:
+            old = outputs.popleft()
+            if old.alive:
+                workshop.remove_card(old, "consumed")
+
+    workshop.events.subscribe(RecipeCompleted, clear_outputs)
+
+    book = workshop.recipe_book
+
+    def frame():
+        for verb in workshop.verbs:
+            recipes = book.for_verb(verb.name)
+            if not verb.is_processing and not verb.active_cards and recipes:
+                for title in recipes[0].inputs:
+                    workshop.place_card(workshop.create_card(verb.position, title), verb)
+        game.scheduler.run(ticks_per_frame)
+
+    return frame, lambda: {"cards": len(workshop.cards), "crafted": workshop.crafted_count}
+
+
+def scenario_recipe_lookup(recipes=100_000, lookups=2_000):
+    # Headless: exact matches and partial-match suggestions against a large book
+    from wizards_workshop.recipes import Recipe, RecipeBook
+    rng = random.Random(1)
+    verbs = ["forge", "study", "ritual", "alchemy"]
+    book = RecipeBook([Recipe(rng.choice(verbs), tuple(f"Item {rng.randrange(recipes)}" for _ in range(rng.randint(1, 3))),
+                              f"Item {i}") for i in range(recipes)])
+    for verb in verbs:
+        book.trie(verb)
+    placed = [(recipe.verb, list(recipe.inputs)) for recipe in rng.sample(book.recipes, 1000)]
+    misses = [(rng.choice(verbs), [f"Item {rng.randrange(recipes)}", f"Item {rng.randrange(recipes)}"]) for _ in range(1000)]
+    queries = placed + misses
+    position = 0
+
+    def frame():
+        nonlocal position
+        for _ in range(lookups):
+            verb, titles = queries[position]
+            position = (position + 1) % len(queries)
+            book.find_recipe(verb, titles) or book.completions(verb, titles[:1])
+
+    return frame, lambda: {"recipes": recipes, "lookups_per_frame": lookups}
+
+
+def scenario_occupancy(cards=5_000, checks=2_000):
+    # A crowded table: occupancy checks over thousands of cards, with their views
+    def fill_table(workshop):
+        for i in range(cards):
+            workshop.create_card((i % 100 * 0.5 - 25, 0.1, i // 100 * 0.5 - 15), ("Mana", "Herb", "Crystal")[i % 3])
+
+    game = start_game(fill_table)
+    workshop = game.workshop
+    rng = random.Random(2)
+    points = [(rng.uniform(-30, 30), 0.1, rng.uniform(-20, 20)) for _ in range(checks)]
+
+    def frame():
+        for point in points:
+            workshop.is_position_occupied(point)
+        game.scheduler.run(1)
+
+    return frame, lambda: {"cards": len(workshop.cards), "checks_per_frame": checks}
+
+
+def scenario_daynight(frames_per_day=240):
+    # A full day every few seconds: sky, lights and the clock UI changing each frame
+    game = start_game()
+    environment = game.environment
+    step = environment.day_length / (environment.time_speed * frames_per_day)
+    return lambda: environment.update_time_cycle(step), lambda: {"hour": round(environment.current_time, 2)}
+
+
+SCENARIOS = {
+    "generators": (scenario_generators, True),
+    "crafting": (scenario_crafting, True),
+    "recipe_lookup": (scenario_recipe_lookup, False),
+    "occupancy": (scenario_occupancy, True),
+    "daynight": (scenario_daynight, True),
+}
+
+
+# Measurement
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KB elsewhere
+
+
+def run_scenario(name, frames, warmup):
+    build, renders = SCENARIOS[name]
+    app = None
+    if renders:
+        from panda3d.core import loadPrcFileData
+        loadPrcFileData("", "window-type offscreen\naudio-library-name null\nsync-video false")
+        from ursina import Ursina
+        app = Ursina(window_type="offscreen", development_mode=False, size=(800, 600))
+
+    frame, extra = build()
+    step = app.step if app else (lambda: None)
+    for _ in range(warmup):
+        frame()
+        step()
+
+    times = []
+    start = wall.perf_counter()
+    for _ in range(frames):
+        frame_start = wall.perf_counter()
+        frame()
+        step()
+        times.append(wall.perf_counter() - frame_start)
+    elapsed = wall.perf_counter() - start
+
+    times.sort()
+    result = {
+        "frames": frames,
+        "fps": frames / elapsed,
+        "frame_p50_ms": times[len(times) // 2] * 1000,
+        "frame_p99_ms": times[min(len(times) - 1, int(len(times) * 0.99))] * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    if app:
+        from wizards_workshop.card_renderer import render_stats
+        result.update(render_stats())
+    result.update(extra())
+    return result
+
+
+def compare(results, baseline, scale):
+    # Lines for the report, and the regressions among them
+    lines, regressions = [], []
+    for name, result in results.items():
+        before = baseline.get("scenarios", {}).get(name)
+        for metric, (tolerance, worse) in TOLERANCES.items():
+            if metric not in result:
+                continue
+            value = result[metric]
+            old = before.get(metric) if before else None
+            if not old:
+                lines.append(f"  {name:<14} {metric:<13} {value:>10.1f}")
+                continue
+            change = value / old - 1
+            regressed = change * worse > tolerance * (scale if metric in ("fps", "frame_p50_ms", "frame_p99_ms") else 1)
+            flag = "  REGRESSION" if regressed else ""
+            lines.append(f"  {name:<14} {metric:<13} {value:>10.1f} {old:>10.1f} {change * 100:>+7.1f}%{flag}")
+            if regressed:
+                regressions.append(f"{name} {metric}")
+    return lines, regressions
+
+
+def machine():
+    return {"platform": platform.platform(), "python": platform.python_version(), "processor": platform.machine()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--warmup", type=int, default=WARMUP)
+    parser.add_argument("--output", type=Path, default=RESULTS)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--timing-tolerance", type=float, default=1.0, help="scale the fps/frame time tolerances")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(sorted(unknown))}")
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.frames, args.warmup)))
+        return 0
+
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        command = [sys.executable, __file__, "--child", name, "--frames", str(args.frames), "--warmup", str(args.warmup)]
+        output = subprocess.run(command, capture_output=True, text=True)
+        if output.returncode:
+            print(f"{name} failed:\n{output.stderr}", file=sys.stderr)
+            return 2
+        results[name] = json.loads(output.stdout.strip().splitlines()[-1])
+        print(f"{name:<14} {results[name]['fps']:>8.1f} fps  p50 {results[name]['frame_p50_ms']:.2f} ms  "
+              f"p99 {results[name]['frame_p99_ms']:.2f} ms  {results[name]['peak_rss_mb']:.0f} MB")
+
+    report = {"machine": machine(), "frames": args.frames, "scenarios": results}
+    args.output.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; record one with --save-baseline")
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("machine") != report["machine"]:
+        print("Note: the baseline was recorded on a different machine:", baseline.get("machine"))
+    lines, regressions = compare(results, baseline, args.timing_tolerance)
+    print(f"\n  {'scenario':<14} {'metric':<13} {'now':>10} {'baseline':>10} {'change':>8}")
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,7 @@
-from .main import main
+def main():
+    # Imported lazily so the headless modules can be used without ursina
+    from .main import main as run
+    run()
+
 
 __all__ = ["main"]
@@ -0,0 +1,272 @@
+import heapq
+import math
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .events import CardSpawned, RecipeCompleted, RouteAdded, RouteRemoved
+from .simulation import SimCard, SimGenerator, SimVerb, Vec, Workshop
+
+
+@dataclass(eq=False)
+class Conveyor:
+    # A belt along a polyline; cards on it are off the table until they arrive
+    path: Tuple[Vec, ...]
+    speed: float = 2.0  # units per second
+    distances: List[float] = field(init=False, repr=False)  # along the belt to each point
+
+    def __post_init__(self):
+        self.path = tuple(tuple(point) for point in self.path)
+        if len(self.path) < 2:
+            raise ValueError("a conveyor needs at least two points")
+        if self.speed <= 0:
+            raise ValueError(f"conveyor speed must be positive, got {self.speed}")
+        self.distances = [0.0]
+        for a, b in zip(self.path, self.path[1:]):
+            self.distances.append(self.distances[-1] + math.dist(a, b))
+
+    @property
+    def length(self) -> float:
+        return self.distances[-1]
+
+    @property
+    def travel_time(self) -> float:
+        return self.length / self.speed
+
+    def point_at(self, distance: float) -> Vec:
+        if distance >= self.length:
+            return self.path[-1]
+        if distance <= 0:
+            return self.path[0]
+        index = bisect_right(self.distances, distance) - 1
+        a, b = self.path[index], self.path[index + 1]
+        span = self.distances[index + 1] - self.distances[index]
+        t = (distance - self.distances[index]) / span if span else 0.0
+        return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t, a[2] + (b[2] - a[2]) * t)
+
+
+Source = Union[SimGenerator, SimVerb]
+
+
+@dataclass(eq=False)
+class Route:
+    source: Source  # a generator's spawns or a verb's crafted outputs
+    target: SimVerb
+    titles: Optional[FrozenSet[str]] = None  # only cards with these titles, None for all
+    conveyor: Optional[Conveyor] = None
+    max_backlog: int = 2  # hold back while the target has this many sets queued
+    waiting: Deque[SimCard] = field(default_factory=deque)  # claimed, on the table, not yet delivered
+    delivered: int = 0
+
+    def carries(self, title: str) -> bool:
+        return self.titles is None or title in self.titles
+
+
+class Automation:
+    """Routes generator and station outputs to stations without the player.
+
+    Routes claim cards as they are spawned or crafted. One scheduler event
+    per interval then serves every route in a single pass: cards whose
+    conveyor has arrived, and waiting cards the target can use right now.
+    A card is only dropped on a tray it keeps completable, so routes never
+    make a station reject, and a route holds back while its target has
+    max_backlog sets queued. The event is only scheduled while some route
+    has cards waiting or in transit.
+
+    Routes are runtime configuration, not part of workshop snapshots.
+    """
+
+    def __init__(self, workshop: Workshop, interval: float = 0.1):
+        self.workshop = workshop
+        self.interval = interval
+        self.routes: List[Route] = []
+        self.ticks = 0
+        self._by_source: Dict[Source, List[Route]] = {}
+        self._turns: Dict[Source, int] = {}  # round robin between a source's routes
+        self._claims: Dict[SimCard, Route] = {}
+        self._transit: list = []  # heap of (arrival, sequence, departure, card, route)
+        self._sequence = 0
+        self._waiting: Dict[Route, None] = {}  # routes with cards on the table, in order
+        self._next_tick = None
+        workshop.events.subscribe(CardSpawned, self._on_spawned)
+        workshop.events.subscribe(RecipeCompleted, self._on_completed)
+
+    # Routes
+
+    def route(self, source: Source, target: SimVerb, titles: Optional[Iterable[str]] = None,
+              conveyor: Optional[Conveyor] = None, max_backlog: int = 2) -> Route:
+        workshop = self.workshop
+        if target not in workshop.verbs:
+            raise ValueError(f"target {target.name!r} is not a verb of this workshop")
+        if source not in workshop.generators and source not in workshop.verbs:
+            raise ValueError("source must be a generator or verb of this workshop")
+        route = Route(source, target, frozenset(titles) if titles is not None else None, conveyor, max_backlog)
+        self.routes.append(route)
+        self._by_source.setdefault(source, []).append(route)
+        workshop.events.publish(RouteAdded(route))
+        return route
+
+    def chain(self, *verbs: SimVerb, conveyor_speed: Optional[float] = None) -> List[Route]:
+        # Each verb's outputs to the next, on straight conveyors if a speed is given
+        routes = []
+        for source, target in zip(verbs, verbs[1:]):
+            conveyor = None
+            if conveyor_speed:
+                conveyor = Conveyor((source.position, target.position), conveyor_speed)
+            routes.append(self.route(source, target, conveyor=conveyor))
+        return routes
+
+    def unroute(self, route: Route):
+        # Waiting cards stay where they are; cards on its conveyor land at its end
+        if route not in self.routes:
+            return
+        self.routes.remove(route)
+        routes = self._by_source[route.source]
+        routes.remove(route)
+        if not routes:
+            del self._by_source[route.source]
+            self._turns.pop(route.source, None)
+        for card in route.waiting:
+            if self._claims.get(card) is route:
+                del self._claims[card]
+        route.waiting.clear()
+        self._waiting.pop(route, None)
+        if route.conveyor:
+            kept = []
+            for entry in self._transit:
+                if entry[4] is route:
+                    if self._claims.get(entry[3]) is route:
+                        del self._claims[entry[3]]
+                        self._land(entry[3], route)
+                else:
+                    kept.append(entry)
+            heapq.heapify(kept)
+            self._transit = kept
+        self.workshop.events.publish(RouteRemoved(route))
+
+    def release(self, card: SimCard) -> bool:
+        # The player took the card: no route will move it any more
+        route = self._claims.pop(card, None)
+        if route is None:
+            return False
+        if card in route.waiting:
+            route.waiting.remove(card)
+        elif card.alive:
+            self.workshop.move_card(card, card.position)  # back in the table's grid
+        return True
+
+    def close(self):
+        for route in list(self.routes):
+            self.unroute(route)
+        self.workshop.events.unsubscribe(CardSpawned, self._on_spawned)
+        self.workshop.events.unsubscribe(RecipeCompleted, self._on_completed)
+        if self._next_tick:
+            self._next_tick.cancel()
+            self._next_tick = None
+
+    # Claiming
+
+    def _on_spawned(self, event: CardSpawned):
+        routes = self._by_source.get(event.generator)
+        if routes:
+            self._claim(event.card, event.generator, routes)
+
+    def _on_completed(self, event: RecipeCompleted):
+        routes = self._by_source.get(event.verb)
+        if routes:
+            self._claim(event.output, event.verb, routes)
+
+    def _claim(self, card: SimCard, source: Source, routes: List[Route]):
+        candidates = [route for route in routes if route.carries(card.title)]
+        if not candidates:
+            return
+        turn = self._turns.get(source, 0)
+        self._turns[source] = turn + 1
+        route = candidates[turn % len(candidates)]
+        self._claims[card] = route
+
+        if route.conveyor:
+            # Off the table while on the belt; positions come from in_transit()
+            now = self.workshop.time
+            self.workshop.card_grid.remove(card)
+            card.position = route.conveyor.path[0]
+            heapq.heappush(self._transit, (now + route.conveyor.travel_time, self._sequence, now, card, route))
+            self._sequence += 1
+        else:
+            route.waiting.append(card)
+            self._waiting[route] = None
+        self._wake()
+
+    # The batched tick
+
+    def _wake(self):
+        if self._next_tick is None:
+            self._next_tick = self.workshop.scheduler.schedule_in(self.interval, self.tick)
+
+    def tick(self):
+        self._next_tick = None
+        self.ticks += 1
+        now = self.workshop.time
+        claims = self._claims
+
+        transit = self._transit
+        while transit and transit[0][0] <= now:
+            _, _, _, card, route = heapq.heappop(transit)
+            if card.alive and claims.get(card) is route:
+                self._land(card, route)
+                route.waiting.append(card)
+                self._waiting[route] = None
+
+        for route in list(self._waiting):
+            self._deliver(route)
+            if not route.waiting:
+                del self._waiting[route]
+
+        if self._waiting or transit:
+            self._wake()
+
+    def _land(self, card: SimCard, route: Route):
+        if card.alive:
+            self.workshop.move_card(card, route.conveyor.path[-1])
+
+    def _deliver(self, route: Route):
+        workshop = self.workshop
+        target, waiting, claims = route.target, route.waiting, self._claims
+        while waiting:
+            card = waiting[0]
+            if not card.alive or card.verb is not None or claims.get(card) is not route:
+                # Expired, or taken by the player
+                waiting.popleft()
+                if claims.get(card) is route:
+                    del claims[card]
+                continue
+            if len(target.backlog) >= route.max_backlog:
+                return
+            titles = [placed.title for placed in target.active_cards]
+            titles.append(card.title)
+            if not workshop.recipe_book.completions(target.name, titles):
+                return
+            waiting.popleft()
+            del claims[card]
+            workshop.place_card(card, target)
+            route.delivered += 1
+
+    # Views
+
+    def in_transit(self, now: float) -> Iterator[Tuple[SimCard, Vec]]:
+        # Every card on a conveyor with where it is along it
+        claims = self._claims
+        for _, _, departure, card, route in self._transit:
+            if card.alive and claims.get(card) is route:
+                conveyor = route.conveyor
+                yield card, conveyor.point_at((now - departure) * conveyor.speed)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "routes": len(self.routes),
+            "waiting": sum(len(route.waiting) for route in self._waiting),
+            "in_transit": len(self._transit),
+            "delivered": sum(route.delivered for route in self.routes),
+            "ticks": self.ticks,
+        }
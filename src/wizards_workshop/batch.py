@@ -0,0 +1,195 @@
+import math
+import os
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .content import GENERATOR_LAYOUT, STARTER_CARDS, VERB_LAYOUT
+from .events import CardCreated, RecipeCompleted
+from .recipes import Recipe, RecipeBook
+from .simulation import Workshop
+
+
+@dataclass(frozen=True)
+class InstanceSpec:
+    # One headless workshop run; the seed jitters generator intervals
+    seed: int
+    duration: float = 600.0  # simulated seconds
+    tick_rate: int = 10
+    interval_scale: float = 1.0  # every generator interval times this
+    jitter: float = 0.2  # and times a seeded factor within +-jitter
+    slots: int = 0  # crafting slots at every station, 0 keeps the layout's
+    bot_interval: float = 1.0  # simulated seconds between the bot's moves
+    target: str = "Potion of Fire Resistance"
+
+
+@dataclass
+class InstanceResult:
+    index: int  # position in the batch's specs
+    spec: InstanceSpec
+    crafted: int
+    first_target: Optional[float]  # simulated time the target was first crafted
+    peak_cards: int
+    wall_time: float
+
+
+class CraftingBot:
+    """Plays a workshop the way a player heads for a target.
+
+    Each move it starts recipes whose inputs are lying loose on the table,
+    at stations with a free slot and an empty tray. Until the target is
+    made it only follows the target's crafting plan, each step as many
+    times as the plan needs, so nothing else eats the rare inputs; after
+    that it crafts anything it can, in book order.
+    """
+
+    def __init__(self, workshop: Workshop, target: str):
+        self.workshop = workshop
+        self.target = target
+        self.steps = [(step.recipe, step.count) for step in workshop.recipe_book.plan(target).steps]
+        self.started = Counter()  # plan steps started, by output
+        self.verbs = {verb.name: verb for verb in workshop.verbs}
+        self.planning = True
+
+    def act(self):
+        loose: Dict[str, list] = {}
+        for card in self.workshop.cards.values():
+            if card.verb is None:
+                loose.setdefault(card.title, []).append(card)
+        if self.planning and self.target in loose:
+            self.planning = False
+
+        if self.planning:
+            for recipe, count in self.steps:
+                if self.started[recipe.output] < count:
+                    self.started[recipe.output] += self.start(recipe, loose, count - self.started[recipe.output])
+        else:
+            for recipe in self.workshop.recipe_book.recipes:
+                self.start(recipe, loose)
+
+    def start(self, recipe: Recipe, loose: Dict[str, list], limit: int = 0) -> int:
+        # Sets placed for recipe (at most limit, if given)
+        verb = self.verbs.get(recipe.verb)
+        if verb is None:
+            return 0
+        needed = Counter(recipe.inputs)
+        placed = 0
+        while (verb.free_slots and not verb.active_cards and (not limit or placed < limit) and
+               all(len(loose.get(title, ())) >= count for title, count in needed.items())):
+            for title in recipe.inputs:
+                self.workshop.place_card(loose[title].pop(), verb)
+            placed += 1
+        return placed
+
+
+def build_instance(spec: InstanceSpec, recipe_book: Optional[RecipeBook] = None) -> Workshop:
+    workshop = Workshop(recipe_book=recipe_book, tick_rate=spec.tick_rate, seed=spec.seed)
+    for layout in VERB_LAYOUT:
+        workshop.add_verb(**{**layout, "slots": spec.slots or layout.get("slots", 1)})
+    for layout in GENERATOR_LAYOUT:
+        factor = spec.interval_scale * workshop.random.uniform(1 - spec.jitter, 1 + spec.jitter)
+        workshop.add_generator(**{**layout, "interval": layout["interval"] * factor})
+    for card in STARTER_CARDS:
+        workshop.create_card(**card)
+    return workshop
+
+
+def run_instance(spec: InstanceSpec, recipe_book: Optional[RecipeBook] = None, index: int = 0) -> InstanceResult:
+    start = time.perf_counter()
+    workshop = build_instance(spec, recipe_book)
+    bot = CraftingBot(workshop, spec.target)
+    cards = workshop.cards
+    peak_cards = len(cards)
+    first_target = None
+
+    def on_created(event):
+        nonlocal peak_cards
+        if len(cards) > peak_cards:
+            peak_cards = len(cards)
+
+    def on_completed(event):
+        nonlocal first_target
+        if first_target is None and event.recipe.output == spec.target:
+            first_target = workshop.time
+
+    workshop.events.subscribe(CardCreated, on_created)
+    workshop.events.subscribe(RecipeCompleted, on_completed)
+
+    ticks_per_move = max(1, round(spec.bot_interval * spec.tick_rate))
+    remaining = round(spec.duration * spec.tick_rate)
+    while remaining > 0:
+        bot.act()
+        ticks = min(ticks_per_move, remaining)
+        workshop.run(ticks)
+        remaining -= ticks
+
+    return InstanceResult(index, spec, workshop.crafted_count, first_target, peak_cards, time.perf_counter() - start)
+
+
+# Process pool workers: each builds its recipe book once, then runs shards of instances
+_worker_book: Optional[RecipeBook] = None
+
+
+def _start_worker(recipes: Optional[List[Recipe]]):
+    global _worker_book
+    _worker_book = RecipeBook(recipes) if recipes is not None else RecipeBook.shared()
+
+
+def _run_shard(shard):
+    return [run_instance(spec, _worker_book, index) for index, spec in shard]
+
+
+def run_batch(specs: Sequence[InstanceSpec], processes: Optional[int] = None,
+              recipes: Optional[Sequence[Recipe]] = None, shard_size: Optional[int] = None) -> Iterator[InstanceResult]:
+    """Results for every spec, yielded as their shard finishes (not in spec order).
+
+    The specs are cut into shards, at least a few per process and small
+    enough to stream steadily, and run across a process pool;
+    processes=1 runs them inline instead. Workers use the
+    given recipes, or the shared book with its content packs.
+    """
+    indexed = list(enumerate(specs))
+    if processes == 1:
+        book = RecipeBook(list(recipes)) if recipes is not None else RecipeBook.shared()
+        for index, spec in indexed:
+            yield run_instance(spec, book, index)
+        return
+
+    processes = processes or os.cpu_count() or 1
+    if shard_size is None:
+        shard_size = max(1, min(16, math.ceil(len(indexed) / (processes * 4))))
+    with ProcessPoolExecutor(max_workers=processes, initializer=_start_worker,
+                             initargs=(list(recipes) if recipes is not None else None,)) as pool:
+        shards = [indexed[i:i + shard_size] for i in range(0, len(indexed), shard_size)]
+        for future in as_completed([pool.submit(_run_shard, shard) for shard in shards]):
+            yield from future.result()
+
+
+def summarize(results: Iterable[InstanceResult],
+              by: Optional[Callable[[InstanceSpec], object]] = None) -> Dict[object, dict]:
+    # Aggregates per group of specs (by(spec)), or for everything under None
+    groups: Dict[object, List[InstanceResult]] = {}
+    for result in results:
+        groups.setdefault(by(result.spec) if by else None, []).append(result)
+
+    summary = {}
+    for key, group in groups.items():
+        crafted = [result.crafted for result in group]
+        reached = sorted(result.first_target for result in group if result.first_target is not None)
+        peaks = [result.peak_cards for result in group]
+        summary[key] = {
+            "instances": len(group),
+            "crafted_mean": statistics.fmean(crafted),
+            "crafted_min": min(crafted),
+            "crafted_max": max(crafted),
+            "target_reached": len(reached) / len(group),
+            "first_target_median": statistics.median(reached) if reached else None,
+            "first_target_p90": reached[min(len(reached) - 1, int(len(reached) * 0.9))] if reached else None,
+            "peak_cards_mean": statistics.fmean(peaks),
+            "peak_cards_max": max(peaks),
+            "wall_time": sum(result.wall_time for result in group),
+        }
+    return summary
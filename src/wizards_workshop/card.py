@@ -1,52 +1,75 @@
+import math
 from ursina import *
-import time
+from .content import card_colors_for
+
+
+# How many visible steps the lifetime bar shrinks in
+LIFETIME_BAR_STEPS = 28
+
+
+def content_color(name):
+    # Content packs name colours the Ursina way, or as #rrggbb
+    if name.startswith("#"):
+        return color.hex(name)
+    return getattr(color, name, color.white)
 
 
 class Card(Entity):
-    def __init__(self, position=(0, 0, 0), card_type="generic", title="Card", 
-                 lifetime=None, is_resource=False, **kwargs):
+    def __init__(self, state, workshop=None, renderer=None, pool=None, **kwargs):
+        # With a CardRenderer the card only keeps its collider; the renderer draws it
         super().__init__(
-            model="quad",
+            model=None if renderer else "quad",
             scale=(1.5, 2, 1),
-            position=position,
+            position=state.position,
             collider="box",
             **kwargs
         )
         
-        self.card_type = card_type
-        self.title = title
+        self.renderer = renderer
+        self.pool = pool
+        # Batched cards have no update, input or shader for Ursina to run each frame
+        self.ignore = renderer is not None
+        self.bind(state, workshop)
+        
+    def bind(self, state, workshop=None):
+        self.state = state
+        self.workshop = workshop
+        self.card_type = state.card_type
+        self.title = state.title
         self.is_held = False
-        self.original_y = position[1]
-        self.lifetime = lifetime
-        self.is_resource = is_resource
-        self.creation_time = time.time()
+        self.original_y = state.position[1]
+        self.lifetime = state.lifetime
+        self.is_resource = state.is_resource
         self.is_decaying = False
+        self.lifetime_remaining = self.lifetime_step()
         
         self.setup_appearance()
         
+    def reuse(self, state, workshop=None):
+        # A pooled view handed out again for another card
+        self.position = state.position
+        self.scale = (1.5, 2, 1)
+        self.rotation = (0, 0, 0)
+        if not self.renderer:
+            for child in list(self.children):
+                destroy(child)
+        self.bind(state, workshop)
+        
     def setup_appearance(self):
-        card_configs = {
-            "ingredient": {"color": color.light_gray, "border": color.dark_gray},
-            "knowledge": {"color": color.azure, "border": color.blue},
-            "tool": {"color": color.brown, "border": color.dark_gray},
-            "mana": {"color": color.cyan, "border": color.blue},
-            "spell": {"color": color.violet, "border": color.magenta},
-            "essence": {"color": color.orange, "border": color.red},
-            "potion": {"color": color.lime, "border": color.green},
-            "crystal": {"color": color.magenta, "border": color.violet},
-            "herb": {"color": color.green, "border": color.dark_gray},
-            "generic": {"color": color.white, "border": color.gray}
-        }
-        
-        config = card_configs.get(self.card_type, card_configs["generic"])
-        self.color = config["color"]
+        config = card_colors_for(self.card_type)
+        self.color = content_color(config["color"])
+        self.border_color = content_color(config["border"])
+        
+        if self.renderer:
+            self.renderer.add(self)
+            return
         
         # Add border
         self.border = Entity(
             parent=self,
             model="wireframe_quad",
             scale=(1.05, 1.05, 1),
-            color=config["border"],
+            color=self.border_color,
             position=(0, 0, -0.005)
         )
         
@@ -83,7 +106,7 @@ class Card(Entity):
             self.lifetime_bar = Entity(
                 parent=self,
                 model="cube",
-                scale=(1.4, 0.1, 1),
+                scale=(1.4 * self.lifetime_remaining, 0.1, 1),
                 color=color.red,
                 position=(0, -0.9, -0.01)
             )
@@ -92,38 +115,91 @@ class Card(Entity):
         self.is_held = True
         self.y = self.original_y + 0.5
         self.rotation_x = 0
+        self.sync_state()
+        self.redraw()
         
     def drop(self):
         self.is_held = False
         self.y = self.original_y
+        self.sync_state()
+        self.redraw()
         
     def drag_to(self, position):
         if self.is_held and position:
             self.position = Vec3(position.x, self.y, position.z)
+            self.sync_state()
+            self.redraw()
+            
+    def sync_state(self):
+        # Push a view-side move (player drag) into the simulation
+        if self.workshop and self.state.alive:
+            self.workshop.move_card(self.state, tuple(self.position))
             
-    def update(self):
-        # Update lifetime
-        if self.lifetime and not self.is_decaying:
-            elapsed = time.time() - self.creation_time
-            remaining = max(0, 1 - (elapsed / self.lifetime))
+    def follow_state(self):
+        # Pull a simulation-side move (placed on a verb) into the view
+        self.position = Vec3(*self.state.position)
+        self.original_y = self.state.position[1]
+        self.redraw()
+        
+    def redraw(self):
+        if self.renderer:
+            self.renderer.sync(self)
             
-            if hasattr(self, 'lifetime_bar'):
-                self.lifetime_bar.scale_x = 1.4 * remaining
-                
-            if remaining <= 0:
-                self.start_decay()
-                
-        # Animate resource symbol
-        if hasattr(self, 'resource_symbol'):
-            self.resource_symbol.rotation_y += 50 * time.dt
+    def lifetime_step(self):
+        # Remaining lifetime rounded up to the bar's next visible step
+        if not self.lifetime or not self.workshop:
+            return 1.0
+        return math.ceil(self.state.remaining(self.workshop.time) * LIFETIME_BAR_STEPS) / LIFETIME_BAR_STEPS
+        
+    def refresh_lifetime_bar(self):
+        # Called from the view layer's throttled pass over lifetime cards;
+        # the bar is only redrawn when it has shrunk by a visible step
+        if self.is_decaying or not self.state.alive:
+            return
+        remaining = self.lifetime_step()
+        if remaining == self.lifetime_remaining:
+            return
+        self.lifetime_remaining = remaining
+        if self.renderer:
+            self.renderer.sync(self)
+        else:
+            self.lifetime_bar.scale_x = 1.4 * remaining
             
     def start_decay(self):
         self.is_decaying = True
         self.animate_color(color.dark_gray, duration=0.5)
         self.animate_scale(0, duration=0.5, curve=curve.in_expo)
-        destroy(self, delay=0.5)
+        self.track_animation(0.5)
+        self.retire(delay=0.5)
+        
+    def consume(self):
+        self.is_decaying = True
+        self.animate_scale(0, duration=0.3, curve=curve.in_expo)
+        self.track_animation(0.3)
+        self.retire(delay=0.3)
         
     def spawn_animation(self):
         original_scale = self.scale
         self.scale = 0
-        self.animate_scale(original_scale, duration=0.3, curve=curve.out_back)
\ No newline at end of file
+        self.animate_scale(original_scale, duration=0.3, curve=curve.out_back)
+        self.track_animation(0.3)
+        
+    def track_animation(self, duration):
+        # Batched cards are redrawn by the renderer while an animation runs
+        if self.renderer:
+            self.renderer.track(self, duration)
+            
+    def retire(self, delay=0):
+        # Back to the pool for the next card, or gone for good without one
+        if self.pool is not None:
+            self.pool.release(self, delay=delay)
+        else:
+            destroy(self, delay=delay)
+            
+    def on_release(self):
+        if self.renderer:
+            self.renderer.remove(self)
+            
+    def on_destroy(self):
+        if self.renderer:
+            self.renderer.remove(self)
\ No newline at end of file
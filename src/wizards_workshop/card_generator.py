@@ -1,53 +1,33 @@
 from ursina import *
 import time
 import math
+from .card import content_color
+from .content import generator_config
+from .pool import effect_pool
 
 
 class CardGenerator(Entity):
-    def __init__(self, position=(0, 0, 0), card_type="mana", interval=5.0, **kwargs):
+    def __init__(self, state, **kwargs):
         super().__init__(
             model="sphere",
             scale=1,
-            position=position,
+            position=state.position,
             collider="box",
             **kwargs
         )
         
-        self.card_type = card_type
-        self.interval = interval
-        self.last_generation = time.time()
+        self.state = state
+        self.card_type = state.card_type
+        self.interval = state.interval
         self.game_manager = None
-        self.is_active = True
         
         self.setup_appearance()
         self.setup_particles()
         
     def setup_appearance(self):
-        generator_configs = {
-            "mana": {
-                "color": color.cyan,
-                "title": "Mana Spring",
-                "card_title": "Mana"
-            },
-            "herb": {
-                "color": color.green,
-                "title": "Herb Garden", 
-                "card_title": "Herb"
-            },
-            "crystal": {
-                "color": color.violet,
-                "title": "Crystal Formation",
-                "card_title": "Crystal Shard"
-            }
-        }
+        config = generator_config(self.card_type)
         
-        config = generator_configs.get(self.card_type, {
-            "color": color.white,
-            "title": "Generator",
-            "card_title": "Resource"
-        })
-        
-        self.color = config["color"]
+        self.color = content_color(config["color"])
         self.generator_title = config["title"]
         self.card_title = config["card_title"]
         
@@ -81,7 +61,7 @@ class CardGenerator(Entity):
             self.particles.append(particle)
             
     def update(self):
-        if not self.is_active or not self.game_manager:
+        if not self.state.is_active or not self.game_manager:
             return
             
         # Animate
@@ -94,54 +74,13 @@ class CardGenerator(Entity):
             particle.z = math.sin(angle) * 0.8
             particle.y = math.sin(time.time() * 3 + i) * 0.3
             
-        # Check if should generate
-        current_time = time.time()
-        if current_time - self.last_generation >= self.interval:
-            self.generate_card()
-            self.last_generation = current_time
-            
-    def generate_card(self):
-        if not self.game_manager:
-            return
-            
-        # Find empty spot near generator
-        offset_positions = [
-            Vec3(2, 0.1, 0),
-            Vec3(-2, 0.1, 0),
-            Vec3(0, 0.1, 2),
-            Vec3(0, 0.1, -2),
-            Vec3(1.5, 0.1, 1.5),
-            Vec3(-1.5, 0.1, 1.5),
-        ]
-        
-        spawn_pos = None
-        for offset in offset_positions:
-            test_pos = self.position + offset
-            if not self.game_manager.is_position_occupied(test_pos):
-                spawn_pos = test_pos
-                break
-                
-        if spawn_pos:
-            # Add lifetime for resource cards like mana
-            kwargs = {"animate_spawn": True}
-            if self.card_type == "mana":
-                kwargs["lifetime"] = 30.0
-                kwargs["is_resource"] = True
-                
-            self.game_manager.create_card(
-                position=spawn_pos,
-                card_type=self.card_type,
-                title=self.card_title,
-                **kwargs
-            )
-            
-            # Visual feedback
-            flash = Entity(
-                model="sphere",
-                scale=2,
-                color=self.color,
-                position=self.position,
-                alpha=0.5
-            )
-            flash.animate_scale(0, duration=0.5, curve=curve.out_expo)
-            destroy(flash, delay=0.5)
\ No newline at end of file
+    def show_generated(self):
+        # Visual feedback
+        flash = effect_pool.acquire(
+            scale=2,
+            color=self.color,
+            position=self.position,
+            alpha=0.5
+        )
+        flash.animate_scale(0, duration=0.5, curve=curve.out_expo)
+        effect_pool.release(flash, delay=0.5)
\ No newline at end of file
@@ -0,0 +1,295 @@
+from ursina import *
+from panda3d.core import (
+    DynamicTextFont,
+    Filename,
+    Geom,
+    GeomNode,
+    GeomTriangles,
+    GeomVertexData,
+    GeomVertexFormat,
+    GeomVertexWriter,
+    LVecBase4f,
+    TextureAttrib,
+    TransparencyAttrib,
+)
+
+
+class QuadBatch:
+    """Axis-aligned, vertex-coloured quads for many owners in one Geom.
+
+    Every owner gets a run of rows when it is first put. Moving or
+    recolouring an owner rewrites only its rows; removing one collapses its
+    quads to a point, and the batch is compacted once dead rows outnumber
+    live ones. A quad is (x0, y0, x1, y1, z, color, uv) in the owner's
+    local space, uv being (u0, v0, u1, v1) or None.
+    """
+
+    def __init__(self, name, parent, texture=None):
+        self.vdata = GeomVertexData(name, GeomVertexFormat.get_v3c4t2(), Geom.UH_dynamic)
+        self.triangles = GeomTriangles(Geom.UH_dynamic)
+        geom = Geom(self.vdata)
+        geom.add_primitive(self.triangles)
+        node = GeomNode(name)
+        node.add_geom(geom)
+
+        self.node_path = parent.attach_new_node(node)
+        self.node_path.set_two_sided(True)
+        if texture:
+            self.node_path.set_texture(texture)
+            self.node_path.set_transparency(TransparencyAttrib.M_alpha)
+
+        self.entries = {}  # owner -> [first_row, quads, offset, scale]
+        self.dead_rows = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def rows(self):
+        return self.vdata.get_num_rows()
+
+    def put(self, owner, quads, offset, scale=(1, 1)):
+        entry = self.entries.get(owner)
+        if entry and len(entry[1]) != len(quads):
+            self.remove(owner)
+            entry = None
+
+        if entry is None:
+            entry = [self._allocate(len(quads)), quads, offset, scale]
+            self.entries[owner] = entry
+        else:
+            entry[1:] = [quads, offset, scale]
+
+        self._write(*entry)
+
+    def remove(self, owner):
+        entry = self.entries.pop(owner, None)
+        if entry is None:
+            return
+
+        first, quads = entry[0], entry[1]
+        vertex = GeomVertexWriter(self.vdata, 'vertex')
+        vertex.set_row(first)
+        for _ in range(len(quads) * 4):
+            vertex.set_data3(0, 0, 0)
+
+        self.dead_rows += len(quads) * 4
+        if self.dead_rows > self.rows - self.dead_rows:
+            self.compact()
+
+    def compact(self):
+        self.vdata.set_num_rows(0)
+        self.triangles.clear_vertices()
+        self.dead_rows = 0
+        for entry in self.entries.values():
+            entry[0] = self._allocate(len(entry[1]))
+            self._write(*entry)
+
+    def _allocate(self, quad_count):
+        first = self.vdata.get_num_rows()
+        self.vdata.set_num_rows(first + quad_count * 4)
+        for i in range(quad_count):
+            row = first + i * 4
+            self.triangles.add_vertices(row, row + 1, row + 2)
+            self.triangles.add_vertices(row, row + 2, row + 3)
+        return first
+
+    def _write(self, first, quads, offset, scale):
+        vertex = GeomVertexWriter(self.vdata, 'vertex')
+        vertex_color = GeomVertexWriter(self.vdata, 'color')
+        texcoord = GeomVertexWriter(self.vdata, 'texcoord')
+        vertex.set_row(first)
+        vertex_color.set_row(first)
+        texcoord.set_row(first)
+
+        ox, oy, oz = offset
+        sx, sy = scale
+        for x0, y0, x1, y1, z, quad_color, uv in quads:
+            left, right = ox + x0 * sx, ox + x1 * sx
+            bottom, top = oy + y0 * sy, oy + y1 * sy
+            depth = oz + z
+            vertex.set_data3(left, bottom, depth)
+            vertex.set_data3(right, bottom, depth)
+            vertex.set_data3(right, top, depth)
+            vertex.set_data3(left, top, depth)
+            for _ in range(4):
+                vertex_color.set_data4(quad_color[0], quad_color[1], quad_color[2], quad_color[3])
+            u0, v0, u1, v1 = uv or (0, 0, 0, 0)
+            texcoord.set_data2(u0, v0)
+            texcoord.set_data2(u1, v0)
+            texcoord.set_data2(u1, v1)
+            texcoord.set_data2(u0, v1)
+
+
+class GlyphAtlas:
+    """Lays out text as quads cut from one dynamic font's glyph pages.
+
+    The font is loaded privately (not through the shared FontPool, which
+    Text clears on every font assignment), so glyph pages and their UVs
+    stay valid for as long as the renderer lives.
+    """
+
+    def __init__(self, font_name=None, page_size=1024, pixels_per_unit=48):
+        font_name = font_name or Text.default_font
+        folders = (application.fonts_folder, application.asset_folder, application.internal_fonts_folder)
+        path = next((Path(folder) / font_name for folder in folders if (Path(folder) / font_name).exists()), None)
+        if path is None:
+            raise FileNotFoundError(f"missing font: {font_name}")
+
+        self.font = DynamicTextFont(Filename.from_os_specific(str(path)))
+        self.font.set_page_size(page_size, page_size)
+        self.font.set_pixels_per_unit(pixels_per_unit)
+        self._layouts = {}
+
+    def layout(self, text, size, max_width):
+        # {texture: [(x0, y0, x1, y1, uv), ...]} centred on x = 0, baseline at y = 0
+        key = (text, size, max_width)
+        if key in self._layouts:
+            return self._layouts[key]
+
+        placed = []
+        pen = 0.0
+        for character in text:
+            glyph = self.font.get_glyph(ord(character))
+            if glyph is None:
+                continue
+            if glyph.has_quad():
+                dimensions, texcoords = LVecBase4f(), LVecBase4f()
+                glyph.get_quad(dimensions, texcoords)
+                texture = glyph.get_state().get_attrib(TextureAttrib).get_texture()
+                placed.append((texture, pen, dimensions, tuple(texcoords)))
+            pen += glyph.get_advance()
+
+        # Shrink long titles to fit rather than spill over the card edge
+        size = min(size, max_width / pen) if pen else size
+        start = -pen * size / 2
+
+        layout = {}
+        for texture, x, (left, bottom, right, top), uv in placed:
+            layout.setdefault(texture, []).append((
+                start + (x + left) * size, bottom * size,
+                start + (x + right) * size, top * size,
+                uv
+            ))
+        self._layouts[key] = layout
+        return layout
+
+
+class CardRenderer(Entity):
+    """Draws every card of a type in a couple of batched Geoms.
+
+    A card view registered here has no model or child entities of its own
+    (it keeps only its collider for picking). Its body, border, lifetime
+    bar, resource marker and text are quads in per-type batches: one
+    untextured batch per card type plus one per glyph page.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(name="card_renderer", **kwargs)
+        self.atlas = GlyphAtlas()
+        self.shape_batches = {}  # card_type -> QuadBatch
+        self.glyph_batches = {}  # (card_type, texture) -> QuadBatch
+        self.cards = set()
+        self.animating = {}  # card -> time the animation ends
+
+    def add(self, card):
+        self.cards.add(card)
+        self.sync(card)
+
+    def remove(self, card):
+        self.cards.discard(card)
+        self.animating.pop(card, None)
+        shapes = self.shape_batches.get(card.card_type)
+        if shapes:
+            shapes.remove(card)
+        for (card_type, _), batch in self.glyph_batches.items():
+            if card_type == card.card_type:
+                batch.remove(card)
+
+    def track(self, card, duration):
+        # Follow the card's own scale/colour animation for a while
+        self.animating[card] = time.time() + duration
+
+    def update(self):
+        if not self.animating:
+            return
+        now = time.time()
+        for card, until in list(self.animating.items()):
+            self.sync(card)
+            if now >= until:
+                del self.animating[card]
+
+    def sync(self, card):
+        if card not in self.cards:
+            return
+        offset = (card.x, card.y, card.z)
+        scale = (card.scale_x, card.scale_y)
+
+        shapes = self.shape_batches.get(card.card_type)
+        if shapes is None:
+            shapes = self.shape_batches[card.card_type] = QuadBatch(f"{card.card_type}_cards", self)
+        shapes.put(card, self.shape_quads(card), offset, scale)
+
+        for texture, quads in self.text_quads(card).items():
+            key = (card.card_type, texture)
+            batch = self.glyph_batches.get(key)
+            if batch is None:
+                batch = self.glyph_batches[key] = QuadBatch(f"{card.card_type}_text", self, texture=texture)
+            batch.put(card, quads, offset, scale)
+
+    def shape_quads(self, card):
+        body = card.color
+        border = card.border_color
+        edge = 0.015
+        quads = [
+            (-0.5, -0.5, 0.5, 0.5, 0, body, None),
+            # Border, 5% larger than the card like the old wireframe quad
+            (-0.525, 0.525 - edge, 0.525, 0.525, -0.005, border, None),
+            (-0.525, -0.525, 0.525, -0.525 + edge, -0.005, border, None),
+            (-0.525, -0.525, -0.525 + edge, 0.525, -0.005, border, None),
+            (0.525 - edge, -0.525, 0.525, 0.525, -0.005, border, None),
+        ]
+        if card.is_resource:
+            marker = body * 1.5
+            quads.append((0.4, 0.6, 0.6, 0.8, -0.02, marker, None))
+        if card.lifetime:
+            half = 0.7 * card.lifetime_remaining
+            quads.append((-half, -0.95, half, -0.85, -0.01, color.red, None))
+        return quads
+
+    def text_quads(self, card):
+        title_size = 0.175 if len(card.title) > 12 else 0.2
+        layouts = (
+            (self.atlas.layout(card.title, title_size, 0.95), 0.25, color.black),
+            (self.atlas.layout(card.card_type.capitalize(), 0.125, 0.95), -0.35, color.dark_gray),
+        )
+        quads = {}
+        for layout, baseline, text_color in layouts:
+            for texture, glyphs in layout.items():
+                quads.setdefault(texture, []).extend(
+                    (x0, baseline + y0, x1, baseline + y1, -0.01, text_color, uv)
+                    for x0, y0, x1, y1, uv in glyphs
+                )
+        return quads
+
+    def stats(self):
+        batches = [*self.shape_batches.values(), *self.glyph_batches.values()]
+        return {
+            "cards": len(self.cards),
+            "batches": len(batches),
+            "draw_calls": sum(1 for batch in batches if len(batch)),
+            "vertices": sum(batch.rows for batch in batches),
+        }
+
+
+def render_stats(root=None):
+    # Scene-graph size and an upper bound on draw calls (visible Geoms, before culling)
+    root = root or scene
+    geoms = 0
+    for geom_node in root.find_all_matches('**/+GeomNode'):
+        if not geom_node.is_hidden():
+            geoms += geom_node.node().get_num_geoms()
+    return {
+        "nodes": root.find_all_matches('**').get_num_paths(),
+        "draw_calls": geoms,
+    }
@@ -0,0 +1,87 @@
+# Game data shared by the headless simulation and the Ursina views.
+# Nothing in here may import ursina.
+
+import os
+
+from .content_pack import BASE_PACK, ContentPack, load_packs
+
+# Recipes, card types, card colours and generator configs come from content
+# packs: the base game, then any mod packs listed (os.pathsep separated)
+# in WIZARDS_WORKSHOP_PACKS.
+PACK_PATHS = [BASE_PACK, *filter(None, os.environ.get("WIZARDS_WORKSHOP_PACKS", "").split(os.pathsep))]
+_pack = None
+
+DEFAULT_GENERATOR = {"title": "Generator", "card_title": "Resource", "color": "white"}
+
+# Where a generator tries to place a new card, in order of preference
+SPAWN_OFFSETS = [
+    (2, 0.1, 0),
+    (-2, 0.1, 0),
+    (0, 0.1, 2),
+    (0, 0.1, -2),
+    (1.5, 0.1, 1.5),
+    (-1.5, 0.1, 1.5),
+]
+
+VERB_LAYOUT = [
+    # Forge - for crafting tools and items
+    {"name": "forge", "position": (5, 0, 2), "scale": (2, 1, 2), "slots": 2},
+    # Study table - for learning knowledge
+    {"name": "study", "position": (-5, 0, 2), "scale": (2.5, 0.5, 1.5), "slots": 1},
+    # Ritual circle - for advanced magic
+    {"name": "ritual", "position": (0, 0, 5), "scale": (3, 0.2, 3), "slots": 1},
+    # Alchemy station - for potions
+    {"name": "alchemy", "position": (0, 0, -5), "scale": (1.5, 1.5, 1.5), "slots": 3},
+]
+
+GENERATOR_LAYOUT = [
+    # Mana Spring - generates mana every 5 seconds
+    {"card_type": "mana", "position": (-8, 0.5, 0), "interval": 5.0},
+    # Herb Garden - generates herbs every 10 seconds
+    {"card_type": "herb", "position": (8, 0.5, 0), "interval": 10.0},
+    # Crystal Formation - generates crystals rarely
+    {"card_type": "crystal", "position": (0, 0.5, 8), "interval": 20.0},
+]
+
+STARTER_CARDS = [
+    # Starting resources
+    {"position": (-4, 0.1, -2), "card_type": "ingredient", "title": "Iron Ore"},
+    {"position": (-2, 0.1, -2), "card_type": "ingredient", "title": "Coal"},
+    {"position": (0, 0.1, -2), "card_type": "ingredient", "title": "Wood"},
+
+    # Starting knowledge
+    {"position": (2, 0.1, -2), "card_type": "knowledge", "title": "Mysterious Tome"},
+
+    # Some initial mana
+    {"position": (4, 0.1, -2), "card_type": "mana", "title": "Mana", "is_resource": True, "lifetime": 30},
+    {"position": (5, 0.1, -2), "card_type": "mana", "title": "Mana", "is_resource": True, "lifetime": 30},
+]
+
+
+def content_pack() -> ContentPack:
+    # Loaded (and its cache written) on first use, not when this is imported
+    global _pack
+    if _pack is None:
+        _pack = load_packs(PACK_PATHS)
+    return _pack
+
+
+def card_type_for(title):
+    return content_pack().card_types.get(title, "generic")
+
+
+def card_colors_for(card_type):
+    # Colour names for a card type's face and border
+    colors = content_pack().card_colors
+    return colors.get(card_type) or colors.get("generic") or {"color": "white", "border": "gray"}
+
+
+def generator_config(card_type):
+    return content_pack().generators.get(card_type, DEFAULT_GENERATOR)
+
+
+def starting_titles():
+    # Everything a player gets without crafting: starter cards and generator output
+    titles = [card["title"] for card in STARTER_CARDS]
+    titles.extend(config["card_title"] for config in content_pack().generators.values())
+    return list(dict.fromkeys(titles))
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import tomllib
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from .gcutil import gc_paused
+from .recipes import Recipe
+
+
+# Packs are TOML or JSON with these tables (all optional):
+#   card_types  title -> card type
+#   card_colors card type -> {color, border}, Ursina colour names or #rrggbb
+#   generators  generator type -> {title, card_title, color, lifetime, is_resource}
+#   recipes     list of {verb, inputs, output, time, description}
+# Later packs override card types, colours and generators, and add recipes.
+#
+# The merged result is compiled once into a binary cache named after a hash
+# of the pack files, and memory-mapped from there on later loads:
+#   header | string table | card types | colours | generators | recipe columns
+BASE_PACK = Path(__file__).parent / "data" / "base.toml"
+CACHE_MAGIC = b"WWCP"
+CACHE_VERSION = 2
+
+_HEADER = struct.Struct("<4sH")
+_COUNT = struct.Struct("<I")
+_GENERATOR = struct.Struct("<IIIIdB")  # type, title, card title, colour, lifetime (NaN for none), is resource
+_SWAP = sys.byteorder == "big"
+
+PathLike = Union[str, Path]
+
+
+class ContentPackError(ValueError):
+    pass
+
+
+@dataclass
+class ContentPack:
+    card_types: Dict[str, str] = field(default_factory=dict)
+    card_colors: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    generators: Dict[str, dict] = field(default_factory=dict)
+    recipes: List[Recipe] = field(default_factory=list)
+
+
+def default_cache_dir() -> Path:
+    folder = os.environ.get("WIZARDS_WORKSHOP_CACHE")
+    if folder:
+        return Path(folder)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "wizards_workshop"
+
+
+def load_packs(paths: Iterable[PathLike], cache_dir: Optional[PathLike] = None) -> ContentPack:
+    """Merged content of the packs, from the compiled cache when it is up to date.
+
+    Without a usable cache directory the packs are simply parsed each time.
+    """
+    sources = [(Path(path), Path(path).read_bytes()) for path in paths]
+    digest = hashlib.sha256(CACHE_VERSION.to_bytes(2, "little"))
+    for path, data in sources:
+        digest.update(path.suffix.encode() + b"\0" + len(data).to_bytes(8, "little") + data)
+    cache = Path(cache_dir if cache_dir is not None else default_cache_dir()) / f"{digest.hexdigest()[:32]}.wwcp"
+
+    if cache.exists():
+        try:
+            return read_cache(cache)
+        except (OSError, ValueError):
+            pass  # unreadable or stale; rebuilt below
+
+    pack = ContentPack()
+    for path, data in sources:
+        merge(pack, parse(path, data))
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        temporary = cache.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(compile_pack(pack))
+        os.replace(temporary, cache)
+    except OSError:
+        pass
+    return pack
+
+
+# Parsing
+
+def parse(path: Path, data: bytes) -> dict:
+    try:
+        if path.suffix == ".json":
+            return json.loads(data)
+        return tomllib.loads(data.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as error:
+        raise ContentPackError(f"{path}: {error}") from error
+
+
+def merge(pack: ContentPack, content: dict):
+    try:
+        pack.card_types.update({str(title): str(card_type) for title, card_type in content.get("card_types", {}).items()})
+        for card_type, colors in content.get("card_colors", {}).items():
+            pack.card_colors[card_type] = {"color": str(colors["color"]), "border": str(colors["border"])}
+        for generator_type, config in content.get("generators", {}).items():
+            generator = {"title": str(config["title"]), "card_title": str(config["card_title"]),
+                         "color": str(config.get("color", "white"))}
+            if config.get("lifetime"):
+                generator["lifetime"] = float(config["lifetime"])
+            if config.get("is_resource"):
+                generator["is_resource"] = True
+            pack.generators[generator_type] = generator
+        intern = sys.intern
+        for entry in content.get("recipes", []):
+            pack.recipes.append(Recipe(
+                verb=intern(str(entry["verb"])),
+                inputs=tuple(intern(str(title)) for title in entry["inputs"]),
+                output=intern(str(entry["output"])),
+                time=float(entry.get("time", 3.0)),
+                description=str(entry.get("description", "")),
+            ))
+    except (KeyError, TypeError, AttributeError) as error:
+        raise ContentPackError(f"malformed content pack entry: {error!r}") from error
+
+
+# Compiled cache
+
+class _Strings:
+    def __init__(self):
+        self.values: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def __call__(self, value: str) -> int:
+        index = self.index.get(value)
+        if index is None:
+            index = self.index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def _put_array(chunks: List[bytes], values: array):
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    chunks.append(_COUNT.pack(len(values)))
+    chunks.append(values.tobytes())
+
+
+def compile_pack(pack: ContentPack) -> bytes:
+    intern = _Strings()
+    recipes = pack.recipes
+    sections = [
+        array("I", [intern(value) for pair in pack.card_types.items() for value in pair]),
+        array("I", [intern(value) for card_type, colors in pack.card_colors.items()
+                    for value in (card_type, colors["color"], colors["border"])]),
+        array("I", [intern(recipe.verb) for recipe in recipes]),
+        array("I", [intern(recipe.output) for recipe in recipes]),
+        array("d", [recipe.time for recipe in recipes]),
+        array("I", [intern(recipe.description) for recipe in recipes]),
+        array("I", [len(recipe.inputs) for recipe in recipes]),
+        array("I", [intern(title) for recipe in recipes for title in recipe.inputs]),
+    ]
+    generators = [
+        _GENERATOR.pack(intern(generator_type), intern(config["title"]), intern(config["card_title"]),
+                        intern(config["color"]), config.get("lifetime") or math.nan, config.get("is_resource", False))
+        for generator_type, config in pack.generators.items()
+    ]
+
+    # Strings go in as one NUL-separated block, split again in a single call on load
+    if any("\0" in value for value in intern.values):
+        raise ContentPackError("content text may not contain NUL characters")
+    table = "\0".join(intern.values).encode("utf-8")
+    chunks = [_HEADER.pack(CACHE_MAGIC, CACHE_VERSION), _COUNT.pack(len(intern.values)), _COUNT.pack(len(table)), table]
+    chunks.append(_COUNT.pack(len(generators)))
+    chunks.extend(generators)
+    for section in sections:
+        _put_array(chunks, section)
+    return b"".join(chunks)
+
+
+def read_cache(path: PathLike) -> ContentPack:
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            with gc_paused():
+                return _decode(view)
+        except (struct.error, IndexError, UnicodeDecodeError) as error:
+            raise ContentPackError(f"corrupt content cache {path}: {error}") from error
+        finally:
+            view.release()
+
+
+def _decode(view: memoryview) -> ContentPack:
+    offset = 0
+
+    def unpack(layout):
+        nonlocal offset
+        values = layout.unpack_from(view, offset)
+        offset += layout.size
+        return values
+
+    def read_array(typecode):
+        nonlocal offset
+        count, = unpack(_COUNT)
+        values = array(typecode)
+        end = offset + count * values.itemsize
+        if end > len(view):
+            raise ContentPackError("content cache is truncated")
+        values.frombytes(view[offset:end])
+        offset = end
+        if _SWAP:
+            values.byteswap()
+        return values
+
+    magic, version = unpack(_HEADER)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        raise ContentPackError("not a current content cache")
+
+    string_count, = unpack(_COUNT)
+    table_size, = unpack(_COUNT)
+    strings = str(view[offset:offset + table_size], "utf-8").split("\0") if string_count else []
+    strings = list(map(sys.intern, strings))
+    offset += table_size
+    if len(strings) != string_count:
+        raise ContentPackError("content cache string table is damaged")
+
+    pack = ContentPack()
+    generator_count, = unpack(_COUNT)
+    for _ in range(generator_count):
+        generator_type, title, card_title, generator_color, lifetime, is_resource = unpack(_GENERATOR)
+        config = {"title": strings[title], "card_title": strings[card_title], "color": strings[generator_color]}
+        if not math.isnan(lifetime):
+            config["lifetime"] = lifetime
+        if is_resource:
+            config["is_resource"] = True
+        pack.generators[strings[generator_type]] = config
+
+    card_types = iter(read_array("I"))
+    pack.card_types = {strings[title]: strings[card_type] for title, card_type in zip(card_types, card_types)}
+    colors = iter(read_array("I"))
+    pack.card_colors = {strings[card_type]: {"color": strings[color], "border": strings[border]}
+                        for card_type, color, border in zip(colors, colors, colors)}
+
+    verbs, outputs, times, descriptions, input_counts, inputs = (
+        read_array(typecode) for typecode in ("I", "I", "d", "I", "I", "I")
+    )
+    titles = tuple(strings[index] for index in inputs)
+    start = 0
+    recipes = pack.recipes
+    for verb, output, time, description, count in zip(verbs, outputs, times, descriptions, input_counts):
+        recipes.append(Recipe(strings[verb], titles[start:start + count], strings[output], time, strings[description]))
+        start += count
+    return pack
@@ -0,0 +1,33 @@
+from ursina import *
+import math
+
+
+class Conveyor3D(Entity):
+    # A belt drawn along an automation.Conveyor's path. The cards riding it
+    # are moved by GameManager.update_automation, all belts in one pass.
+    def __init__(self, conveyor, **kwargs):
+        super().__init__(**kwargs)
+        self.conveyor = conveyor
+
+        for a, b in zip(conveyor.path, conveyor.path[1:]):
+            length = math.dist((a[0], a[2]), (b[0], b[2]))
+            if not length:
+                continue
+            Entity(
+                parent=self,
+                model="cube",
+                color=color.dark_gray,
+                position=((a[0] + b[0]) / 2, (a[1] + b[1]) / 2 - 0.05, (a[2] + b[2]) / 2),
+                scale=(0.7, 0.05, length),
+                rotation_y=math.degrees(math.atan2(b[0] - a[0], b[2] - a[2]))
+            )
+
+        # Posts at the ends
+        for point, post_color in ((conveyor.path[0], color.light_gray), (conveyor.path[-1], color.lime)):
+            Entity(
+                parent=self,
+                model="cube",
+                color=post_color,
+                position=point,
+                scale=(0.25, 0.4, 0.25)
+            )
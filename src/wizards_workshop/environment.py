@@ -2,6 +2,8 @@ from ursina import *
 import time
 import math
 
+from .static_mesh import StaticMesh
+
 
 class Environment(Entity):
     def __init__(self):
@@ -42,28 +44,33 @@ class Environment(Entity):
         self.ambient = AmbientLight(color=color.white, intensity=0.3)
         
     def setup_ground(self):
+        # Plane and grass patches are baked into one mesh in the plane's space
+        grass = StaticMesh()
+        
         # Create grass texture
         self.grass_plane = Entity(
-            model="plane",
             scale=(50, 1, 50),
-            position=(0, -0.05, 0),
-            color=color.rgb(34, 139, 34)  # Forest green
+            position=(0, -0.05, 0)
         )
+        grass.add("plane", color=color.rgb(34, 139, 34))  # Forest green
         
         # Add grass pattern
         for i in range(-20, 21, 4):
             for j in range(-20, 21, 4):
-                grass_patch = Entity(
-                    model="cube",
+                grass.add(
+                    "cube",
                     scale=(0.1, 0.2, 0.1),
                     position=(i + random.uniform(-1, 1), 0, j + random.uniform(-1, 1)),
-                    color=color.rgb(random.randint(30, 60), random.randint(120, 160), random.randint(30, 60)),
-                    parent=self.grass_plane
+                    color=color.rgb(random.randint(30, 60), random.randint(120, 160), random.randint(30, 60))
                 )
                 
-    def update_time_cycle(self):
-        # Update time (0-24 hours)
-        self.current_time += time.dt * self.time_speed * (24 / self.day_length)
+        grass.attach(self.grass_plane)
+        
+    def update_time_cycle(self, dt=None):
+        # Update time (0-24 hours); dt defaults to the frame time
+        if dt is None:
+            dt = time.dt
+        self.current_time += dt * self.time_speed * (24 / self.day_length)
         if self.current_time >= 24:
             self.current_time -= 24
             
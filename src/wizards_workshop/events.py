@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .automation import Route
+    from .recipes import Recipe
+    from .simulation import SimCard, SimGenerator, SimVerb
+
+
+# Workshop events
+
+@dataclass(slots=True)
+class CardCreated:
+    card: "SimCard"
+
+
+@dataclass(slots=True)
+class CardSpawned:
+    # After the CardCreated of a card made by a generator
+    generator: "SimGenerator"
+    card: "SimCard"
+
+
+@dataclass(slots=True)
+class CardDropped:
+    # Placed on a verb, and moved to its slot there
+    card: "SimCard"
+    verb: "SimVerb"
+
+
+@dataclass(slots=True)
+class CardExpired:
+    card: "SimCard"
+
+
+@dataclass(slots=True)
+class CardConsumed:
+    card: "SimCard"
+
+
+@dataclass(slots=True)
+class RecipeStarted:
+    verb: "SimVerb"
+    recipe: "Recipe"
+
+
+@dataclass(slots=True)
+class RecipeQueued:
+    # Matched while every crafting slot was busy; RecipeStarted follows when one frees up
+    verb: "SimVerb"
+    recipe: "Recipe"
+
+
+@dataclass(slots=True)
+class RecipeRejected:
+    # Nothing can be completed from the cards on the verb
+    verb: "SimVerb"
+
+
+@dataclass(slots=True)
+class RecipeCompleted:
+    verb: "SimVerb"
+    recipe: "Recipe"
+    output: "SimCard"
+
+
+@dataclass(slots=True)
+class RouteAdded:
+    # From automation.Automation; the view builds the route's conveyor, if any
+    route: "Route"
+
+
+@dataclass(slots=True)
+class RouteRemoved:
+    route: "Route"
+
+
+class EventBus:
+    """Dispatches events by exact type.
+
+    A subscriber gets each event as it is published, or with batched=True
+    a list of every event of that type since the last flush() (once per
+    frame in the game), which suits view effects that would otherwise
+    fire dozens of times a frame at high speed. Dispatch time is recorded
+    per event type; see latency().
+    """
+
+    def __init__(self):
+        self._handlers: Dict[type, List[Callable]] = {}
+        self._batch_handlers: Dict[type, List[Callable]] = {}
+        self._pending: Dict[type, list] = {}
+        self._stats: Dict[type, List[float]] = {}  # type -> [events, dispatches, seconds, worst]
+
+    def subscribe(self, event_type: type, handler: Callable, batched: bool = False) -> Callable:
+        table = self._batch_handlers if batched else self._handlers
+        table.setdefault(event_type, []).append(handler)
+        return handler
+
+    def unsubscribe(self, event_type: type, handler: Callable, batched: bool = False):
+        table = self._batch_handlers if batched else self._handlers
+        handlers = table.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            table.pop(event_type, None)
+
+    def publish(self, event):
+        event_type = type(event)
+        handlers = self._handlers.get(event_type)
+        if handlers:
+            start = perf_counter()
+            for handler in handlers:
+                handler(event)
+            self._record(event_type, 1, perf_counter() - start)
+        if event_type in self._batch_handlers:
+            pending = self._pending.get(event_type)
+            if pending is None:
+                pending = self._pending[event_type] = []
+            pending.append(event)
+
+    def flush(self):
+        # Events published by batch handlers themselves wait for the next flush
+        pending, self._pending = self._pending, {}
+        for event_type, events in pending.items():
+            start = perf_counter()
+            for handler in self._batch_handlers.get(event_type, ()):
+                handler(events)
+            self._record(event_type, len(events), perf_counter() - start)
+
+    def _record(self, event_type: type, events: int, seconds: float):
+        stats = self._stats.get(event_type)
+        if stats is None:
+            stats = self._stats[event_type] = [0, 0, 0.0, 0.0]
+        stats[0] += events
+        stats[1] += 1
+        stats[2] += seconds
+        if seconds > stats[3]:
+            stats[3] = seconds
+
+    def latency(self, event_type: Optional[type] = None) -> Dict[str, dict]:
+        # Per event type: events, dispatches (a batch counts once), mean and worst dispatch time
+        report = {}
+        for kind, (events, dispatches, seconds, worst) in self._stats.items():
+            if event_type is None or kind is event_type:
+                report[kind.__name__] = {
+                    "events": int(events),
+                    "dispatches": int(dispatches),
+                    "mean_us": seconds / dispatches * 1e6,
+                    "max_us": worst * 1e6,
+                    "per_event_us": seconds / events * 1e6,
+                }
+        return report
+
+    def reset_latency(self):
+        self._stats.clear()
@@ -1,24 +1,77 @@
 from ursina import *
+from collections import deque
+from .automation import Automation
 from .card import Card
+from .card_renderer import CardRenderer
+from .pool import EntityPool
 from .verb import Verb3D
 from .playmat import Playmat
 from .card_generator import CardGenerator
 from .recipes import RecipeBook
 from .recipe_display import RecipeDisplay
+from .replay import ReplayRecorder
 from .environment import Environment
+from .conveyor import Conveyor3D
+from .events import (
+    CardConsumed,
+    CardCreated,
+    CardDropped,
+    CardExpired,
+    CardSpawned,
+    EventBus,
+    RecipeCompleted,
+    RecipeQueued,
+    RecipeRejected,
+    RecipeStarted,
+    RouteAdded,
+    RouteRemoved,
+)
+from .profiler import FrameProfiler
+from .profiler_overlay import ProfilerOverlay
+from .scheduler import Scheduler
+from .simulation import Workshop
+from .snapshot import SnapshotError, load_snapshot, save_snapshot
 
 
 class GameManager(Entity):
-    def __init__(self):
+    speed_steps = [1, 10, 100]
+    snapshot_path = "workshop.snapshot"
+    replay_path = "session.replay"
+    views_per_frame = 500  # card views rebuilt per frame after loading
+    lifetime_bar_interval = 0.1  # seconds between passes over the lifetime bars
+    
+    def __init__(self, seed=None, batch_cards=True):
         super().__init__()
-        self.cards = []
+        self.batch_cards = batch_cards
+        self.card_renderer = None
+        # Views of expired and consumed cards are recycled for new ones
+        self.card_pool = EntityPool(
+            factory=lambda state: Card(state, workshop=self.workshop, renderer=self.card_renderer, pool=self.card_pool),
+            reset=lambda card, state: card.reuse(state, workshop=self.workshop),
+            capacity=256
+        )
+        self.recipe_book = RecipeBook.shared()
+        self.scheduler = Scheduler(tick_rate=60, seed=seed)
+        self.workshop = Workshop(recipe_book=self.recipe_book, scheduler=self.scheduler)
+        self.cards = {}  # card id -> Card view
+        self.lifetime_cards = set()  # views with a lifetime bar to shrink
+        self.lifetime_bar_clock = 0.0
+        self.pending_views = deque()  # loaded card states without a view yet
         self.verbs = []
         self.generators = []
+        self.verb_views = {}
+        self.generator_views = {}
         self.playmat = None
         self.held_card = None
-        self.recipe_book = RecipeBook()
+        self.suggested = None  # (verb, held title, cards on it) the station hints are for
+        self.automation = None  # see automate()
+        self.recorder = None  # F6 records the session to replay_path
+        self.conveyor_views = {}
         self.wizard_level = 1
         self.mana_count = 0
+        self.mana_text = None
+        self.shown_minute = None
+        self.shown_phase = None
         self.environment = None
         self.time_ui = None
         
@@ -36,10 +89,14 @@ class GameManager(Entity):
         camera.rotation_x = 50
         
         self.playmat = Playmat()
+        if self.batch_cards:
+            self.card_renderer = CardRenderer()
         
+        self.workshop.populate_default()
         self.create_initial_verbs()
         self.create_initial_cards()
         self.create_generators()
+        self.bind_workshop()
         
         self.setup_controls()
         self.setup_ui()
@@ -49,132 +106,255 @@ class GameManager(Entity):
         
         # Setup time UI
         self.setup_time_ui()
+        self.setup_profiler()
         
-    def create_initial_verbs(self):
-        # Forge - for crafting tools and items
-        forge = Verb3D(
-            position=(5, 0, 2),
-            name="forge",
-            model="cube",
-            color=color.orange,
-            scale=(2, 1, 2),
-            game_manager=self
-        )
-        self.verbs.append(forge)
-        
-        # Study table - for learning knowledge
-        study_table = Verb3D(
-            position=(-5, 0, 2),
-            name="study",
-            model="cube", 
-            color=color.brown,
-            scale=(2.5, 0.5, 1.5),
-            game_manager=self
-        )
-        self.verbs.append(study_table)
-        
-        # Ritual circle - for advanced magic
-        ritual = Verb3D(
-            position=(0, 0, 5),
-            name="ritual",
-            model="cube",
-            color=color.violet,
-            scale=(3, 0.2, 3),
-            game_manager=self
-        )
-        self.verbs.append(ritual)
+    def setup_profiler(self):
+        # Timed only while the overlay is on (F3)
+        self.profiler = FrameProfiler()
+        for owner, attribute, section in [
+            (Scheduler, "advance", "simulation"),
+            (GameManager, "build_pending_views", "card views"),
+            (GameManager, "update_suggestions", "suggestions"),
+            (GameManager, "update_ui", "ui"),
+            (GameManager, "update_automation", "conveyors"),
+            (GameManager, "update_lifetime_bars", "lifetime bars"),
+            (Automation, "tick", "automation"),
+            (EventBus, "flush", "batched events"),
+            (Card, "redraw", "card redraws"),
+            (CardRenderer, "update", "card batches"),
+            (Verb3D, "update", "verbs"),
+            (CardGenerator, "update", "generators"),
+            (Playmat, "update", "playmat"),
+            (Environment, "update_time_cycle", "environment"),
+            (Sequence, "update", "invoke/animate"),
+        ]:
+            self.profiler.watch(owner, attribute, section)
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
         
-        # Alchemy station - for potions
-        alchemy = Verb3D(
-            position=(0, 0, -5),
-            name="alchemy",
-            model="sphere",
-            color=color.green,
-            scale=(1.5, 1.5, 1.5),
-            game_manager=self
-        )
-        self.verbs.append(alchemy)
+    def create_initial_verbs(self):
+        verb_looks = {
+            "forge": {"model": "cube", "color": color.orange},
+            "study": {"model": "cube", "color": color.brown},
+            "ritual": {"model": "cube", "color": color.violet},
+            "alchemy": {"model": "sphere", "color": color.green},
+        }
         
+        for state in self.workshop.verbs:
+            look = verb_looks.get(state.name, {"model": "cube", "color": color.gray})
+            verb = Verb3D(state, game_manager=self, **look)
+            self.verbs.append(verb)
+            self.verb_views[state] = verb
+            
     def create_initial_cards(self):
-        starter_cards = [
-            # Starting resources
-            Card(position=(-4, 0.1, -2), card_type="ingredient", title="Iron Ore"),
-            Card(position=(-2, 0.1, -2), card_type="ingredient", title="Coal"),
-            Card(position=(0, 0.1, -2), card_type="ingredient", title="Wood"),
+        for state in self.workshop.cards.values():
+            self.add_card_view(state)
             
-            # Starting knowledge
-            Card(position=(2, 0.1, -2), card_type="knowledge", title="Mysterious Tome"),
+    def create_generators(self):
+        for state in self.workshop.generators:
+            generator = CardGenerator(state)
+            generator.game_manager = self
+            self.generators.append(generator)
+            self.generator_views[state] = generator
             
-            # Some initial mana
-            Card(position=(4, 0.1, -2), card_type="mana", title="Mana", is_resource=True, lifetime=30),
-            Card(position=(5, 0.1, -2), card_type="mana", title="Mana", is_resource=True, lifetime=30),
-        ]
-        self.cards.extend(starter_cards)
+    def bind_workshop(self):
+        # Everything created from here on animates in
+        events = self.workshop.events
+        events.subscribe(CardCreated, lambda event: self.add_card_view(event.card, animate_spawn=True))
+        events.subscribe(CardDropped, lambda event: self.view_for(event.card).follow_state())
+        events.subscribe(CardExpired, lambda event: self.remove_card_view(event.card, "expired"))
+        events.subscribe(CardConsumed, lambda event: self.remove_card_view(event.card, "consumed"))
+        events.subscribe(RecipeQueued, lambda event: self.verb_views[event.verb].update_queue_text())
+        events.subscribe(RecipeStarted, lambda event: self.verb_views[event.verb].start_processing(event.recipe))
+        events.subscribe(RecipeCompleted, lambda event: self.verb_views[event.verb].complete_processing(event.recipe))
+        # Flashes only, so once per generator or station a frame however fast the game runs
+        events.subscribe(CardSpawned, self.show_spawns, batched=True)
+        events.subscribe(RecipeRejected, self.show_rejections, batched=True)
+        events.subscribe(RouteAdded, self.show_route)
+        events.subscribe(RouteRemoved, self.hide_route)
+        self.workshop.inventory.watch("Mana", self.on_mana_changed)
         
-    def create_generators(self):
-        # Mana Spring - generates mana every 5 seconds
-        mana_spring = CardGenerator(
-            position=(-8, 0.5, 0),
-            card_type="mana",
-            interval=5.0,
-            color=color.cyan
-        )
-        mana_spring.game_manager = self
-        self.generators.append(mana_spring)
-        
-        # Herb Garden - generates herbs every 10 seconds
-        herb_garden = CardGenerator(
-            position=(8, 0.5, 0),
-            card_type="herb",
-            interval=10.0,
-            color=color.green
-        )
-        herb_garden.game_manager = self
-        self.generators.append(herb_garden)
-        
-        # Crystal Formation - generates crystals rarely
-        crystal_formation = CardGenerator(
-            position=(0, 0.5, 8),
-            card_type="crystal",
-            interval=20.0,
-            color=color.violet
-        )
-        crystal_formation.game_manager = self
-        self.generators.append(crystal_formation)
+    def show_spawns(self, events):
+        for generator in {event.generator: None for event in events}:
+            self.generator_views[generator].show_generated()
+            
+    def show_rejections(self, events):
+        for verb in {event.verb: None for event in events}:
+            self.verb_views[verb].show_rejected()
         
     def setup_controls(self):
         def update():
+            ticks = self.scheduler.advance(time.dt)
+            self.build_pending_views()
+            
             if mouse.left:
                 self.handle_mouse_click()
             elif self.held_card:
                 self.held_card.drag_to(mouse.world_point)
+                if self.recorder:
+                    self.recorder.move(self.held_card.state)
+            self.update_suggestions()
+            self.update_automation()
+            self.workshop.events.flush()
+            self.update_lifetime_bars(time.dt)
                 
             # Update UI and environment
             self.update_ui()
             
             # Update environment
             if self.environment:
-                self.environment.update_time_cycle()
+                self.environment.update_time_cycle(ticks * self.scheduler.dt)
                 
         Entity(update=update)
         
         # Keyboard controls
         def input(key):
+            if self.recipe_display.searching:
+                if key == 'escape':
+                    self.recipe_display.search_field.active = False
+                return
             if key == 'r':
                 self.recipe_display.toggle_visibility()
+            elif key == 'p':
+                self.scheduler.paused = not self.scheduler.paused
+            elif key == 'f':
+                self.cycle_speed()
+            elif key == 'f5':
+                self.save_game()
+            elif key == 'f9':
+                self.load_game()
+            elif key == 'f6':
+                self.toggle_recording()
             elif key == 'escape':
                 if self.held_card:
                     self.held_card.drop()
+                    if self.recorder:
+                        self.recorder.drop(self.held_card.state)
                     self.held_card = None
                     
         self.input = input
         
+    def cycle_speed(self):
+        steps = self.speed_steps
+        current = steps.index(self.scheduler.speed) if self.scheduler.speed in steps else -1
+        self.scheduler.speed = steps[(current + 1) % len(steps)]
+        
+    def toggle_recording(self, path=None):
+        if self.recorder is None:
+            self.recorder = ReplayRecorder(self.workshop, self.environment.current_time)
+            print("Recording session (F6 to stop)")
+            return
+        path = path or self.replay_path
+        size = self.recorder.save(path)
+        print(f"Recorded {self.recorder.entries} entries over {self.workshop.tick - self.recorder.start_tick} ticks "
+              f"to {path} ({size} bytes)")
+        self.recorder = None
+        
+    def save_game(self, path=None):
+        size = save_snapshot(path or self.snapshot_path, self.workshop, self.environment.current_time)
+        print(f"Saved {len(self.workshop.cards)} cards ({size} bytes)")
+        
+    def load_game(self, path=None):
+        try:
+            snapshot = load_snapshot(path or self.snapshot_path, recipe_book=self.recipe_book)
+        except (OSError, SnapshotError) as error:
+            print(f"Could not load: {error}")
+            return
+            
+        if self.recorder:
+            # A recording covers one workshop from its start
+            self.toggle_recording()
+        if self.automation:
+            # Its routes point at the old workshop's stations and generators
+            self.automation.close()
+            self.automation = None
+        for card in self.cards.values():
+            self.card_pool.release(card)
+        for view in [*self.verbs, *self.generators]:
+            destroy(view)
+        self.cards.clear()
+        self.lifetime_cards.clear()
+        self.pending_views.clear()
+        self.verbs, self.generators = [], []
+        self.verb_views, self.generator_views = {}, {}
+        self.held_card = None
+        self.suggested = None
+        
+        # Keep the player's pause and speed settings
+        workshop = snapshot.workshop
+        workshop.scheduler.paused = self.scheduler.paused
+        workshop.scheduler.speed = self.scheduler.speed
+        self.workshop = workshop
+        self.scheduler = workshop.scheduler
+        self.environment.current_time = snapshot.environment_time
+        
+        self.create_initial_verbs()
+        self.create_generators()
+        self.bind_workshop()
+        for verb in self.verbs:
+            if verb.is_processing:
+                verb.start_processing(verb.state.crafts[0].recipe)
+                
+        # Card views are built a few hundred per frame rather than all at once
+        self.pending_views.extend(workshop.cards.values())
+        
+    def automate(self, interval=0.1):
+        # The automation API for this workshop, e.g.
+        #   game.automate().route(herb_spring, alchemy, conveyor=Conveyor(path))
+        if self.automation is None:
+            self.automation = Automation(self.workshop, interval=interval)
+        return self.automation
+        
+    def show_route(self, event):
+        conveyor = event.route.conveyor
+        if conveyor and conveyor not in self.conveyor_views:
+            self.conveyor_views[conveyor] = Conveyor3D(conveyor)
+            
+    def hide_route(self, event):
+        conveyor = event.route.conveyor
+        if conveyor and not any(route.conveyor is conveyor for route in self.automation.routes):
+            destroy(self.conveyor_views.pop(conveyor))
+            
+    def update_automation(self):
+        # Cards riding conveyors, every belt in one pass
+        if not self.automation:
+            return
+        for state, position in self.automation.in_transit(self.workshop.time):
+            card = self.cards.get(state.id)
+            if card and not card.is_held:
+                card.position = Vec3(*position)
+                card.redraw()
+                
+    def update_lifetime_bars(self, dt):
+        # One pass over every lifetime card a few times a second; expiry
+        # itself stays on the scheduler's timing wheel
+        self.lifetime_bar_clock += dt
+        if self.lifetime_bar_clock < self.lifetime_bar_interval:
+            return
+        self.lifetime_bar_clock = 0.0
+        for card in self.lifetime_cards:
+            card.refresh_lifetime_bar()
+            
+    def build_pending_views(self):
+        for _ in range(min(self.views_per_frame, len(self.pending_views))):
+            self.view_for(self.pending_views.popleft())
+            
+    def view_for(self, state):
+        # Views of loaded cards are built on first use if the queue hasn't got to them
+        card = self.cards.get(state.id)
+        if card is None and state.alive:
+            card = self.add_card_view(state)
+        return card
+        
     def handle_mouse_click(self):
         if mouse.hovered_entity:
             if isinstance(mouse.hovered_entity, Card):
                 if not self.held_card:
                     self.held_card = mouse.hovered_entity
                     self.held_card.pickup()
+                    if self.recorder:
+                        self.recorder.pickup(self.held_card.state)
+                    if self.automation:
+                        self.automation.release(self.held_card.state)
             elif self.held_card:
                 self.drop_card()
         elif self.held_card:
@@ -184,35 +364,63 @@ class GameManager(Entity):
         if not self.held_card:
             return
             
-        for verb in self.verbs:
-            if verb.is_card_over(self.held_card):
-                verb.accept_card(self.held_card)
-                self.held_card.drop()
-                self.held_card = None
-                return
-                
-        self.held_card.drop()
+        card = self.held_card
+        verb = self.workshop.verb_at(card.world_position)
+        card.drop()
         self.held_card = None
-        
-    def create_card(self, position, card_type, title, animate_spawn=False, **kwargs):
-        card = Card(
-            position=position,
-            card_type=card_type,
-            title=title,
-            **kwargs
-        )
+        if self.recorder:
+            self.recorder.drop(card.state, verb)
+            
+        if verb:
+            self.workshop.place_card(card.state, verb)
+            
+    def update_suggestions(self):
+        # Hints for the station under the held card, redone only when that
+        # station, the held title or the cards already on it change
+        card = self.held_card
+        verb = self.workshop.verb_at(card.world_position) if card and card.state.alive else None
+        key = None
+        if verb is not None:
+            key = (verb, card.state.title, len(verb.active_cards))
+        if key == self.suggested:
+            return
+        if self.suggested is not None:
+            self.verb_views[self.suggested[0]].clear_suggestions()
+        self.suggested = key
+        if key is not None:
+            self.verb_views[verb].show_suggestions(self.workshop.suggest_recipes(verb, [card.state.title]))
+            
+    def add_card_view(self, state, animate_spawn=False):
+        card = self.card_pool.acquire(state=state)
         
         if animate_spawn:
             card.spawn_animation()
             
-        self.cards.append(card)
+        self.cards[state.id] = card
+        if card.lifetime:
+            self.lifetime_cards.add(card)
         return card
         
+    def remove_card_view(self, state, reason):
+        card = self.cards.pop(state.id, None)
+        if not card:
+            return
+        self.lifetime_cards.discard(card)
+            
+        if card is self.held_card:
+            self.held_card = None
+            
+        if reason == "expired":
+            card.start_decay()
+        else:
+            card.consume()
+            
+    def create_card(self, position, card_type, title, **kwargs):
+        state = self.workshop.create_card(position=tuple(position), title=title, card_type=card_type, **kwargs)
+        return self.cards.get(state.id)
+        
     def is_position_occupied(self, position, threshold=1.5):
-        for card in self.cards:
-            if distance(card.position, position) < threshold:
-                return True
-        return False
+        return self.workshop.is_position_occupied(position, threshold)
         
     def setup_ui(self):
         self.level_text = Text(
@@ -231,7 +439,7 @@ class GameManager(Entity):
         
         # Recipe hint
         self.hint_text = Text(
-            text="Experiment with combinations!\nDrag cards onto the glowing stations.\nPress 'R' for recipe book.",
+            text="Experiment with combinations!\nDrag cards onto the glowing stations.\nPress 'R' for recipe book, 'P' to pause, 'F' to fast-forward, F5/F9 to save/load, F6 to record, F3 for frame stats.",
             position=(0, -0.45),
             scale=1.5,
             color=color.light_gray,
@@ -278,17 +486,27 @@ class GameManager(Entity):
             color=color.yellow
         )
         
+    def on_mana_changed(self, count):
+        # Called by the workshop inventory only when the Mana count changes
+        self.mana_count = count
+        if self.mana_text is not None:
+            self.mana_text.text = f"Mana: {count}"
+            
     def update_ui(self):
-        self.mana_count = sum(1 for card in self.cards if card.title == "Mana")
-        self.mana_text.text = f"Mana: {self.mana_count}"
-        
-        # Update time display
-        if self.environment and hasattr(self, 'clock_text'):
+        # Text is only rebuilt when what it shows has changed
+        if not self.environment or not hasattr(self, 'clock_text'):
+            return
+        minute = int(self.environment.current_time * 60)
+        if minute != self.shown_minute:
+            self.shown_minute = minute
             self.clock_text.text = self.environment.get_time_string()
-            self.phase_text.text = self.environment.get_day_phase()
+            
+        phase = self.environment.get_day_phase()
+        if phase != self.shown_phase:
+            self.shown_phase = phase
+            self.phase_text.text = phase
             
             # Update icon based on time
-            phase = self.environment.get_day_phase()
             if phase in ["Morning", "Afternoon"]:
                 self.time_icon.color = color.yellow  # Sun
                 self.time_icon.scale = 0.025
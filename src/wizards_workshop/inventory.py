@@ -0,0 +1,72 @@
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+class Inventory:
+    """Live card counts by title and by card type.
+
+    The workshop adds and removes cards as they are created, expire or are
+    consumed, so a count is a dict lookup instead of a scan over every
+    card. Watchers registered for a title or type are called with the new
+    count only when that count changes.
+    """
+
+    def __init__(self):
+        self.titles: Counter = Counter()
+        self.types: Counter = Counter()
+        self._title_watchers: Dict[str, List[Callable[[int], None]]] = {}
+        self._type_watchers: Dict[str, List[Callable[[int], None]]] = {}
+
+    def __len__(self):
+        return sum(self.titles.values())
+
+    def count(self, title: str) -> int:
+        return self.titles[title]
+
+    def count_type(self, card_type: str) -> int:
+        return self.types[card_type]
+
+    def watch(self, title: str, callback: Callable[[int], None]):
+        self._title_watchers.setdefault(title, []).append(callback)
+        callback(self.titles[title])
+
+    def watch_type(self, card_type: str, callback: Callable[[int], None]):
+        self._type_watchers.setdefault(card_type, []).append(callback)
+        callback(self.types[card_type])
+
+    def add(self, title: str, card_type: str):
+        self._change(title, card_type, 1)
+
+    def remove(self, title: str, card_type: str):
+        self._change(title, card_type, -1)
+
+    def add_many(self, cards: Iterable[Tuple[str, str]]):
+        # Bulk load (snapshots): count first, then notify each watcher once
+        titles, types = Counter(), Counter()
+        for title, card_type in cards:
+            titles[title] += 1
+            types[card_type] += 1
+        self.titles.update(titles)
+        self.types.update(types)
+        for title in titles:
+            self._notify(self._title_watchers, title, self.titles[title])
+        for card_type in types:
+            self._notify(self._type_watchers, card_type, self.types[card_type])
+
+    def _change(self, title: str, card_type: str, delta: int):
+        titles, types = self.titles, self.types
+        titles[title] += delta
+        types[card_type] += delta
+        if not titles[title]:
+            del titles[title]
+        if not types[card_type]:
+            del types[card_type]
+        if title in self._title_watchers:
+            self._notify(self._title_watchers, title, titles[title])
+        if card_type in self._type_watchers:
+            self._notify(self._type_watchers, card_type, types[card_type])
+
+    @staticmethod
+    def _notify(watchers: Dict[str, List[Callable[[int], None]]], key: str, count: int):
+        for callback in watchers.get(key, ()):
+            callback(count)
@@ -0,0 +1,210 @@
+import heapq
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Set
+
+from .recipes import Recipe
+
+
+class PlanningError(ValueError):
+    pass
+
+
+class RecipeCycleError(PlanningError):
+    """The title is only produced by recipes that (indirectly) need it."""
+
+
+@dataclass
+class CraftStep:
+    recipe: Recipe
+    count: int
+    stage: int  # steps in the same stage don't depend on each other
+
+    @property
+    def verb(self) -> str:
+        return self.recipe.verb
+
+    @property
+    def time(self) -> float:
+        return self.recipe.time * self.count
+
+
+@dataclass
+class CraftingPlan:
+    target: str
+    count: int
+    steps: List[CraftStep]               # in crafting order, inputs first
+    raw_inputs: Dict[str, int]           # still to be gathered
+    from_inventory: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def stages(self) -> List[List[CraftStep]]:
+        stages: List[List[CraftStep]] = []
+        for step in self.steps:
+            while len(stages) <= step.stage:
+                stages.append([])
+            stages[step.stage].append(step)
+        return stages
+
+    @property
+    def total_time(self) -> float:
+        # Every craft one after the other
+        return sum(step.time for step in self.steps)
+
+    @property
+    def parallel_time(self) -> float:
+        # Different verbs work through a stage side by side; one verb crafts one thing at a time
+        total = 0.0
+        for stage in self.stages:
+            per_verb: Counter = Counter()
+            for step in stage:
+                per_verb[step.verb] += step.time
+            total += max(per_verb.values())
+        return total
+
+    @property
+    def parallel_verbs(self) -> List[Set[str]]:
+        # Verbs busy at the same time in each stage
+        return [{step.verb for step in stage} for stage in self.stages]
+
+
+class CraftingPlanner:
+    """Cheapest way (by total recipe time) to craft any title in a book.
+
+    Costs for every title are solved once with a Knuth/Dijkstra pass over
+    the recipe graph: raw titles cost nothing, and a recipe is only
+    considered once all of its inputs are settled. That memoizes every
+    sub-solution for later plans and never follows a cycle. Titles left
+    unsettled can only be made through a cycle.
+    """
+
+    def __init__(self, recipes: Sequence[Recipe]):
+        self.recipes = list(recipes)
+        self.best: Dict[str, Recipe] = {}   # title -> cheapest recipe making it
+        self.best_inputs: Dict[str, Counter] = {}  # title -> that recipe's inputs, counted
+        self.cost: Dict[str, float] = {}    # title -> total time to craft one from raw
+        self.order: Dict[str, int] = {}     # title -> settle order; inputs settle before outputs
+        self.produced: Set[str] = {recipe.output for recipe in self.recipes}
+        self._solve()
+
+    def _solve(self):
+        inputs = [Counter(recipe.inputs) for recipe in self.recipes]
+        waiting = [len(counts) for counts in inputs]
+        used_by: Dict[str, List[int]] = {}
+        for index, counts in enumerate(inputs):
+            for title in counts:
+                used_by.setdefault(title, []).append(index)
+
+        queue = []
+        sequence = 0
+        for title in used_by:
+            if title not in self.produced:
+                queue.append((0.0, sequence, title, None))
+                sequence += 1
+        for index, counts in enumerate(inputs):
+            if not counts:
+                queue.append((self.recipes[index].time, sequence, self.recipes[index].output, index))
+                sequence += 1
+        heapq.heapify(queue)
+
+        cost, best, best_inputs, order, recipes = self.cost, self.best, self.best_inputs, self.order, self.recipes
+        while queue:
+            title_cost, _, title, index = heapq.heappop(queue)
+            if title in cost:
+                continue
+            cost[title] = title_cost
+            order[title] = len(order)
+            if index is not None:
+                best[title] = recipes[index]
+                best_inputs[title] = inputs[index]
+            for user in used_by.get(title, ()):
+                waiting[user] -= 1
+                if waiting[user] == 0:
+                    recipe = recipes[user]
+                    if recipe.output not in cost:
+                        total = recipe.time + sum(cost[name] * n for name, n in inputs[user].items())
+                        heapq.heappush(queue, (total, sequence, recipe.output, user))
+                        sequence += 1
+
+    def plan(self, target: str, count: int = 1, inventory: Optional[Mapping[str, int]] = None) -> CraftingPlan:
+        if target not in self.produced:
+            raise PlanningError(f"no recipe makes {target!r}")
+        if target not in self.best:
+            raise RecipeCycleError(f"{target!r} can only be crafted through a recipe cycle")
+
+        # Titles reachable along the chosen recipes, outputs before their inputs
+        best_inputs = self.best_inputs
+        reachable = {target}
+        stack = [target]
+        while stack:
+            for title in best_inputs.get(stack.pop(), ()):
+                if title not in reachable:
+                    reachable.add(title)
+                    stack.append(title)
+        ordered = sorted(reachable, key=self.order.__getitem__, reverse=True)
+
+        # Push demand down the tree, taking what the inventory already has
+        available = Counter(inventory or {})
+        demand: Counter = Counter({target: count})
+        crafts: Dict[str, int] = {}
+        raw_inputs: Dict[str, int] = {}
+        from_inventory: Dict[str, int] = {}
+        for title in ordered:
+            needed = demand[title]
+            if not needed:
+                continue
+            if title != target and available[title]:
+                used = min(needed, available[title])
+                from_inventory[title] = used
+                needed -= used
+            if not needed:
+                continue
+            if title not in best_inputs:
+                raw_inputs[title] = needed
+                continue
+            crafts[title] = needed
+            for name, per_craft in best_inputs[title].items():
+                demand[name] += per_craft * needed
+
+        # Inputs first; a step's stage is one past the latest stage it waits on
+        stage_of: Dict[str, int] = {}
+        steps = []
+        for title in reversed(ordered):
+            if title not in crafts:
+                continue
+            stage = max((stage_of[name] + 1 for name in best_inputs[title] if name in stage_of), default=0)
+            stage_of[title] = stage
+            steps.append(CraftStep(recipe=self.best[title], count=crafts[title], stage=stage))
+
+        return CraftingPlan(target=target, count=count, steps=steps, raw_inputs=raw_inputs,
+                            from_inventory=from_inventory)
+
+
+# Process pool workers: each solves the book once, then plans its share of targets
+_worker_planner: Optional[CraftingPlanner] = None
+
+
+def _start_worker(recipes):
+    global _worker_planner
+    _worker_planner = CraftingPlanner(recipes)
+
+
+def _plan_in_worker(target, inventory):
+    try:
+        return _worker_planner.plan(target, inventory=inventory)
+    except PlanningError as error:
+        return error
+
+
+def plan_many(recipes: Sequence[Recipe], targets: Sequence[str], inventory: Optional[Mapping[str, int]] = None,
+              processes: Optional[int] = None, chunksize: int = 256) -> List:
+    """Plans (or the PlanningError) for each target, in target order.
+
+    The targets are split across a process pool. Every worker rebuilds the
+    planner from the recipes, so the pool only pays off for large batches.
+    """
+    inventory = dict(inventory or {})
+    with ProcessPoolExecutor(max_workers=processes, initializer=_start_worker,
+                             initargs=(list(recipes),)) as pool:
+        return list(pool.map(_plan_in_worker, targets, [inventory] * len(targets), chunksize=chunksize))
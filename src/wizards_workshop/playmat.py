@@ -2,49 +2,61 @@ from ursina import *
 import math
 import time
 
+from .static_mesh import StaticMesh
+
 
 class Playmat(Entity):
     def __init__(self):
         super().__init__()
+        # Animated crystals, registered when created so update never walks the tree
+        self.crystals = []
+        self.crystal_base_scales = []
+        self.crystal_angle = 0
         self.create_magical_workshop_floor()
         
     def create_magical_workshop_floor(self):
+        # Everything that never moves is baked into two meshes: the floor
+        # (in the floor's space) and the boundary stones (in the playmat's)
+        floor = StaticMesh()
+        boundary = StaticMesh()
+        
         # Main stone workshop floor
         self.main_floor = Entity(
-            model="cube",
             scale=(25, 0.1, 25),
-            position=(0, 0, 0),
-            color=color.rgb(105, 105, 105)  # Dim gray stone
+            position=(0, 0, 0)
         )
+        floor.add("cube", color=color.rgb(105, 105, 105))  # Dim gray stone
         
         # Add stone tile pattern
-        self.create_stone_tiles()
+        self.create_stone_tiles(floor)
         
         # Magical circle in center
-        self.create_magical_circle()
+        self.create_magical_circle(floor)
         
         # Workshop boundaries with decorative stones
-        self.create_workshop_boundary()
+        self.create_workshop_boundary(boundary)
+        
+        floor.attach(self.main_floor)
+        boundary.attach(self)
         
-    def create_stone_tiles(self):
+    def create_stone_tiles(self, floor):
         # Create individual stone tiles
         tile_size = 2
         for x in range(-10, 11, tile_size):
             for z in range(-10, 11, tile_size):
                 if abs(x) <= 10 and abs(z) <= 10:
-                    tile = Entity(
-                        model="cube",
+                    floor.add(
+                        "cube",
                         scale=(tile_size * 0.9, 0.02, tile_size * 0.9),
                         position=(x, 0.06, z),
                         color=color.rgb(
                             random.randint(85, 125),
                             random.randint(85, 125), 
                             random.randint(85, 125)
-                        ),
-                        parent=self.main_floor
+                        )
                     )
                     
-    def create_magical_circle(self):
+    def create_magical_circle(self, floor):
         # Central runic circle
         self.magic_circle = Entity(
             model="sphere",
@@ -71,15 +83,14 @@ class Playmat(Entity):
             x = math.cos(math.radians(angle)) * 2.5
             z = math.sin(math.radians(angle)) * 2.5
             
-            rune = Entity(
-                model="cube",
+            floor.add(
+                "cube",
                 scale=(0.2, 0.1, 0.2),
                 position=(x, 0.1, z),
-                color=color.gold,
-                parent=self.main_floor
+                color=color.gold
             )
             
-    def create_workshop_boundary(self):
+    def create_workshop_boundary(self, boundary):
         # Decorative boundary stones
         boundary_positions = [
             (-12, 0, 0), (12, 0, 0),  # Left and right
@@ -89,22 +100,30 @@ class Playmat(Entity):
         ]
         
         for pos in boundary_positions:
-            stone = Entity(
-                model="sphere",
+            boundary.add(
+                "sphere",
                 scale=(0.8, 1.2, 0.8),
                 position=pos,
-                color=color.rgb(70, 70, 70),
-                parent=self
+                color=color.rgb(70, 70, 70)
             )
             
             # Add glowing crystal on top
-            crystal = Entity(
-                model="sphere",
-                scale=(0.3, 0.6, 0.3),
+            self.add_crystal(
                 position=(pos[0], pos[1] + 1, pos[2]),
-                color=color.rgb(random.randint(100, 255), random.randint(100, 255), 255),
-                parent=self
+                color=color.rgb(random.randint(100, 255), random.randint(100, 255), 255)
             )
+            
+    def add_crystal(self, position, color, scale=(0.3, 0.6, 0.3)):
+        crystal = Entity(
+            model="sphere",
+            scale=scale,
+            position=position,
+            color=color,
+            parent=self
+        )
+        self.crystals.append(crystal)
+        self.crystal_base_scales.append(tuple(scale))
+        return crystal
         
     def update(self):
         # Animate magical elements
@@ -114,12 +133,16 @@ class Playmat(Entity):
         if hasattr(self, 'inner_circle'):
             self.inner_circle.rotation_y -= 15 * time.dt
             
-        # Animate boundary crystals
-        for child in self.children:
-            if hasattr(child, 'children'):
-                for crystal in child.children:
-                    if crystal.scale_y > 0.5:  # It's a crystal
-                        crystal.rotation_y += 30 * time.dt
-                        # Gentle pulsing
-                        pulse = 1 + 0.1 * math.sin(time.time() * 2)
-                        crystal.scale = (crystal.scale_x, crystal.scale_y * pulse, crystal.scale_z)
\ No newline at end of file
+        self.animate_crystals()
+        
+    def animate_crystals(self):
+        # Every crystal shares one angle and pulse, so work them out once and
+        # write each transform in a single call, pulsing from the base scale
+        self.crystal_angle = (self.crystal_angle + 30 * time.dt) % 360
+        heading = self.crystal_angle * Entity.rotation_directions[0]
+        
+        # Gentle pulsing
+        pulse = 1 + 0.1 * math.sin(time.time() * 2)
+        
+        for crystal, (sx, sy, sz) in zip(self.crystals, self.crystal_base_scales):
+            crystal.set_hpr_scale(heading, 0, 0, sx, sy * pulse, sz)
\ No newline at end of file
@@ -0,0 +1,87 @@
+from ursina import *
+
+
+class EntityPool:
+    """Keeps released entities disabled and hands them out again.
+
+    acquire() takes the attributes to (re)apply: a miss builds a new entity
+    with factory(**attributes), a hit re-enables a free one and applies them
+    with reset(entity, **attributes), or plain setattr without a reset.
+    release() parks an entity for reuse (calling its on_release() first, the
+    way destroy() calls on_destroy()) unless the pool is already holding
+    capacity free entities, in which case it is destroyed as before.
+    """
+
+    def __init__(self, factory, reset=None, capacity=64):
+        self.factory = factory
+        self.reset = reset
+        self.capacity = capacity
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, **attributes):
+        if not self.free:
+            self.misses += 1
+            return self.factory(**attributes)
+
+        self.hits += 1
+        entity = self.free.pop()
+        entity.enabled = True
+        if self.reset:
+            self.reset(entity, **attributes)
+        else:
+            for name, value in attributes.items():
+                setattr(entity, name, value)
+        return entity
+
+    def release(self, entity, delay=0):
+        if delay:
+            invoke(self.release, entity, delay=delay)
+            return
+        if hasattr(entity, 'on_release'):
+            entity.on_release()
+
+        if len(self.free) >= self.capacity:
+            self.discarded += 1
+            destroy(entity)
+            return
+        entity.enabled = False
+        self.free.append(entity)
+
+    def clear(self):
+        for entity in self.free:
+            destroy(entity)
+        self.free.clear()
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            "free": len(self.free),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
+
+
+def reset_effect(entity, **attributes):
+    # Back to a fresh sphere: the last user's animations stopped, and the
+    # scale, color and alpha it left behind replaced by the defaults
+    for animation in entity.animations:
+        animation.kill()
+    entity.animations.clear()
+    entity.scale = 1
+    entity.rotation = (0, 0, 0)
+    entity.color = color.white
+    for name, value in attributes.items():
+        setattr(entity, name, value)
+
+
+# Short-lived effect spheres (spawn and success flashes, processing particles)
+effect_pool = EntityPool(lambda **attributes: Entity(model="sphere", **attributes), reset_effect, capacity=64)
@@ -0,0 +1,152 @@
+import csv
+import json
+import statistics
+from collections import deque
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+class FrameProfiler:
+    """Per-frame time and call counts of watched methods, plus counters.
+
+    watch(owner, attribute, section) names a method (on a class or an
+    object) whose calls count towards a section. Timed wrappers are only
+    installed while the profiler is enabled and the original methods are
+    put back on disable, so a disabled profiler costs nothing per call.
+    Section times are inclusive: a watched method called from another one
+    counts in both. Works headless; the overlay in profiler_overlay.py
+    shows it in game.
+    """
+
+    def __init__(self, window: int = 300):
+        self.enabled = False
+        self.frames: Deque[dict] = deque(maxlen=window)
+        self.sections: Dict[str, List[float]] = {}  # section -> [seconds, calls] this frame
+        self.counters: Dict[str, float] = {}
+        self.frame_count = 0
+        self._targets: List[Tuple[Any, str, str]] = []
+        self._originals: List[Tuple[Any, str, Optional[Callable]]] = []
+        self._frame_start = None
+
+    def watch(self, owner, attribute: str, section: str):
+        self._targets.append((owner, attribute, section))
+        if self.enabled:
+            self._install(owner, attribute, section)
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.frames.clear()
+        self.sections = {}
+        self.counters = {}
+        self._frame_start = perf_counter()
+        for owner, attribute, section in self._targets:
+            self._install(owner, attribute, section)
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for owner, attribute, original in reversed(self._originals):
+            if original is None:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
+        self._originals.clear()
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def _install(self, owner, attribute: str, section: str):
+        # Only what the owner defines itself is restored; an inherited method is just shadowed
+        original = vars(owner).get(attribute)
+        function = getattr(owner, attribute)
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                entry = self.sections.get(section)
+                if entry is None:
+                    entry = self.sections[section] = [0.0, 0]
+                entry[0] += perf_counter() - start
+                entry[1] += 1
+
+        self._originals.append((owner, attribute, original))
+        setattr(owner, attribute, timed)
+
+    def count(self, name: str, value: float):
+        self.counters[name] = value
+
+    def end_frame(self):
+        # Closes the frame begun at the previous call (or at enable)
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self.frame_count += 1
+        self.frames.append({
+            "frame": self.frame_count,
+            "frame_ms": (now - self._frame_start) * 1000,
+            "sections": {name: (seconds * 1000, calls) for name, (seconds, calls) in self.sections.items()},
+            "counters": dict(self.counters),
+        })
+        self.sections = {}
+        self._frame_start = now
+
+    def summary(self) -> dict:
+        # Mean and worst per section over the recorded frames
+        frames = list(self.frames)
+        if not frames:
+            return {"frames": 0, "frame_ms": {}, "sections": {}, "counters": {}}
+        frame_ms = sorted(frame["frame_ms"] for frame in frames)
+        sections = {}
+        for name in self.section_names(frames):
+            times = [frame["sections"].get(name, (0.0, 0)) for frame in frames]
+            sections[name] = {
+                "mean_ms": statistics.fmean(ms for ms, _ in times),
+                "max_ms": max(ms for ms, _ in times),
+                "calls": statistics.fmean(calls for _, calls in times),
+            }
+        return {
+            "frames": len(frames),
+            "frame_ms": {
+                "mean": statistics.fmean(frame_ms),
+                "p95": frame_ms[int(len(frame_ms) * 0.95)],
+                "max": frame_ms[-1],
+            },
+            "sections": dict(sorted(sections.items(), key=lambda item: -item[1]["mean_ms"])),
+            "counters": frames[-1]["counters"],
+        }
+
+    @staticmethod
+    def section_names(frames) -> List[str]:
+        names = {}
+        for frame in frames:
+            names.update(dict.fromkeys(frame["sections"]))
+        return list(names)
+
+    def export_json(self, path):
+        with open(path, "w") as file:
+            json.dump({"summary": self.summary(), "frames": list(self.frames)}, file, indent=1)
+
+    def export_csv(self, path):
+        # One row per frame: frame time, then ms and calls of each section, then the counters
+        frames = list(self.frames)
+        sections = self.section_names(frames)
+        counters = list({name: None for frame in frames for name in frame["counters"]})
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "frame_ms", *(f"{name} {column}" for name in sections for column in ("ms", "calls")),
+                             *counters])
+            for frame in frames:
+                row = [frame["frame"], round(frame["frame_ms"], 4)]
+                for name in sections:
+                    ms, calls = frame["sections"].get(name, (0.0, 0))
+                    row += [round(ms, 4), calls]
+                row += [frame["counters"].get(name, "") for name in counters]
+                writer.writerow(row)
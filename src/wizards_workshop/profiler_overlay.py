@@ -0,0 +1,69 @@
+from ursina import *
+from pathlib import Path
+from time import perf_counter
+
+from .card_renderer import render_stats
+
+
+class ProfilerOverlay(Entity):
+    # F3 shows where frame time goes, F4 writes the recorded frames to
+    # profile.json and profile.csv. Refreshed a few times a second.
+    refresh_interval = 0.25
+    export_name = "profile"
+
+    def __init__(self, profiler, **kwargs):
+        super().__init__(**kwargs)
+        self.profiler = profiler
+        self.next_refresh = 0
+        self.draw_calls = 0
+        self.text = Text(
+            parent=camera.ui,
+            position=window.top_left + Vec2(0.01, -0.01),
+            origin=(-0.5, 0.5),
+            scale=0.75,
+            color=color.lime,
+            background=True,
+            enabled=False
+        )
+
+    def input(self, key):
+        if key == 'f3':
+            self.profiler.toggle()
+            self.text.enabled = self.profiler.enabled
+            self.next_refresh = 0
+        elif key == 'f4' and self.profiler.frames:
+            self.export()
+
+    def export(self, folder="."):
+        path = Path(folder) / self.export_name
+        self.profiler.export_json(path.with_suffix(".json"))
+        self.profiler.export_csv(path.with_suffix(".csv"))
+        print(f"Wrote {len(self.profiler.frames)} profiled frames to {path}.json and {path}.csv")
+
+    def update(self):
+        profiler = self.profiler
+        if not profiler.enabled:
+            return
+        profiler.count("entities", len(scene.entities))
+        profiler.count("sequences", len(application.sequences))  # running invoke(delay=...) and animate_* calls
+        profiler.count("draw_calls", self.draw_calls)
+        profiler.end_frame()
+
+        now = perf_counter()
+        if now >= self.next_refresh:
+            self.next_refresh = now + self.refresh_interval
+            # Walking the scene graph is too slow to do every frame
+            self.draw_calls = render_stats()["draw_calls"]
+            self.text.text = self.report()
+
+    def report(self):
+        summary = self.profiler.summary()
+        if not summary["frames"]:
+            return "profiling..."
+        frame = summary["frame_ms"]
+        lines = [f"frame {frame['mean']:.1f} ms  p95 {frame['p95']:.1f}  max {frame['max']:.1f}  ({1000 / frame['mean']:.0f} fps)"]
+        for name, section in summary["sections"].items():
+            lines.append(f"{name:<14} {section['mean_ms']:6.2f} ms  max {section['max_ms']:6.2f}  x{section['calls']:.0f}")
+        counters = summary["counters"]
+        lines.append(f"entities {counters['entities']}  draw calls {counters['draw_calls']}  sequences {counters['sequences']}")
+        return "\n".join(lines)
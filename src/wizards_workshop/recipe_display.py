@@ -5,8 +5,11 @@ class RecipeDisplay(Entity):
     def __init__(self, recipe_book):
         super().__init__()
         self.recipe_book = recipe_book
-        self.current_page = 0
+        self.first_row = 0
         self.recipes_per_page = 4
+        self.query = ""
+        self.results = range(len(recipe_book.recipes))  # recipe positions matching the search
+        self.shown = [None] * self.recipes_per_page  # recipe position each row text was built for
         
         self.setup_ui()
         
@@ -31,12 +34,21 @@ class RecipeDisplay(Entity):
             color=color.white
         )
         
-        # Recipe texts
+        # Search box; the index behind it is only built on the first search
+        self.search_field = InputField(
+            parent=self.panel,
+            scale=(0.9, 0.08),
+            position=(0, 0.12, -0.01),
+            character_limit=40
+        )
+        self.search_field.on_value_changed = lambda: self.search(self.search_field.text)
+        
+        # Recipe texts: a fixed set of rows reused for whichever results are in view
         self.recipe_texts = []
         for i in range(self.recipes_per_page):
             recipe_text = Text(
                 parent=self.panel,
-                position=(-0.14, 0.12 - i * 0.08, -0.01),
+                position=(-0.14, 0.06 - i * 0.055, -0.01),
                 scale=1.5,
                 origin=(-0.5, 0),
                 color=color.light_gray
@@ -70,40 +82,69 @@ class RecipeDisplay(Entity):
         
         self.update_display()
         
-    def update_display(self):
-        all_recipes = self.recipe_book.recipes
-        total_pages = (len(all_recipes) - 1) // self.recipes_per_page + 1
+    @property
+    def searching(self):
+        # Keys typed into the search box are not game hotkeys
+        return self.panel.enabled and self.search_field.active
         
-        start_idx = self.current_page * self.recipes_per_page
-        end_idx = min(start_idx + self.recipes_per_page, len(all_recipes))
+    def search(self, query):
+        query = query.strip()
+        if query == self.query:
+            return
+        self.query = query
+        self.results = self.recipe_book.search_index.search(query) if query else range(len(self.recipe_book.recipes))
+        self.first_row = 0
+        self.update_display()
         
-        # Clear all recipe texts
-        for text in self.recipe_texts:
-            text.text = ""
-            
-        # Display recipes for current page
-        for i, recipe_idx in enumerate(range(start_idx, end_idx)):
-            recipe = all_recipes[recipe_idx]
-            ingredients = " + ".join(recipe.inputs)
-            self.recipe_texts[i].text = f"{recipe.verb}: {ingredients} → {recipe.output}"
-            
-        # Update page indicator
-        self.page_text.text = f"{self.current_page + 1}/{total_pages}"
+    def update_display(self):
+        # Only the rows in view are rendered, and a row's text is only rebuilt
+        # when a different recipe scrolls into it
+        recipes = self.recipe_book.recipes
+        results = self.results
+        end = min(self.first_row + self.recipes_per_page, len(results))
+        
+        for i, text in enumerate(self.recipe_texts):
+            position = results[self.first_row + i] if self.first_row + i < end else None
+            if position == self.shown[i]:
+                continue
+            self.shown[i] = position
+            if position is None:
+                text.text = ""
+            else:
+                recipe = recipes[position]
+                ingredients = " + ".join(recipe.inputs)
+                text.text = f"{recipe.verb}: {ingredients} → {recipe.output}"
+                
+        # Update position indicator
+        if results:
+            self.page_text.text = f"{self.first_row + 1}-{end} of {len(results)}"
+        else:
+            self.page_text.text = "No recipes"
         
         # Update button states
-        self.prev_button.disabled = self.current_page == 0
-        self.next_button.disabled = self.current_page >= total_pages - 1
+        self.prev_button.disabled = self.first_row == 0
+        self.next_button.disabled = end >= len(results)
         
-    def prev_page(self):
-        if self.current_page > 0:
-            self.current_page -= 1
+    def scroll(self, rows):
+        last = max(0, len(self.results) - self.recipes_per_page)
+        first_row = min(max(0, self.first_row + rows), last)
+        if first_row != self.first_row:
+            self.first_row = first_row
             self.update_display()
             
+    def prev_page(self):
+        self.scroll(-self.recipes_per_page)
+            
     def next_page(self):
-        total_pages = (len(self.recipe_book.recipes) - 1) // self.recipes_per_page + 1
-        if self.current_page < total_pages - 1:
-            self.current_page += 1
-            self.update_display()
+        self.scroll(self.recipes_per_page)
+        
+    def input(self, key):
+        if not self.panel.enabled:
+            return
+        if key == 'scroll up':
+            self.scroll(-1)
+        elif key == 'scroll down':
+            self.scroll(1)
             
     def toggle_visibility(self):
-        self.panel.enabled = not self.panel.enabled
\ No newline at end of file
+        self.panel.enabled = not self.panel.enabled
@@ -0,0 +1,106 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+from .recipes import Recipe
+
+
+class RecipeGraph:
+    """Which titles can ever be crafted from the starting cards, and how deep.
+
+    Titles in `sources` (starter and generated cards) have depth 0; a recipe
+    fires once all of its inputs are reachable and gives its output depth
+    1 + the deepest input, keeping the smallest depth over all recipes.
+    Adding a recipe or a source only re-examines the recipes downstream of
+    what changed. Removing a recipe can only shrink the result, which
+    needs the full fixed point again (see RecipeBook.remove_recipe).
+    """
+
+    def __init__(self, recipes: Iterable[Recipe], sources: Iterable[str]):
+        self.recipes: List[Recipe] = []
+        self.sources: Set[str] = set()
+        self.depth: Dict[str, int] = {}            # reachable title -> minimal crafting depth
+        self.used_by: Dict[str, List[int]] = {}    # title -> recipes taking it
+        self.produced_by: Dict[str, List[int]] = {}
+        self._inputs: List[tuple] = []             # distinct inputs per recipe
+        self._missing: List[int] = []              # unreachable inputs left per recipe
+
+        for recipe in recipes:
+            self._index(recipe)
+        changed = deque()
+        for title in sources:
+            if title not in self.sources:
+                self.sources.add(title)
+                changed.append(self._settle(title, 0))
+        for index, inputs in enumerate(self._inputs):
+            if not inputs:
+                self._fire(index, changed)
+        self._propagate(changed)
+
+    def _index(self, recipe: Recipe) -> int:
+        index = len(self.recipes)
+        inputs = tuple(dict.fromkeys(recipe.inputs))
+        self.recipes.append(recipe)
+        self._inputs.append(inputs)
+        depth = self.depth
+        self._missing.append(sum(1 for title in inputs if title not in depth))
+        for title in inputs:
+            self.used_by.setdefault(title, []).append(index)
+        self.produced_by.setdefault(recipe.output, []).append(index)
+        return index
+
+    def _settle(self, title: str, depth: int) -> str:
+        # Record a new (or smaller) depth; first time reachable unblocks its users
+        if title not in self.depth:
+            for user in self.used_by.get(title, ()):
+                self._missing[user] -= 1
+        self.depth[title] = depth
+        return title
+
+    def _fire(self, index: int, changed: deque):
+        # Offer a ready recipe's output at 1 + its deepest input
+        depth = self.depth
+        output = self.recipes[index].output
+        candidate = 1 + max((depth[title] for title in self._inputs[index]), default=0)
+        if candidate < depth.get(output, candidate + 1):
+            changed.append(self._settle(output, candidate))
+
+    def _propagate(self, changed: deque):
+        # Fixed point over only the recipes downstream of titles that changed
+        missing = self._missing
+        while changed:
+            title = changed.popleft()
+            for user in self.used_by.get(title, ()):
+                if not missing[user]:
+                    self._fire(user, changed)
+
+    def add_recipe(self, recipe: Recipe):
+        index = self._index(recipe)
+        changed = deque()
+        if not self._missing[index]:
+            self._fire(index, changed)
+        self._propagate(changed)
+
+    def add_source(self, title: str):
+        self.sources.add(title)
+        if self.depth.get(title) != 0:
+            self._propagate(deque([self._settle(title, 0)]))
+
+    # Reports
+
+    def is_reachable(self, title: str) -> bool:
+        return title in self.depth
+
+    def unreachable_outputs(self) -> Set[str]:
+        return {title for title in self.produced_by if title not in self.depth}
+
+    def dead_recipes(self) -> List[Recipe]:
+        # Recipes that can never fire: some input is never available
+        return [recipe for recipe, missing in zip(self.recipes, self._missing) if missing]
+
+    def missing_inputs(self) -> Set[str]:
+        # Inputs that are neither a starting card nor craftable by any recipe
+        return {title for title in self.used_by if title not in self.depth and title not in self.produced_by}
+
+    def unused_inputs(self) -> Set[str]:
+        # Starting cards no recipe takes
+        return {title for title in self.sources if title not in self.used_by}
@@ -0,0 +1,125 @@
+import re
+from array import array
+from itertools import chain, groupby
+from typing import Dict, List, Optional, Sequence, Set
+
+from .gcutil import gc_paused
+from .recipes import Recipe
+
+_WORD = re.compile(r"\w+")
+SHORT_TERM = 3  # shorter terms match word prefixes only, longer ones any substring
+
+
+class _Term:
+    __slots__ = ("words", "hits", "_members")
+
+    def __init__(self, words: Optional[List[str]], hits: array):
+        self.words = words  # matched words, kept to narrow a longer term; None for short terms
+        self.hits = hits    # sorted recipe positions
+        self._members: Optional[Set[int]] = None
+
+    @property
+    def members(self) -> Set[int]:
+        if self._members is None:
+            self._members = set(self.hits)
+        return self._members
+
+
+class RecipeIndex:
+    """Inverted index from the words of recipe verbs, inputs and outputs to
+    recipe positions, for the recipe book search box.
+
+    Each query term matches words it is a prefix of, or (from three
+    characters) any word it appears in, found through trigrams of the
+    vocabulary. Terms are ANDed. Results are positions in the book order.
+
+    One- and two-character prefixes, which can match most of the vocabulary,
+    are merged up front. What the previous query's terms matched is kept,
+    so typing one more character only redoes the last term, narrowing what
+    it found before.
+    """
+
+    def __init__(self, recipes: Sequence[Recipe]):
+        self.recipes = recipes
+        self.postings: Dict[str, array] = {}
+        self.trigrams: Dict[str, List[str]] = {}
+        self.prefixes: Dict[str, array] = {}
+        self._terms: Dict[str, _Term] = {}  # for the last query
+
+        # Titles repeat across thousands of recipes, so each is split once
+        splits: Dict[str, List[str]] = {}
+
+        def words_of(text):
+            words = splits.get(text)
+            if words is None:
+                words = splits[text] = _WORD.findall(text.lower())
+            return words
+
+        with gc_paused():
+            postings = self.postings
+            for position, recipe in enumerate(recipes):
+                words = set(words_of(recipe.verb))
+                words.update(words_of(recipe.output))
+                for title in recipe.inputs:
+                    words.update(words_of(title))
+                for word in words:
+                    posting = postings.get(word)
+                    if posting is None:
+                        posting = postings[word] = array("I")
+                    posting.append(position)
+
+            words = sorted(postings)
+            for word in words:
+                for start in range(len(word) - 2):
+                    self.trigrams.setdefault(word[start:start + 3], []).append(word)
+            for length in range(1, SHORT_TERM):
+                for prefix, group in groupby(words, key=lambda word: word[:length]):
+                    group = list(group)
+                    if len(group) == 1:
+                        self.prefixes[prefix] = postings[group[0]]
+                    else:
+                        self.prefixes[prefix] = array("I", sorted(set(chain.from_iterable(postings[word] for word in group))))
+
+    def __len__(self) -> int:
+        return len(self.recipes)
+
+    def search(self, query: str) -> Sequence[int]:
+        # Split like the indexed text, so punctuation in the query separates words too
+        terms = _WORD.findall(query.lower())
+        if not terms:
+            return range(len(self.recipes))
+
+        previous, self._terms = self._terms, {}
+        matches = []
+        for term in terms:
+            match = previous.get(term) or self._match(term, previous)
+            self._terms[term] = match
+            matches.append(match)
+
+        # Walk the fewest hits, in order, keeping those every other term has too
+        matches.sort(key=lambda match: len(match.hits))
+        found = matches[0].hits
+        for match in matches[1:]:
+            members = match.members
+            found = [position for position in found if position in members]
+            if not found:
+                break
+        return found
+
+    def _match(self, term: str, previous: Dict[str, _Term]) -> _Term:
+        if len(term) < SHORT_TERM:
+            return _Term(None, self.prefixes.get(term, array("I")))
+
+        # Narrow a longer term of the last query this one extends, else go through trigrams
+        for earlier, match in previous.items():
+            if match.words is not None and term.startswith(earlier):
+                candidates = match.words
+                break
+        else:
+            grams = [self.trigrams.get(term[i:i + 3], ()) for i in range(len(term) - 2)]
+            candidates = min(grams, key=len)
+        words = [word for word in candidates if term in word]
+
+        if len(words) == 1:
+            return _Term(words, self.postings[words[0]])
+        return _Term(words, array("I", sorted(set(chain.from_iterable(self.postings[word] for word in words)))))
@@ -0,0 +1,78 @@
+import heapq
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .gcutil import gc_paused
+from .recipes import Recipe
+
+
+class _Node:
+    __slots__ = ("children", "recipes")
+
+    def __init__(self):
+        self.children: Optional[Dict[str, "_Node"]] = None  # most nodes are leaves
+        self.recipes: List[Recipe] = []
+
+
+class RecipeTrie:
+    """Recipes of one verb by every sub-multiset of their inputs.
+
+    Each recipe is inserted along the sorted paths of all the partial sets
+    of cards it could start from, so the recipes still completable from the
+    cards on a station are one walk down the placed titles (sorted), with
+    no scan over the verb's recipes. Recipes take a handful of inputs, so
+    that is a few paths per recipe.
+    """
+
+    def __init__(self, recipes: Iterable[Recipe] = ()):
+        self.root = _Node()
+        with gc_paused():
+            for recipe in recipes:
+                self.add(recipe)
+
+    def add(self, recipe: Recipe):
+        # Depth first over the sub-multisets of the sorted inputs, each node once;
+        # a repeated title is only branched on from its first copy
+        inputs = sorted(recipe.inputs)
+        stack = [(self.root, 0)]
+        while stack:
+            node, first = stack.pop()
+            node.recipes.append(recipe)
+            previous = None
+            for index in range(first, len(inputs)):
+                title = inputs[index]
+                if title == previous:
+                    continue
+                previous = title
+                children = node.children
+                if children is None:
+                    children = node.children = {}
+                child = children.get(title)
+                if child is None:
+                    child = children[title] = _Node()
+                stack.append((child, index + 1))
+
+    def completions(self, titles: Sequence[str]) -> Sequence[Recipe]:
+        # Recipes whose inputs include all of titles (with repeats), in book order
+        node = self.root
+        for title in sorted(titles):
+            if node.children is None:
+                return ()
+            node = node.children.get(title)
+            if node is None:
+                return ()
+        return node.recipes
+
+    def suggest(self, titles: Sequence[str], limit: int = 3) -> List[Tuple[Recipe, List[str]]]:
+        # The closest few completions (book order among equals) with the cards
+        # each still needs; every completion holds all of titles, so how many
+        # it still needs is just its number of inputs past them
+        placed = Counter(titles)
+        closest = heapq.nsmallest(limit, self.completions(titles), key=lambda recipe: len(recipe.inputs))
+        return [(recipe, missing(recipe, placed)) for recipe in closest]
+
+
+def missing(recipe: Recipe, placed: Counter) -> List[str]:
+    needed = Counter(recipe.inputs)
+    needed.subtract(placed)
+    return sorted(needed.elements())
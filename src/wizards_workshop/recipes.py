@@ -1,103 +1,182 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Mapping, Optional, Sequence, Tuple
 
 
-@dataclass
+RecipeKey = Tuple[str, Tuple[str, ...]]
+
+
+def recipe_key(verb_name: str, card_titles: Sequence[str]) -> RecipeKey:
+    # Verb plus the input titles as a canonical (sorted) multiset
+    return (verb_name, tuple(sorted(card_titles)))
+
+
+@dataclass(frozen=True, slots=True)
 class Recipe:
+    # Immutable, so books and stations share the same objects. The content
+    # loader interns titles, so one title across thousands of recipes is one string.
     verb: str
-    inputs: List[str]
+    inputs: Tuple[str, ...]
     output: str
     time: float = 3.0
     description: str = ""
     
-    def matches(self, verb_name: str, card_titles: List[str]) -> bool:
+    def __post_init__(self):
+        if type(self.inputs) is not tuple:
+            object.__setattr__(self, "inputs", tuple(self.inputs))
+        
+    def matches(self, verb_name: str, card_titles: Sequence[str]) -> bool:
         if verb_name != self.verb:
             return False
         return sorted(self.inputs) == sorted(card_titles)
+        
+    @property
+    def key(self) -> RecipeKey:
+        return recipe_key(self.verb, self.inputs)
 
 
 class RecipeBook:
-    def __init__(self):
-        self.recipes = self._create_recipes()
+    """Recipes indexed by (verb, inputs), with per-verb views, a crafting
+    planner and a reachability graph built on first use.
+
+    RecipeBook.shared() is the one read-only book of the loaded content
+    packs that the workshop, every station and the recipe display use by
+    reference. Books built with RecipeBook(recipes) can be edited.
+    """
+    
+    _shared = None
+    
+    def __init__(self, recipes: Optional[Sequence[Recipe]] = None):
+        self.recipes = list(recipes) if recipes is not None else self._create_recipes()
+        self.frozen = False
+        self._index: Dict[RecipeKey, List[Recipe]] = {}
+        self._by_verb: Dict[str, Tuple[Recipe, ...]] = {}
+        self._tries = {}
+        self._planner = None
+        self._graph = None
+        self._search = None
+        self.rebuild_index()
+        
+    @classmethod
+    def shared(cls) -> "RecipeBook":
+        if cls._shared is None:
+            book = cls()
+            book.freeze()
+            cls._shared = book
+        return cls._shared
         
     def _create_recipes(self) -> List[Recipe]:
-        return [
-            # Forge recipes
-            Recipe(
-                verb="forge",
-                inputs=["Iron Ore", "Coal"],
-                output="Iron Ingot",
-                description="Smelt ore into usable metal"
-            ),
-            Recipe(
-                verb="forge", 
-                inputs=["Iron Ingot", "Basic Forging"],
-                output="Iron Blade",
-                description="Shape metal into a blade"
-            ),
-            Recipe(
-                verb="forge",
-                inputs=["Iron Blade", "Wood"],
-                output="Simple Wand",
-                description="Craft a basic magical focus"
-            ),
-            
-            # Study recipes
-            Recipe(
-                verb="study",
-                inputs=["Mysterious Tome"],
-                output="Basic Forging",
-                time=5.0,
-                description="Learn the art of metalworking"
-            ),
-            Recipe(
-                verb="study",
-                inputs=["Crystal Shard", "Mana"],
-                output="Elemental Theory",
-                description="Understand magical energies"
-            ),
-            Recipe(
-                verb="study",
-                inputs=["Elemental Theory", "Simple Wand"],
-                output="Spell: Ignite",
-                description="Learn your first spell"
-            ),
-            
-            # Ritual circle recipes
-            Recipe(
-                verb="ritual",
-                inputs=["Mana", "Mana", "Crystal Shard"],
-                output="Charged Crystal",
-                time=6.0,
-                description="Infuse crystal with power"
-            ),
-            Recipe(
-                verb="ritual",
-                inputs=["Spell: Ignite", "Charged Crystal"],
-                output="Flame Essence",
-                description="Extract elemental essence"
-            ),
+        # From the loaded content packs; recipes are immutable, so no copies
+        from .content import content_pack
+        return list(content_pack().recipes)
+        
+    def freeze(self):
+        self.recipes = tuple(self.recipes)
+        self.frozen = True
+        
+    def _check_editable(self):
+        if self.frozen:
+            raise TypeError("this recipe book is read-only; edit a copy made with RecipeBook(book.recipes)")
+        
+    def rebuild_index(self):
+        # Call after editing self.recipes directly
+        if self._index:
+            self._check_editable()
+        self._index = {}
+        self._by_verb = {}
+        self._tries = {}
+        self._planner = None
+        self._graph = None
+        self._search = None
+        for recipe in self.recipes:
+            self._index.setdefault(recipe.key, []).append(recipe)
             
-            # Alchemy recipes
-            Recipe(
-                verb="alchemy",
-                inputs=["Herb", "Mana"],
-                output="Minor Potion",
-                description="Brew a simple potion"
-            ),
-            Recipe(
-                verb="alchemy",
-                inputs=["Minor Potion", "Flame Essence"],
-                output="Potion of Fire Resistance",
-                description="Create protective elixir"
-            ),
-        ]
+    def add_recipe(self, recipe: Recipe):
+        self._check_editable()
+        self.recipes.append(recipe)
+        self._by_verb.pop(recipe.verb, None)
+        if recipe.verb in self._tries:
+            self._tries[recipe.verb].add(recipe)
+        self._index.setdefault(recipe.key, []).append(recipe)
+        self._planner = None
+        self._search = None
+        if self._graph is not None:
+            self._graph.add_recipe(recipe)
         
+    def remove_recipe(self, recipe: Recipe):
+        self._check_editable()
+        self.recipes.remove(recipe)
+        self._by_verb.pop(recipe.verb, None)
+        self._tries.pop(recipe.verb, None)
+        key = recipe.key
+        bucket = self._index.get(key, [])
+        if recipe in bucket:
+            bucket.remove(recipe)
+        if not bucket:
+            self._index.pop(key, None)
+        self._planner = None
+        self._search = None
+        # Removal can only shrink reachability; rebuilt on next use
+        self._graph = None
+            
     def find_recipe(self, verb_name: str, card_titles: List[str]) -> Optional[Recipe]:
-        for recipe in self.recipes:
-            if recipe.matches(verb_name, card_titles):
-                return recipe
-        return None
+        # Several recipes may share a key; the earliest one wins, as with a linear scan
+        bucket = self._index.get(recipe_key(verb_name, card_titles))
+        return bucket[0] if bucket else None
+        
+    def for_verb(self, verb_name: str) -> Tuple[Recipe, ...]:
+        # Computed once per verb and shared by every station of that verb
+        view = self._by_verb.get(verb_name)
+        if view is None:
+            view = self._by_verb[verb_name] = tuple(r for r in self.recipes if r.verb == verb_name)
+        return view
         
     def get_recipes_for_verb(self, verb_name: str) -> List[Recipe]:
-        return [r for r in self.recipes if r.verb == verb_name]
\ No newline at end of file
+        return list(self.for_verb(verb_name))
+        
+    def trie(self, verb_name: str):
+        # Partial-match index of one verb, built on first use
+        trie = self._tries.get(verb_name)
+        if trie is None:
+            from .recipe_trie import RecipeTrie
+            trie = self._tries[verb_name] = RecipeTrie(self.for_verb(verb_name))
+        return trie
+        
+    def completions(self, verb_name: str, card_titles: Sequence[str]) -> Sequence[Recipe]:
+        # Every recipe of the verb that the placed cards are a start of
+        return self.trie(verb_name).completions(card_titles)
+        
+    @property
+    def graph(self):
+        # Reachability from the starting cards, updated in place by add_recipe
+        if self._graph is None:
+            from .content import starting_titles
+            from .recipe_graph import RecipeGraph
+            self._graph = RecipeGraph(self.recipes, starting_titles())
+        return self._graph
+        
+    @property
+    def search_index(self):
+        # Word index for the recipe book search box, built on first search
+        if self._search is None:
+            from .recipe_search import RecipeIndex
+            self._search = RecipeIndex(self.recipes)
+        return self._search
+        
+    @property
+    def planner(self):
+        # Solved on first use and kept until the book changes
+        if self._planner is None:
+            from .planner import CraftingPlanner
+            self._planner = CraftingPlanner(self.recipes)
+        return self._planner
+        
+    def plan(self, target: str, count: int = 1, inventory: Optional[Mapping[str, int]] = None):
+        """Crafting tree for target: steps by stage, raw inputs still needed,
+        total and parallel crafting time. Raises PlanningError."""
+        return self.planner.plan(target, count=count, inventory=inventory)
+        
+    def plan_many(self, targets: List[str], inventory: Optional[Mapping[str, int]] = None,
+                  processes: Optional[int] = None) -> list:
+        # One plan (or PlanningError) per target, solved across a process pool
+        from .planner import plan_many
+        return plan_many(self.recipes, targets, inventory=inventory, processes=processes)
\ No newline at end of file
@@ -0,0 +1,130 @@
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+
+class CardHandle(NamedTuple):
+    """Stable reference to a registered card.
+
+    The slot is reused once the card is removed, with its generation bumped,
+    so a handle kept past the card's removal resolves to None instead of
+    to whatever card lives in that slot now.
+    """
+    slot: int
+    generation: int
+
+
+class CardRegistry:
+    """Live cards by id, title and type, with generation-tagged handles.
+
+    Adding and removing are O(1) and removal drops the card from every
+    index, so the registry is as large as the table, not as large as
+    everything ever spawned. It reads like the id -> card dict it replaces
+    (len, iteration over ids, [], get, values, in). Title and type
+    indexes are insertion-ordered dicts so lookups iterate
+    deterministically.
+    """
+
+    def __init__(self):
+        self._by_id: Dict[int, object] = {}
+        self._by_title: Dict[str, Dict[int, object]] = {}
+        self._by_type: Dict[str, Dict[int, object]] = {}
+        self._slots: List[Optional[object]] = []
+        self._generations: List[int] = []
+        self._free: List[int] = []
+
+    def __len__(self):
+        return len(self._by_id)
+
+    @property
+    def capacity(self) -> int:
+        # Slots allocated so far: the most cards ever live at once
+        return len(self._slots)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._by_id)
+
+    def __contains__(self, card_id):
+        return card_id in self._by_id
+
+    def __getitem__(self, card_id: int):
+        return self._by_id[card_id]
+
+    def get(self, card_id: int, default=None):
+        return self._by_id.get(card_id, default)
+
+    def values(self):
+        return self._by_id.values()
+
+    def with_title(self, title: str):
+        return self._by_title.get(title, {}).values()
+
+    def with_type(self, card_type: str):
+        return self._by_type.get(card_type, {}).values()
+
+    def add(self, card) -> CardHandle:
+        if card.id in self._by_id:
+            raise ValueError(f"card {card.id} is already registered")
+        if self._free:
+            slot = self._free.pop()
+            self._slots[slot] = card
+        else:
+            slot = len(self._slots)
+            self._slots.append(card)
+            self._generations.append(0)
+        card.handle = CardHandle(slot, self._generations[slot])
+
+        self._by_id[card.id] = card
+        self._by_title.setdefault(card.title, {})[card.id] = card
+        self._by_type.setdefault(card.card_type, {})[card.id] = card
+        return card.handle
+
+    def add_many(self, cards):
+        # Bulk add into an empty registry (snapshot loads), slots in order
+        if self._by_id:
+            for card in cards:
+                self.add(card)
+            return
+        by_id, by_title, by_type = self._by_id, self._by_title, self._by_type
+        slots = self._slots = list(cards)
+        self._generations = [0] * len(slots)
+        self._free = []
+        for slot, card in enumerate(slots):
+            card.handle = CardHandle(slot, 0)
+            by_id[card.id] = card
+            titled = by_title.get(card.title)
+            if titled is None:
+                titled = by_title[card.title] = {}
+            titled[card.id] = card
+            typed = by_type.get(card.card_type)
+            if typed is None:
+                typed = by_type[card.card_type] = {}
+            typed[card.id] = card
+        if len(by_id) != len(slots):
+            raise ValueError("duplicate card ids")
+
+    def remove(self, card) -> bool:
+        if self._by_id.get(card.id) is not card:
+            return False
+        del self._by_id[card.id]
+        self._unindex(self._by_title, card.title, card.id)
+        self._unindex(self._by_type, card.card_type, card.id)
+
+        slot = card.handle.slot
+        self._slots[slot] = None
+        self._generations[slot] += 1
+        self._free.append(slot)
+        return True
+
+    def resolve(self, handle: Optional[CardHandle]):
+        # The card a handle refers to, or None once it has been removed
+        if handle is None or handle.slot >= len(self._slots):
+            return None
+        if self._generations[handle.slot] != handle.generation:
+            return None
+        return self._slots[handle.slot]
+
+    @staticmethod
+    def _unindex(index: Dict[str, Dict[int, object]], key: str, card_id: int):
+        bucket = index[key]
+        del bucket[card_id]
+        if not bucket:
+            del index[key]
@@ -0,0 +1,255 @@
+import hashlib
+import struct
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+from .events import CardSpawned, RecipeQueued, RecipeStarted
+from .recipes import RecipeBook
+from .simulation import SimCard, SimVerb, Workshop
+from .snapshot import SnapshotError, dumps, loads
+
+
+# Layout (little-endian):
+#   header | zlib(starting snapshot | entries)
+# Every entry is a kind and the tick it happened after, then a payload by
+# kind. Player inputs (pickup, move, drop) are applied on replay; spawns and
+# accepted card sets are checked against what the replay does; the end
+# entry holds the state hash to finish on.
+REPLAY_MAGIC = b"WWRP"
+REPLAY_VERSION = 1
+
+_HEADER = struct.Struct("<4sHI")  # magic, version, snapshot size
+_ENTRY = struct.Struct("<BI")     # kind, tick
+
+PICKUP, MOVE, DROP, SPAWN, ACCEPT, END = range(6)
+_PAYLOADS = {
+    PICKUP: struct.Struct("<I3d"),  # card id, position
+    MOVE: struct.Struct("<I3d"),
+    DROP: struct.Struct("<I3di"),   # card id, position, verb index or -1
+    SPAWN: struct.Struct("<II"),    # generator index, card id
+    ACCEPT: struct.Struct("<IIB"),  # verb index, crc32 of the recipe output, queued
+    END: struct.Struct("<32s"),     # state hash
+}
+
+PathLike = Union[str, Path]
+
+
+class ReplayError(ValueError):
+    pass
+
+
+class ReplayDivergence(ReplayError):
+    """The replay did something the recorded session did not."""
+
+
+def state_hash(workshop: Workshop) -> bytes:
+    # Over the simulation state itself: the same session replayed gives the
+    # same hash whatever views or tools had events on the scheduler
+    digest = hashlib.blake2b(digest_size=32)
+    pack = struct.pack
+    digest.update(pack("<qQQ", workshop.tick, workshop._next_card_id, workshop.crafted_count))
+    digest.update(repr(workshop.random.getstate()).encode())
+    for card in workshop.cards.values():
+        digest.update(pack("<Q3dd?q", card.id, *card.position, card.created_at, card.alive,
+                           card.expiry.tick if card.expiry and not card.expiry.cancelled else -1))
+        digest.update(card.title.encode())
+    for verb in workshop.verbs:
+        digest.update(pack("<II", verb.slots, verb.crafted))
+        digest.update(b"".join(pack("<Q", card.id) for card in verb.active_cards))
+        for craft in (*verb.crafts, *verb.backlog):
+            digest.update(craft.recipe.output.encode())
+            digest.update(pack("<d", craft.start))
+            digest.update(b"".join(pack("<Q", card.id) for card in craft.cards))
+    for generator in workshop.generators:
+        event = generator.next_generation
+        digest.update(pack("<dq", generator.last_generation, event.tick if event and not event.cancelled else -1))
+    return digest.digest()
+
+
+class ReplayRecorder:
+    """Records a session on a workshop from now on.
+
+    The views call pickup(), move() and drop() for player input; spawns and
+    accepted card sets are picked up from the workshop's events. Moves of
+    one card within a tick are kept as one entry, the last. Sessions with
+    automation routes replay without them, so they diverge.
+    """
+
+    def __init__(self, workshop: Workshop, environment_time: float = 0.0):
+        self.workshop = workshop
+        snapshot = dumps(workshop, environment_time)
+        self.snapshot_size = len(snapshot)
+        self.buffer = bytearray(snapshot)  # compressed by finish()
+        self.entries = 0
+        self.start_tick = workshop.tick
+        self._last_move = None  # (card id, tick, offset) of the newest entry if it is a move
+        self._verb_index = {verb: index for index, verb in enumerate(workshop.verbs)}
+        self._generator_index = {generator: index for index, generator in enumerate(workshop.generators)}
+        events = workshop.events
+        events.subscribe(CardSpawned, self._on_spawned)
+        events.subscribe(RecipeStarted, self._on_started)
+        events.subscribe(RecipeQueued, self._on_queued)
+
+    def _add(self, kind: int, *payload):
+        self._last_move = None
+        self.buffer += _ENTRY.pack(kind, self.workshop.tick)
+        self.buffer += _PAYLOADS[kind].pack(*payload)
+        self.entries += 1
+
+    # Player input
+
+    def pickup(self, card: SimCard):
+        if card.alive:
+            self._add(PICKUP, card.id, *card.position)
+
+    def move(self, card: SimCard):
+        if not card.alive:
+            return
+        tick = self.workshop.tick
+        last = self._last_move
+        if last and last[0] == card.id and last[1] == tick:
+            _PAYLOADS[MOVE].pack_into(self.buffer, last[2] + _ENTRY.size, card.id, *card.position)
+            return
+        offset = len(self.buffer)
+        self._add(MOVE, card.id, *card.position)
+        self._last_move = (card.id, tick, offset)
+
+    def drop(self, card: SimCard, verb: Optional[SimVerb] = None):
+        # Where it was let go, and the verb it was then placed on
+        if card.alive:
+            self._add(DROP, card.id, *card.position, self._verb_index[verb] if verb else -1)
+
+    # Checks
+
+    def _on_spawned(self, event: CardSpawned):
+        self._add(SPAWN, self._generator_index[event.generator], event.card.id)
+
+    def _on_started(self, event: RecipeStarted):
+        self._add(ACCEPT, self._verb_index[event.verb], zlib.crc32(event.recipe.output.encode()), False)
+
+    def _on_queued(self, event: RecipeQueued):
+        self._add(ACCEPT, self._verb_index[event.verb], zlib.crc32(event.recipe.output.encode()), True)
+
+    def finish(self) -> bytes:
+        # The recording with its end entry; the recorder stops listening
+        self._add(END, state_hash(self.workshop))
+        events = self.workshop.events
+        events.unsubscribe(CardSpawned, self._on_spawned)
+        events.unsubscribe(RecipeStarted, self._on_started)
+        events.unsubscribe(RecipeQueued, self._on_queued)
+        return _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.snapshot_size) + zlib.compress(self.buffer)
+
+    def save(self, path: PathLike) -> int:
+        data = self.finish()
+        Path(path).write_bytes(data)
+        return len(data)
+
+
+@dataclass
+class ReplayResult:
+    workshop: Workshop
+    entries: int
+    ticks: int
+    seconds: float  # wall time spent replaying
+    state_hash: bytes
+
+    @property
+    def speedup(self) -> float:
+        # Simulated time over wall time
+        return self.ticks * self.workshop.dt / self.seconds if self.seconds else float("inf")
+
+
+def replay(data: bytes, recipe_book: Optional[RecipeBook] = None, verify: bool = True) -> ReplayResult:
+    """Re-runs a recorded session headless, as fast as it will go.
+
+    With verify, every recorded spawn and accepted set must happen again,
+    in order, and the final state hash must match; ReplayDivergence says
+    where it first did not.
+    """
+    try:
+        magic, version, snapshot_size = _HEADER.unpack_from(data)
+    except struct.error as error:
+        raise ReplayError(f"corrupt replay: {error}") from error
+    if magic != REPLAY_MAGIC:
+        raise ReplayError("not a workshop replay")
+    if version != REPLAY_VERSION:
+        raise ReplayError(f"unsupported replay version {version}")
+    try:
+        view = memoryview(zlib.decompress(memoryview(data)[_HEADER.size:]))
+        workshop = loads(bytes(view[:snapshot_size]), recipe_book).workshop
+    except (zlib.error, SnapshotError) as error:
+        raise ReplayError(f"corrupt replay: {error}") from error
+    offset = snapshot_size
+
+    observed = deque()
+    if verify:
+        verb_index = {verb: index for index, verb in enumerate(workshop.verbs)}
+        generator_index = {generator: index for index, generator in enumerate(workshop.generators)}
+        events = workshop.events
+        events.subscribe(CardSpawned, lambda event: observed.append(
+            (SPAWN, generator_index[event.generator], event.card.id)))
+        events.subscribe(RecipeStarted, lambda event: observed.append(
+            (ACCEPT, verb_index[event.verb], zlib.crc32(event.recipe.output.encode()), False)))
+        events.subscribe(RecipeQueued, lambda event: observed.append(
+            (ACCEPT, verb_index[event.verb], zlib.crc32(event.recipe.output.encode()), True)))
+
+    cards, verbs = workshop.cards, workshop.verbs
+    start_tick = workshop.tick
+    entries = 0
+    recorded_hash = None
+    start = time.perf_counter()
+    try:
+        while offset < len(view):
+            kind, tick = _ENTRY.unpack_from(view, offset)
+            payload = _PAYLOADS[kind].unpack_from(view, offset + _ENTRY.size)
+            offset += _ENTRY.size + _PAYLOADS[kind].size
+            entries += 1
+            if tick > workshop.tick:
+                workshop.run(tick - workshop.tick)
+
+            if kind in (PICKUP, MOVE, DROP):
+                card = cards.get(payload[0])
+                if card is None:
+                    if verify:
+                        raise ReplayDivergence(f"tick {tick}: card {payload[0]} is not on the table")
+                    continue
+                workshop.move_card(card, payload[1:4])
+                if kind == DROP and payload[4] >= 0:
+                    workshop.place_card(card, verbs[payload[4]])
+            elif kind == END:
+                recorded_hash = payload[0]
+                break
+            elif verify:
+                expected = (kind, *payload)
+                actual = observed.popleft() if observed else None
+                if actual != expected:
+                    raise ReplayDivergence(f"tick {tick}: recorded {_describe(expected)}, replay gave {_describe(actual)}")
+    except (struct.error, KeyError) as error:
+        raise ReplayError(f"corrupt replay: {error}") from error
+    elapsed = time.perf_counter() - start
+
+    final_hash = state_hash(workshop)
+    if verify:
+        if recorded_hash is None:
+            raise ReplayError("replay has no end entry")
+        if observed:
+            raise ReplayDivergence(f"replay gave {_describe(observed[0])} that the session did not")
+        if final_hash != recorded_hash:
+            raise ReplayDivergence(f"tick {workshop.tick}: final state hash differs")
+    return ReplayResult(workshop, entries, workshop.tick - start_tick, elapsed, final_hash)
+
+
+def replay_file(path: PathLike, recipe_book: Optional[RecipeBook] = None, verify: bool = True) -> ReplayResult:
+    return replay(Path(path).read_bytes(), recipe_book, verify)
+
+
+def _describe(entry) -> str:
+    if entry is None:
+        return "nothing"
+    if entry[0] == SPAWN:
+        return f"generator {entry[1]} spawning card {entry[2]}"
+    return f"verb {entry[1]} {'queueing' if entry[3] else 'starting'} recipe {entry[2]:08x}"
@@ -0,0 +1,150 @@
+import heapq
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(eq=False)
+class ScheduledEvent:
+    tick: int
+    callback: Callable
+    args: Tuple[Any, ...] = ()
+    cancelled: bool = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimingWheel:
+    """Hashed timing wheel for many short-lived, often-cancelled timers.
+
+    Scheduling and cancelling are O(1) and a tick only looks at one slot.
+    Deadlines further out than one turn of the wheel stay in their slot
+    until the wheel comes round to the right tick.
+    """
+
+    def __init__(self, size: int = 4096):
+        # Slots are created on demand so an idle wheel costs nothing
+        self.size = size
+        self.slots: Dict[int, List[ScheduledEvent]] = {}
+        self.tick = 0
+        self.pending = 0
+
+    def __len__(self):
+        return self.pending
+
+    def schedule_at(self, tick: int, callback: Callable, *args) -> ScheduledEvent:
+        event = ScheduledEvent(tick=max(tick, self.tick + 1), callback=callback, args=args)
+        self.slots.setdefault(event.tick % self.size, []).append(event)
+        self.pending += 1
+        return event
+
+    def step(self, tick: int):
+        self.tick = tick
+        index = tick % self.size
+        slot = self.slots.pop(index, None)
+        if not slot:
+            return
+
+        due = [event for event in slot if event.tick <= tick]
+        if len(due) < len(slot):
+            self.slots[index] = [event for event in slot if event.tick > tick]
+        self.pending -= len(due)
+
+        for event in due:
+            if not event.cancelled:
+                event.callback(*event.args)
+
+
+class Scheduler:
+    """Fixed-tick simulation clock with a deadline queue.
+
+    Events are kept in a heap ordered by (tick, insertion order), so each
+    tick only touches the events that are due and two runs from the same
+    seed and inputs fire everything in the same order. High-volume timers
+    (card lifetimes) go on a timing wheel instead, which fires after the
+    heap within a tick.
+    """
+
+    def __init__(self, tick_rate: int = 60, seed: Optional[int] = None):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.tick = 0
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.paused = False
+        self.speed = 1.0
+        self.max_frame_time = 0.25  # wall seconds caught up per advance()
+        self._accumulator = 0.0
+        self._queue: List[Tuple[int, int, ScheduledEvent]] = []
+        self._sequence = 0
+        self.timers = TimingWheel()
+
+    @property
+    def time(self) -> float:
+        return self.tick * self.dt
+
+    def __len__(self):
+        return len(self._queue)
+
+    def pending_events(self) -> List[ScheduledEvent]:
+        # Live heap events in the order they will fire
+        return [entry[2] for entry in sorted(self._queue) if not entry[2].cancelled]
+
+    def restore_clock(self, tick: int):
+        # Jump a fresh scheduler to a saved tick before re-adding its events
+        self.tick = tick
+        self.timers.tick = tick
+        self._accumulator = 0.0
+
+    def ticks_for(self, seconds: float) -> int:
+        # Round up so nothing fires early; the epsilon absorbs float noise (30s -> 1800 ticks)
+        return max(1, math.ceil(seconds * self.tick_rate - 1e-9))
+
+    def schedule_at(self, tick: int, callback: Callable, *args) -> ScheduledEvent:
+        event = ScheduledEvent(tick=max(tick, self.tick + 1), callback=callback, args=args)
+        heapq.heappush(self._queue, (event.tick, self._sequence, event))
+        self._sequence += 1
+        return event
+
+    def schedule_in(self, seconds: float, callback: Callable, *args) -> ScheduledEvent:
+        return self.schedule_at(self.tick + self.ticks_for(seconds), callback, *args)
+
+    def schedule_timer_in(self, seconds: float, callback: Callable, *args) -> ScheduledEvent:
+        return self.timers.schedule_at(self.tick + self.ticks_for(seconds), callback, *args)
+
+    def advance(self, elapsed: float) -> int:
+        # Turn wall-clock frame time into whole ticks, honouring pause and speed
+        if self.paused:
+            return 0
+
+        self._accumulator += elapsed * self.speed
+        max_ticks = max(1, int(self.max_frame_time * self.speed * self.tick_rate))
+        ticks = 0
+        while self._accumulator >= self.dt and ticks < max_ticks:
+            self._accumulator -= self.dt
+            self.step()
+            ticks += 1
+        if self._accumulator >= self.dt:
+            # Too far behind; drop the backlog instead of spiralling
+            self._accumulator = 0.0
+        return ticks
+
+    def run(self, ticks: int):
+        for _ in range(ticks):
+            self.step()
+
+    def run_until(self, seconds: float):
+        target = round(seconds * self.tick_rate)
+        while self.tick < target:
+            self.step()
+
+    def step(self):
+        self.tick += 1
+        queue = self._queue
+        while queue and queue[0][0] <= self.tick:
+            event = heapq.heappop(queue)[2]
+            if not event.cancelled:
+                event.callback(*event.args)
+        self.timers.step(self.tick)
@@ -0,0 +1,451 @@
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from .content import (
+    GENERATOR_LAYOUT,
+    SPAWN_OFFSETS,
+    STARTER_CARDS,
+    VERB_LAYOUT,
+    card_type_for,
+    generator_config,
+)
+from .events import (
+    CardConsumed,
+    CardCreated,
+    CardDropped,
+    CardExpired,
+    CardSpawned,
+    EventBus,
+    RecipeCompleted,
+    RecipeQueued,
+    RecipeRejected,
+    RecipeStarted,
+)
+from .inventory import Inventory
+from .recipes import Recipe, RecipeBook
+from .registry import CardHandle, CardRegistry
+from .scheduler import ScheduledEvent, Scheduler
+from .spatial import SpatialGrid
+
+
+Vec = Tuple[float, float, float]
+
+
+def add(a: Vec, b: Vec) -> Vec:
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+
+@dataclass(eq=False)
+class SimCard:
+    id: int
+    title: str
+    card_type: str
+    position: Vec
+    created_at: float
+    lifetime: Optional[float] = None
+    is_resource: bool = False
+    verb: Optional["SimVerb"] = None
+    alive: bool = True
+    expiry: Optional[ScheduledEvent] = None
+    handle: Optional[CardHandle] = None
+
+    def remaining(self, now: float) -> float:
+        # Fraction of the lifetime left, 1.0 for cards that never expire
+        if not self.lifetime:
+            return 1.0
+        return max(0.0, 1 - (now - self.created_at) / self.lifetime)
+
+
+@dataclass(eq=False)
+class Craft:
+    # A matched card set, waiting in a verb's backlog or running in one of its slots
+    verb: "SimVerb"
+    recipe: Recipe
+    cards: List[SimCard]
+    start: float = 0.0
+    completion: Optional[ScheduledEvent] = None
+
+    def progress(self, now: float) -> float:
+        if self.completion is None:
+            return 0.0
+        return min(1.0, (now - self.start) / self.recipe.time) if self.recipe.time > 0 else 1.0
+
+
+@dataclass(eq=False)
+class SimVerb:
+    name: str
+    position: Vec
+    scale: Vec = (1, 1, 1)
+    slots: int = 1
+    active_cards: List[SimCard] = field(default_factory=list)  # dropped cards not yet matching a recipe
+    crafts: List[Craft] = field(default_factory=list)  # running, oldest first
+    backlog: Deque[Craft] = field(default_factory=deque)  # matched sets waiting for a free slot
+
+    # Metrics since metrics_since: crafts finished, slot-seconds spent on
+    # them and slot-seconds available (banked whenever slots changes)
+    crafted: int = 0
+    busy_time: float = 0.0
+    capacity_time: float = 0.0
+    metrics_since: float = 0.0
+    slots_since: float = 0.0
+
+    @property
+    def is_processing(self) -> bool:
+        return bool(self.crafts)
+
+    @property
+    def free_slots(self) -> int:
+        return max(0, self.slots - len(self.crafts))
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self.backlog)
+
+    @property
+    def zone_size(self) -> Tuple[float, float]:
+        # As drawn: the view's zone is scaled 1.2x the verb's scale, in the
+        # verb's own (already scaled) space
+        return (self.scale[0] ** 2 * 1.2, self.scale[2] ** 2 * 1.2)
+
+    def progress(self, now: float) -> float:
+        # Of the running craft furthest along
+        if not self.crafts:
+            return 0.0
+        return max(craft.progress(now) for craft in self.crafts)
+
+    def utilisation(self, now: float) -> float:
+        # Share of slot time spent crafting since metrics_since
+        busy = self.busy_time + sum(now - craft.start for craft in self.crafts)
+        capacity = self.capacity_time + self.slots * (now - self.slots_since)
+        return min(1.0, busy / capacity) if capacity > 0 else 0.0
+
+    def throughput(self, now: float) -> float:
+        # Crafts finished per simulated minute since metrics_since
+        elapsed = now - self.metrics_since
+        return self.crafted * 60 / elapsed if elapsed > 0 else 0.0
+
+    def metrics(self, now: float) -> Dict[str, float]:
+        return {
+            "slots": self.slots,
+            "running": len(self.crafts),
+            "queue_depth": len(self.backlog),
+            "crafted": self.crafted,
+            "per_minute": self.throughput(now),
+            "utilisation": self.utilisation(now),
+        }
+
+    def reset_metrics(self, now: float):
+        self.crafted = 0
+        self.busy_time = self.capacity_time = 0.0
+        self.metrics_since = self.slots_since = now
+        # Running crafts count from here on
+        for craft in self.crafts:
+            self.busy_time -= now - craft.start
+
+    def contains(self, position) -> bool:
+        width, depth = self.zone_size
+        return (abs(position[0] - self.position[0]) < width / 2 and
+                abs(position[2] - self.position[2]) < depth / 2)
+
+    def slot_position(self, index: int, count: int, layer: int = 0) -> Vec:
+        # Cards sit in a circle above the station, raised a layer for each
+        # set already crafting or queued underneath
+        angle = math.radians(index * (360 / max(count, 1)))
+        return add(self.position, (math.cos(angle) * 0.8, self.scale[1] + 0.6 + layer * 0.4, math.sin(angle) * 0.8))
+
+
+@dataclass(eq=False)
+class SimGenerator:
+    card_type: str
+    position: Vec
+    interval: float
+    card_title: str = "Resource"
+    lifetime: Optional[float] = None
+    is_resource: bool = False
+    last_generation: float = 0.0
+    is_active: bool = True
+    next_generation: Optional[ScheduledEvent] = None
+
+
+class Workshop:
+    """Headless model of a workshop, advanced in fixed timesteps.
+
+    The Ursina entities are views over this state: they call into it for
+    player actions and react to the events it publishes on self.events.
+    Lifetimes, generator intervals and recipe timers are deadlines on the
+    scheduler, so a tick only does work for what is due.
+    """
+
+    def __init__(self, recipe_book: Optional[RecipeBook] = None, tick_rate: int = 60,
+                 scheduler: Optional[Scheduler] = None, seed: Optional[int] = None):
+        self.recipe_book = recipe_book or RecipeBook.shared()
+        if scheduler is None:
+            scheduler = Scheduler(tick_rate=tick_rate, seed=seed)
+        self.scheduler = scheduler
+        self.random = self.scheduler.random
+        self._next_card_id = 1
+
+        self.cards = CardRegistry()
+        self.verbs: List[SimVerb] = []
+        self.generators: List[SimGenerator] = []
+        self.card_grid = SpatialGrid(cell_size=2.0)
+        self.verb_grid = SpatialGrid(cell_size=4.0)
+        self.inventory = Inventory()
+        self.crafted_count = 0
+
+        # Views and tools subscribe to the events in events.py
+        self.events = EventBus()
+
+    @classmethod
+    def default(cls, **kwargs) -> "Workshop":
+        workshop = cls(**kwargs)
+        workshop.populate_default()
+        return workshop
+
+    @property
+    def time(self) -> float:
+        return self.scheduler.time
+
+    @property
+    def tick(self) -> int:
+        return self.scheduler.tick
+
+    @property
+    def dt(self) -> float:
+        return self.scheduler.dt
+
+    def populate_default(self):
+        for layout in VERB_LAYOUT:
+            self.add_verb(**layout)
+        for layout in GENERATOR_LAYOUT:
+            self.add_generator(**layout)
+        for card in STARTER_CARDS:
+            self.create_card(**card)
+
+    # Setup
+
+    def add_verb(self, name: str, position: Vec, scale: Vec = (1, 1, 1), slots: int = 1) -> SimVerb:
+        if slots < 1:
+            raise ValueError(f"a verb needs at least one crafting slot, got {slots}")
+        verb = SimVerb(name=name, position=tuple(position), scale=tuple(scale), slots=slots,
+                       metrics_since=self.time, slots_since=self.time)
+        self.verbs.append(verb)
+        self.verb_grid.insert(verb, verb.position, extent=max(verb.zone_size) / 2)
+        return verb
+
+    def add_generator(self, card_type: str, position: Vec, interval: float) -> SimGenerator:
+        config = generator_config(card_type)
+        generator = SimGenerator(
+            card_type=card_type,
+            position=tuple(position),
+            interval=interval,
+            card_title=config["card_title"],
+            lifetime=config.get("lifetime"),
+            is_resource=config.get("is_resource", False),
+            last_generation=self.time,
+        )
+        self.generators.append(generator)
+        generator.next_generation = self.scheduler.schedule_in(interval, self._on_generator_due, generator)
+        return generator
+
+    # Cards
+
+    def create_card(self, position: Vec, title: str, card_type: Optional[str] = None,
+                    lifetime: Optional[float] = None, is_resource: bool = False) -> SimCard:
+        card = SimCard(
+            id=self._next_card_id,
+            title=title,
+            card_type=card_type or card_type_for(title),
+            position=tuple(position),
+            created_at=self.time,
+            lifetime=lifetime,
+            is_resource=is_resource,
+        )
+        self._next_card_id += 1
+        self.cards.add(card)
+        self.card_grid.insert(card, card.position)
+        self.inventory.add(card.title, card.card_type)
+        if lifetime:
+            card.expiry = self.scheduler.schedule_timer_in(lifetime, self.remove_card, card, "expired")
+        self.events.publish(CardCreated(card))
+        return card
+
+    def move_card(self, card: SimCard, position: Vec):
+        card.position = tuple(position)
+        self.card_grid.move(card, card.position)
+
+    def remove_card(self, card: SimCard, reason: str):
+        # reason is "expired" or "consumed"
+        if not card.alive:
+            return
+        self._unregister(card)
+        self._detach(card)
+        self.events.publish(CardExpired(card) if reason == "expired" else CardConsumed(card))
+
+    def _unregister(self, card: SimCard):
+        card.alive = False
+        if card.expiry:
+            card.expiry.cancel()
+        self.cards.remove(card)
+        self.card_grid.remove(card)
+        self.inventory.remove(card.title, card.card_type)
+
+    def _detach(self, card: SimCard):
+        # Takes the card off its verb's tray or out of its queued set
+        verb = card.verb
+        card.verb = None
+        if verb:
+            if card in verb.active_cards:
+                verb.active_cards.remove(card)
+            elif verb.backlog:
+                self._leave_backlog(verb, card)
+
+    def is_position_occupied(self, position, threshold: float = 1.5) -> bool:
+        return self.card_grid.any_within(position, threshold)
+
+    # Verbs
+
+    def verb_at(self, position) -> Optional[SimVerb]:
+        # Zones can overlap (the ritual circle reaches the forge and study):
+        # the verb whose centre is closest wins
+        found, closest = None, math.inf
+        for verb in self.verb_grid.nearby(position):
+            if verb.contains(position):
+                distance = (position[0] - verb.position[0]) ** 2 + (position[2] - verb.position[2]) ** 2
+                if distance < closest:
+                    found, closest = verb, distance
+        return found
+
+    def place_card(self, card: SimCard, verb: SimVerb) -> bool:
+        # A card already on this verb, or crafting anywhere, stays put
+        previous = card.verb
+        if previous is verb:
+            return False
+        if previous and any(card in craft.cards for craft in previous.crafts):
+            return False
+        self._detach(card)
+
+        verb.active_cards.append(card)
+        card.verb = verb
+        layer = len(verb.crafts) + len(verb.backlog)
+        self.move_card(card, verb.slot_position(len(verb.active_cards) - 1, len(verb.active_cards), layer))
+        self.events.publish(CardDropped(card, verb))
+
+        self.check_recipe(verb)
+        return True
+
+    def check_recipe(self, verb: SimVerb):
+        card_titles = [card.title for card in verb.active_cards]
+        recipe = self.recipe_book.find_recipe(verb.name, card_titles)
+
+        if recipe:
+            # The set leaves the tray, so more cards can be dropped straight away
+            craft = Craft(verb, recipe, list(verb.active_cards))
+            verb.active_cards.clear()
+            if verb.free_slots:
+                self.start_craft(craft)
+            else:
+                verb.backlog.append(craft)
+                self.events.publish(RecipeQueued(verb, recipe))
+        elif len(verb.active_cards) >= 2 and not self.recipe_book.completions(verb.name, card_titles):
+            self.events.publish(RecipeRejected(verb))
+
+    def start_craft(self, craft: Craft):
+        verb = craft.verb
+        craft.start = self.time
+        craft.completion = self.scheduler.schedule_in(craft.recipe.time, self.complete_craft, craft)
+        verb.crafts.append(craft)
+        self.events.publish(RecipeStarted(verb, craft.recipe))
+
+    def set_slots(self, verb: SimVerb, slots: int):
+        # Running crafts finish even when slots shrinks below their number
+        if slots < 1:
+            raise ValueError(f"a verb needs at least one crafting slot, got {slots}")
+        verb.capacity_time += verb.slots * (self.time - verb.slots_since)
+        verb.slots_since = self.time
+        verb.slots = slots
+        self._start_backlog(verb)
+
+    def _start_backlog(self, verb: SimVerb):
+        while verb.backlog and verb.free_slots:
+            self.start_craft(verb.backlog.popleft())
+
+    def _leave_backlog(self, verb: SimVerb, card: SimCard):
+        # A queued set lost a card: it no longer makes its recipe, so the
+        # rest of it goes back on the tray
+        for craft in verb.backlog:
+            if card in craft.cards:
+                verb.backlog.remove(craft)
+                craft.cards.remove(card)
+                verb.active_cards.extend(craft.cards)
+                self.check_recipe(verb)
+                return
+
+    def suggest_recipes(self, verb: SimVerb, extra_titles: Sequence[str] = (), limit: int = 3):
+        # (recipe, missing titles) still completable from the verb's cards plus extra_titles
+        card_titles = [card.title for card in verb.active_cards]
+        card_titles.extend(extra_titles)
+        return self.recipe_book.trie(verb.name).suggest(card_titles, limit=limit)
+
+    def complete_craft(self, craft: Craft):
+        verb, recipe = craft.verb, craft.recipe
+        verb.crafts.remove(craft)
+        craft.completion = None
+
+        # The set left every tray when it matched, and place_card keeps
+        # crafting cards where they are
+        for card in craft.cards:
+            card.verb = None
+            if card.alive:
+                self._unregister(card)
+                self.events.publish(CardConsumed(card))
+
+        output = self.create_card(position=add(verb.position, (0, 0.1, -3)), title=recipe.output)
+        self.crafted_count += 1
+        verb.crafted += 1
+        verb.busy_time += self.time - craft.start
+        self.events.publish(RecipeCompleted(verb, recipe, output))
+        self._start_backlog(verb)
+
+    def station_metrics(self) -> List[Dict[str, float]]:
+        # SimVerb.metrics for every verb, with its name
+        now = self.time
+        return [{"name": verb.name, **verb.metrics(now)} for verb in self.verbs]
+
+    # Generators
+
+    def generate_card(self, generator: SimGenerator) -> Optional[SimCard]:
+        for offset in SPAWN_OFFSETS:
+            spawn_pos = add(generator.position, offset)
+            if not self.is_position_occupied(spawn_pos):
+                card = self.create_card(
+                    position=spawn_pos,
+                    title=generator.card_title,
+                    card_type=generator.card_type,
+                    lifetime=generator.lifetime,
+                    is_resource=generator.is_resource,
+                )
+                self.events.publish(CardSpawned(generator, card))
+                return card
+        return None
+
+    def _on_generator_due(self, generator: SimGenerator):
+        if generator.is_active:
+            self.generate_card(generator)
+        generator.last_generation = self.time
+        generator.next_generation = self.scheduler.schedule_in(
+            generator.interval, self._on_generator_due, generator
+        )
+
+    # Time
+
+    def advance(self, elapsed: float) -> int:
+        return self.scheduler.advance(elapsed)
+
+    def run(self, ticks: int):
+        self.scheduler.run(ticks)
+
+    def step(self):
+        self.scheduler.step()
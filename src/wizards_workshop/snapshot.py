@@ -0,0 +1,301 @@
+import math
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .gcutil import gc_paused
+from .recipes import Recipe, RecipeBook
+from .simulation import Craft, SimCard, SimGenerator, Workshop
+
+
+# Layout (little-endian), written and read in one go:
+#   header | clock | random state | string table | card columns | verbs | crafts | generators
+# Cards are stored column by column (ids, titles, types, positions, ...) with
+# titles and types as indices into one interned string table. Each verb's
+# running crafts are followed by its backlog in the crafts section.
+SNAPSHOT_MAGIC = b"WWSN"
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct("<4sH")
+_CLOCK = struct.Struct("<IqQQdBq")       # tick rate, tick, next card id, crafted, environment time, has seed, seed
+_RANDOM = struct.Struct("<Id")           # random state version, gauss_next (NaN for none)
+_COUNT = struct.Struct("<I")
+_VERB = struct.Struct("<I3d3dIQddddIII")  # name, position, scale, slots, crafted, busy/capacity time, metrics/slots since, crafts, queued, cards
+_CRAFT = struct.Struct("<dqqIdII")        # start, completion tick/rank, recipe output, time, inputs, cards
+_GENERATOR = struct.Struct("<I3ddIdBdBqq")
+_NO_STRING = 0xFFFFFFFF
+_SWAP = sys.byteorder == "big"
+
+PathLike = Union[str, Path]
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+@dataclass
+class Snapshot:
+    workshop: Workshop
+    environment_time: float = 0.0
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        index = self.index.get(value)
+        if index is None:
+            index = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.view = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, layout: struct.Struct):
+        values = layout.unpack_from(self.view, self.offset)
+        self.offset += layout.size
+        return values
+
+    def array(self, typecode: str) -> array:
+        count, = self.unpack(_COUNT)
+        values = array(typecode)
+        end = self.offset + count * values.itemsize
+        if end > len(self.view):
+            raise SnapshotError("snapshot is truncated")
+        values.frombytes(self.view[self.offset:end])
+        self.offset = end
+        if _SWAP:
+            values.byteswap()
+        return values
+
+
+def _put_array(chunks: List[bytes], values: array):
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    chunks.append(_COUNT.pack(len(values)))
+    chunks.append(values.tobytes())
+
+
+def _live_tick(event) -> int:
+    return event.tick if event and not event.cancelled else -1
+
+
+# Saving
+
+def dumps(workshop: Workshop, environment_time: float = 0.0) -> bytes:
+    scheduler = workshop.scheduler
+    strings = _StringTable()
+    intern = strings.intern
+    chunks: List[bytes] = [_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION)]
+
+    seed = scheduler.seed
+    has_seed = isinstance(seed, int) and -2 ** 63 <= seed < 2 ** 63
+    chunks.append(_CLOCK.pack(scheduler.tick_rate, scheduler.tick, workshop._next_card_id,
+                              workshop.crafted_count, environment_time, has_seed, seed if has_seed else 0))
+
+    version, state, gauss_next = scheduler.random.getstate()
+    chunks.append(_RANDOM.pack(version, math.nan if gauss_next is None else gauss_next))
+    _put_array(chunks, array("I", state))
+
+    # Heap events are re-added in firing order on load
+    rank = {event: i for i, event in enumerate(scheduler.pending_events())}
+
+    cards = list(workshop.cards.values())
+    card_columns = (
+        array("Q", [card.id for card in cards]),
+        array("I", [intern(card.title) for card in cards]),
+        array("I", [intern(card.card_type) for card in cards]),
+        array("d", [value for card in cards for value in card.position]),
+        array("d", [card.created_at for card in cards]),
+        array("d", [card.lifetime or 0.0 for card in cards]),
+        array("B", [card.is_resource for card in cards]),
+        array("q", [_live_tick(card.expiry) for card in cards]),
+    )
+
+    verb_records = []
+    craft_records = []
+    recipe_inputs = array("I")
+    active_cards = array("Q")
+    for verb in workshop.verbs:
+        active_cards.extend(card.id for card in verb.active_cards)
+        verb_records.append(_VERB.pack(
+            intern(verb.name), *verb.position, *verb.scale, verb.slots, verb.crafted,
+            verb.busy_time, verb.capacity_time, verb.metrics_since, verb.slots_since,
+            len(verb.crafts), len(verb.backlog), len(verb.active_cards),
+        ))
+        for craft in (*verb.crafts, *verb.backlog):
+            recipe = craft.recipe
+            recipe_inputs.extend(intern(title) for title in recipe.inputs)
+            active_cards.extend(card.id for card in craft.cards)
+            craft_records.append(_CRAFT.pack(
+                craft.start, _live_tick(craft.completion), rank.get(craft.completion, -1),
+                intern(recipe.output), recipe.time, len(recipe.inputs), len(craft.cards),
+            ))
+
+    generator_records = [
+        _GENERATOR.pack(
+            intern(generator.card_type), *generator.position, generator.interval,
+            intern(generator.card_title), generator.lifetime or 0.0, generator.is_resource,
+            generator.last_generation, generator.is_active,
+            _live_tick(generator.next_generation), rank.get(generator.next_generation, -1),
+        )
+        for generator in workshop.generators
+    ]
+
+    encoded = [value.encode("utf-8") for value in strings.strings]
+    _put_array(chunks, array("I", [len(value) for value in encoded]))
+    chunks.extend(encoded)
+
+    for column in card_columns:
+        _put_array(chunks, column)
+
+    chunks.append(_COUNT.pack(len(verb_records)))
+    chunks.extend(verb_records)
+    chunks.extend(craft_records)
+    _put_array(chunks, recipe_inputs)
+    _put_array(chunks, active_cards)
+
+    chunks.append(_COUNT.pack(len(generator_records)))
+    chunks.extend(generator_records)
+    return b"".join(chunks)
+
+
+def save_snapshot(path: PathLike, workshop: Workshop, environment_time: float = 0.0) -> int:
+    data = dumps(workshop, environment_time)
+    Path(path).write_bytes(data)
+    return len(data)
+
+
+# Loading
+
+def loads(data: bytes, recipe_book: Optional[RecipeBook] = None) -> Snapshot:
+    try:
+        with gc_paused():
+            return _loads(data, recipe_book)
+    except (struct.error, IndexError, KeyError, UnicodeDecodeError) as error:
+        raise SnapshotError(f"corrupt snapshot: {error}") from error
+
+
+def load_snapshot(path: PathLike, recipe_book: Optional[RecipeBook] = None) -> Snapshot:
+    return loads(Path(path).read_bytes(), recipe_book)
+
+
+def _loads(data: bytes, recipe_book: Optional[RecipeBook]) -> Snapshot:
+    reader = _Reader(data)
+    magic, version = reader.unpack(_HEADER)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("not a workshop snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+
+    tick_rate, tick, next_card_id, crafted_count, environment_time, has_seed, seed = reader.unpack(_CLOCK)
+    workshop = Workshop(recipe_book=recipe_book, tick_rate=tick_rate, seed=seed if has_seed else None)
+    scheduler = workshop.scheduler
+    scheduler.restore_clock(tick)
+    workshop._next_card_id = next_card_id
+    workshop.crafted_count = crafted_count
+
+    random_version, gauss_next = reader.unpack(_RANDOM)
+    state = tuple(reader.array("I"))
+    scheduler.random.setstate((random_version, state, None if math.isnan(gauss_next) else gauss_next))
+
+    lengths = reader.array("I")
+    strings = []
+    offset = reader.offset
+    for length in lengths:
+        strings.append(str(reader.view[offset:offset + length], "utf-8"))
+        offset += length
+    reader.offset = offset
+
+    ids, titles, types, positions, created, lifetimes, flags, expiries = (
+        reader.array(typecode) for typecode in ("Q", "I", "I", "d", "d", "d", "B", "q")
+    )
+    loaded = []
+    schedule_timer = scheduler.timers.schedule_at
+    remove_card = workshop.remove_card
+    for card_id, title, card_type, position, created_at, lifetime, flag, expiry in zip(
+        ids, titles, types, zip(*[iter(positions)] * 3), created, lifetimes, flags, expiries
+    ):
+        card = SimCard(card_id, strings[title], strings[card_type], position, created_at, lifetime or None, bool(flag))
+        loaded.append(card)
+        if expiry >= 0:
+            card.expiry = schedule_timer(expiry, remove_card, card, "expired")
+
+    cards = workshop.cards
+    try:
+        cards.add_many(loaded)
+    except ValueError as error:
+        raise SnapshotError(f"corrupt snapshot: {error}") from error
+    workshop.card_grid.insert_points((card, card.position) for card in loaded)
+    workshop.inventory.add_many((card.title, card.card_type) for card in cards.values())
+
+    # Heap events (recipe completions, generator intervals), re-added in firing order
+    events = []
+
+    verb_count, = reader.unpack(_COUNT)
+    verb_records = [reader.unpack(_VERB) for _ in range(verb_count)]
+    craft_records = [reader.unpack(_CRAFT) for record in verb_records for _ in range(record[-3] + record[-2])]
+    recipe_inputs = iter(reader.array("I"))
+    active_cards = iter(reader.array("Q"))
+    crafts = iter(craft_records)
+    for record in verb_records:
+        name, slots, crafted, busy_time, capacity_time, metrics_since, slots_since, running, queued, card_count = (
+            record[0], *record[7:]
+        )
+        verb = workshop.add_verb(strings[name], record[1:4], record[4:7], slots)
+        verb.crafted, verb.busy_time, verb.capacity_time = crafted, busy_time, capacity_time
+        verb.metrics_since, verb.slots_since = metrics_since, slots_since
+        for _ in range(card_count):
+            card = cards[next(active_cards)]
+            verb.active_cards.append(card)
+            card.verb = verb
+        for index in range(running + queued):
+            start, completion, rank, output, recipe_time, input_count, craft_cards = next(crafts)
+            inputs = [strings[next(recipe_inputs)] for _ in range(input_count)]
+            recipe = workshop.recipe_book.find_recipe(verb.name, inputs)
+            if recipe is None or recipe.output != strings[output]:
+                # The recipe book changed since saving; finish the craft as it was started
+                recipe = Recipe(verb=verb.name, inputs=inputs, output=strings[output], time=recipe_time)
+            craft = Craft(verb, recipe, [cards[next(active_cards)] for _ in range(craft_cards)], start)
+            for card in craft.cards:
+                card.verb = verb
+            if index < running:
+                verb.crafts.append(craft)
+                if completion >= 0:
+                    events.append((rank, completion, craft, "completion", workshop.complete_craft))
+            else:
+                verb.backlog.append(craft)
+
+    generator_count, = reader.unpack(_COUNT)
+    for _ in range(generator_count):
+        (card_type, x, y, z, interval, card_title, lifetime, is_resource,
+         last_generation, is_active, next_tick, rank) = reader.unpack(_GENERATOR)
+        generator = SimGenerator(
+            card_type=strings[card_type],
+            position=(x, y, z),
+            interval=interval,
+            card_title=strings[card_title],
+            lifetime=lifetime or None,
+            is_resource=bool(is_resource),
+            last_generation=last_generation,
+            is_active=bool(is_active),
+        )
+        workshop.generators.append(generator)
+        if next_tick >= 0:
+            events.append((rank, next_tick, generator, "next_generation", workshop._on_generator_due))
+
+    events.sort(key=lambda event: event[0])
+    for _, event_tick, owner, attribute, callback in events:
+        setattr(owner, attribute, scheduler.schedule_at(event_tick, callback, owner))
+
+    return Snapshot(workshop=workshop, environment_time=environment_time)
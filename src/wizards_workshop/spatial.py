@@ -0,0 +1,121 @@
+import math
+from typing import Dict, Hashable, Iterable, Iterator, List, Set, Tuple
+
+
+Cell = Tuple[int, int]
+Point = Tuple[float, float, float]
+
+
+class SpatialGrid:
+    """Uniform grid over the table's x/z plane.
+
+    Items are stored with their full 3D position plus an optional extent
+    (half-size on x/z), and are bucketed into every cell that extent
+    overlaps. Queries only look at the cells around the query point.
+    """
+
+    def __init__(self, cell_size: float = 2.0):
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, Set[Hashable]] = {}
+        self.positions: Dict[Hashable, Point] = {}
+        self.extents: Dict[Hashable, float] = {}
+        self._item_cells: Dict[Hashable, List[Cell]] = {}
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def _cell_range(self, x: float, z: float, extent: float) -> List[Cell]:
+        size = self.cell_size
+        x0 = math.floor((x - extent) / size)
+        x1 = math.floor((x + extent) / size)
+        z0 = math.floor((z - extent) / size)
+        z1 = math.floor((z + extent) / size)
+        return [(cx, cz) for cx in range(x0, x1 + 1) for cz in range(z0, z1 + 1)]
+
+    def insert(self, item: Hashable, position, extent: float = 0.0):
+        if item in self.positions:
+            self.remove(item)
+
+        point = (position[0], position[1], position[2])
+        cells = self._cell_range(point[0], point[2], extent)
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(item)
+
+        self.positions[item] = point
+        self.extents[item] = extent
+        self._item_cells[item] = cells
+
+    def insert_points(self, entries: Iterable[Tuple[Hashable, Point]]):
+        # Bulk insert of zero-extent items, e.g. a whole table of loaded cards
+        size = self.cell_size
+        cells, positions = self.cells, self.positions
+        floor = math.floor
+        for item, point in entries:
+            if item in positions:
+                self.remove(item)
+            cell = (floor(point[0] / size), floor(point[2] / size))
+            bucket = cells.get(cell)
+            if bucket is None:
+                bucket = cells[cell] = set()
+            bucket.add(item)
+            positions[item] = point
+            self.extents[item] = 0.0
+            self._item_cells[item] = [cell]
+
+    def move(self, item: Hashable, position):
+        if item not in self.positions:
+            self.insert(item, position)
+            return
+
+        point = (position[0], position[1], position[2])
+        extent = self.extents[item]
+        old_cells = self._item_cells[item]
+        new_cells = self._cell_range(point[0], point[2], extent)
+        self.positions[item] = point
+
+        # Most moves stay inside the same cell(s)
+        if new_cells == old_cells:
+            return
+
+        self._discard_from_cells(item, old_cells)
+        for cell in new_cells:
+            self.cells.setdefault(cell, set()).add(item)
+        self._item_cells[item] = new_cells
+
+    def remove(self, item: Hashable):
+        if item not in self.positions:
+            return
+
+        self._discard_from_cells(item, self._item_cells.pop(item))
+        del self.positions[item]
+        del self.extents[item]
+
+    def _discard_from_cells(self, item, cells):
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                continue
+            bucket.discard(item)
+            if not bucket:
+                del self.cells[cell]
+
+    def nearby(self, position, radius: float = 0.0) -> Iterator[Hashable]:
+        # Candidates whose cells overlap the query square; callers do the exact test
+        seen = set()
+        for cell in self._cell_range(position[0], position[2], radius):
+            for item in self.cells.get(cell, ()):
+                if item not in seen:
+                    seen.add(item)
+                    yield item
+
+    def any_within(self, position, radius: float) -> bool:
+        px, py, pz = position[0], position[1], position[2]
+        radius_sq = radius * radius
+        for item in self.nearby(position, radius):
+            x, y, z = self.positions[item]
+            if (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2 < radius_sq:
+                return True
+        return False
@@ -0,0 +1,67 @@
+from array import array
+
+from ursina import *
+
+
+class StaticMesh:
+    """Bakes many never-moving primitives into one vertex-coloured Mesh.
+
+    Parts are given in the space of the entity the mesh ends up on, exactly
+    as if they were child entities of it, so swapping a pile of children
+    for one baked model doesn't change what is drawn.
+    """
+
+    _templates = {}  # model name -> (xs, ys, zs, triangle indices)
+
+    def __init__(self):
+        # Flat arrays, which Mesh copies straight into the vertex buffer
+        self.vertices = array('f')
+        self.triangles = array('I')
+        self.colors = array('f')
+        self.vertex_count = 0
+        self.parts = 0
+
+    @classmethod
+    def template(cls, model):
+        if model not in cls._templates:
+            mesh = load_model(model, use_deepcopy=True)
+            if mesh.triangles:
+                indices = []
+                for triangle in mesh.triangles:
+                    if isinstance(triangle, int):
+                        indices.append(triangle)
+                    elif len(triangle) == 4:
+                        indices.extend((triangle[0], triangle[1], triangle[2], triangle[2], triangle[3], triangle[0]))
+                    else:
+                        indices.extend(triangle)
+            else:
+                indices = list(range(len(mesh.vertices)))
+            xs, ys, zs = (array('f', (v[axis] for v in mesh.vertices)) for axis in range(3))
+            cls._templates[model] = (xs, ys, zs, array('I', indices))
+        return cls._templates[model]
+
+    def add(self, model, position=(0, 0, 0), scale=(1, 1, 1), color=color.white):
+        xs, ys, zs, indices = self.template(model)
+        if isinstance(scale, (int, float)):
+            scale = (scale, scale, scale)
+        px, py, pz = position
+        sx, sy, sz = scale
+
+        part = array('f', bytes(12 * len(xs)))
+        part[0::3] = array('f', [px + x * sx for x in xs])
+        part[1::3] = array('f', [py + y * sy for y in ys])
+        part[2::3] = array('f', [pz + z * sz for z in zs])
+        self.vertices.extend(part)
+
+        offset = self.vertex_count
+        self.triangles.extend(array('I', [offset + i for i in indices]) if offset else indices)
+        self.colors.extend(array('f', (color[0], color[1], color[2], color[3])) * len(xs))
+        self.vertex_count += len(xs)
+        self.parts += 1
+
+    def build(self):
+        return Mesh(vertices=self.vertices, triangles=self.triangles, colors=self.colors, static=True)
+
+    def attach(self, entity):
+        entity.model = self.build()
+        return entity
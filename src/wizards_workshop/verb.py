@@ -1,28 +1,34 @@
 from ursina import *
 import time
 import math
-from .recipes import RecipeBook
+from .pool import effect_pool
 
 
 class Verb3D(Entity):
-    def __init__(self, position=(0, 0, 0), name="verb", game_manager=None, **kwargs):
+    def __init__(self, state, game_manager=None, **kwargs):
         super().__init__(
-            position=position,
+            position=state.position,
+            scale=state.scale,
             **kwargs
         )
         
-        self.verb_name = name
+        self.state = state
+        self.verb_name = state.name
         self.game_manager = game_manager
-        self.active_cards = []
-        self.is_processing = False
-        self.process_start_time = None
-        self.process_duration = 3.0
-        self.current_recipe = None
-        self.recipe_book = RecipeBook()
+        self.station_animations = []  # per-frame decoration, added by the station setups
+        self.showing_progress = False  # between the recipe started and completed events
         
         self.setup_appearance()
         self.setup_interaction_zone()
         
+    @property
+    def active_cards(self):
+        return self.state.active_cards
+        
+    @property
+    def is_processing(self):
+        return self.state.is_processing
+        
     def setup_appearance(self):
         # Enhanced station appearance based on type
         self.setup_station_details()
@@ -37,6 +43,17 @@ class Verb3D(Entity):
             billboard=True
         )
         
+        # Busy slots and queued sets, e.g. "2/3 +1"
+        self.queue_text = Text(
+            parent=self,
+            origin=(0, 0),
+            scale=7,
+            color=color.light_gray,
+            position=(0, self.scale_y + 1.15, 0),
+            billboard=True
+        )
+        self.update_queue_text()
+        
     def setup_station_details(self):
         if self.verb_name == "forge":
             self.setup_forge_details()
@@ -67,6 +84,8 @@ class Verb3D(Entity):
             alpha=0.7
         )
         
+        self.station_animations.append(self.animate_fire)
+        
         # Add hammers
         for i, pos in enumerate([(-0.6, self.scale_y + 0.5, 0.3), (0.6, self.scale_y + 0.5, -0.3)]):
             hammer = Entity(
@@ -140,6 +159,7 @@ class Verb3D(Entity):
             color=color.violet,
             alpha=0.6
         )
+        self.station_animations.append(self.animate_symbol)
         
     def setup_alchemy_details(self):
         # Add bottles and flasks
@@ -170,6 +190,7 @@ class Verb3D(Entity):
             color=color.cyan,
             alpha=0.5
         )
+        self.station_animations.append(self.animate_bubbles)
         
     def setup_interaction_zone(self):
         self.interaction_zone = Entity(
@@ -185,152 +206,109 @@ class Verb3D(Entity):
     def is_card_over(self, card):
         if not card:
             return False
-            
-        card_pos = card.world_position
-        zone_pos = self.interaction_zone.world_position
-        zone_scale = self.interaction_zone.world_scale
-        
-        return (abs(card_pos.x - zone_pos.x) < zone_scale.x / 2 and
-                abs(card_pos.z - zone_pos.z) < zone_scale.z / 2)
+        return self.state.contains(card.world_position)
         
-    def accept_card(self, card):
-        if card not in self.active_cards:
-            self.active_cards.append(card)
-            
-            # Position cards in a circle
-            angle = (len(self.active_cards) - 1) * (360 / max(len(self.active_cards), 1))
-            offset_x = math.cos(math.radians(angle)) * 0.8
-            offset_z = math.sin(math.radians(angle)) * 0.8
-            card.position = self.position + Vec3(offset_x, self.scale_y + 0.6, offset_z)
-            
-            # Check for valid recipe
-            self.check_recipe()
-                
-    def check_recipe(self):
-        if self.is_processing:
-            return
+    def show_suggestions(self, suggestions):
+        # Recipes the held card would still leave completable here
+        self.interaction_zone.visible = True
+        if not suggestions:
+            self.interaction_zone.color = color.red
+        elif not suggestions[0][1]:
+            self.interaction_zone.color = color.lime  # dropping it starts a recipe
+        else:
+            self.interaction_zone.color = color.yellow
             
-        card_titles = [card.title for card in self.active_cards]
-        recipe = self.recipe_book.find_recipe(self.verb_name, card_titles)
+        lines = [recipe.output + (f"  needs {', '.join(missing)}" if missing else "")
+                 for recipe, missing in suggestions]
+        if not hasattr(self, 'suggestion_text'):
+            self.suggestion_text = Text(
+                parent=self,
+                origin=(0, 0),
+                scale=6,
+                color=color.light_gray,
+                position=(0, self.scale_y + 2.5, 0),
+                billboard=True
+            )
+        self.suggestion_text.text = "\n".join(lines) if lines else "Nothing to make"
+        self.suggestion_text.enabled = True
         
-        if recipe:
-            self.current_recipe = recipe
-            self.start_processing(recipe.time)
-        else:
-            # Show invalid combination feedback
-            if len(self.active_cards) >= 2:
-                self.interaction_zone.visible = True
-                self.interaction_zone.color = color.red
-                self.interaction_zone.animate_scale(
-                    self.interaction_zone.scale * 1.1,
-                    duration=0.2,
-                    curve=curve.out_expo
-                )
-                invoke(lambda: setattr(self.interaction_zone, 'visible', False), delay=0.5)
+    def clear_suggestions(self):
+        if hasattr(self, 'suggestion_text'):
+            self.suggestion_text.enabled = False
+        if not self.state.is_processing:
+            self.interaction_zone.visible = False
             
-    def start_processing(self, duration):
-        if not self.active_cards:
-            return
+    def show_rejected(self):
+        # Show invalid combination feedback
+        self.interaction_zone.visible = True
+        self.interaction_zone.color = color.red
+        self.interaction_zone.animate_scale(
+            self.interaction_zone.scale * 1.1,
+            duration=0.2,
+            curve=curve.out_expo
+        )
+        invoke(lambda: setattr(self.interaction_zone, 'visible', False), delay=0.5)
             
-        self.is_processing = True
-        self.process_duration = duration
-        self.process_start_time = time.time()
+    def update_queue_text(self):
+        state = self.state
+        text = f"{len(state.crafts)}/{state.slots}" if state.crafts or state.backlog else ""
+        if state.backlog:
+            text += f" +{len(state.backlog)}"
+        self.queue_text.text = text
+        
+    def start_processing(self, recipe):
         self.interaction_zone.visible = True
         self.interaction_zone.color = color.lime
+        self.showing_progress = True
+        self.update_queue_text()
         
-        # Add processing particles
-        self.create_processing_particles()
-        
-        def check_process():
-            if self.is_processing:
-                progress = (time.time() - self.process_start_time) / self.process_duration
-                if progress >= 1.0:
-                    self.complete_processing()
-                else:
-                    # Update visual progress
-                    self.interaction_zone.color = color.lime * (1 - progress) + color.yellow * progress
-                    invoke(check_process, delay=0.1)
+        # Add processing particles, lasting the recipe in wall time
+        speed = self.game_manager.scheduler.speed if self.game_manager else 1
+        self.create_processing_particles(recipe.time / speed)
             
     def update(self):
-        # Animate station effects
-        if hasattr(self, 'fire'):
-            # Animate forge fire
-            self.fire.scale_y = 0.8 + 0.2 * math.sin(time.time() * 3)
-            self.fire.rotation_y += 50 * time.dt
+        now = time.time()
+        for animate in self.station_animations:
+            animate(now)
             
-        if hasattr(self, 'symbol'):
-            # Animate ritual symbol
-            self.symbol.rotation_y += 30 * time.dt
-            pulse = 1 + 0.1 * math.sin(time.time() * 2)
-            self.symbol.alpha = 0.6 * pulse
+        # Visual progress of the running recipe
+        if self.showing_progress and self.game_manager:
+            progress = self.state.progress(self.game_manager.workshop.time)
+            self.interaction_zone.color = color.lime * (1 - progress) + color.yellow * progress
             
-        if hasattr(self, 'bubbles'):
-            # Animate alchemy bubbles
-            self.bubbles.y = self.scale_y + 1.2 + 0.3 * math.sin(time.time() * 2)
-            self.bubbles.rotation_x += 20 * time.dt
+    def animate_fire(self, now):
+        self.fire.scale_y = 0.8 + 0.2 * math.sin(now * 3)
+        self.fire.rotation_y += 50 * time.dt
         
-    def complete_processing(self):
-        self.is_processing = False
-        self.interaction_zone.visible = False
+    def animate_symbol(self, now):
+        self.symbol.rotation_y += 30 * time.dt
+        self.symbol.alpha = 0.6 * (1 + 0.1 * math.sin(now * 2))
         
-        if self.current_recipe and self.game_manager:
-            # Create success effect
-            success_flash = Entity(
-                model="sphere",
-                scale=3,
-                color=color.yellow,
-                position=self.position + Vec3(0, self.scale_y, 0),
-                alpha=0.7
-            )
-            success_flash.animate_scale(0, duration=0.5, curve=curve.out_expo)
-            destroy(success_flash, delay=0.5)
-            
-            # Remove input cards
-            for card in self.active_cards:
-                card.animate_scale(0, duration=0.3, curve=curve.in_expo)
-                destroy(card, delay=0.3)
-                
-            # Create output card
-            output_pos = self.position + Vec3(0, 0.1, -3)
-            invoke(lambda: self.game_manager.create_card(
-                position=output_pos,
-                card_type=self.determine_card_type(self.current_recipe.output),
-                title=self.current_recipe.output,
-                animate_spawn=True
-            ), delay=0.4)
-            
-            print(f"Created {self.current_recipe.output} from {self.current_recipe.inputs}")
-        else:
-            # Recipe failed - return cards
-            for i, card in enumerate(self.active_cards):
-                card.position = self.position + Vec3(i * 1.5 - len(self.active_cards) * 0.75, 0.1, -3)
-            
-        self.active_cards.clear()
-        self.current_recipe = None
+    def animate_bubbles(self, now):
+        self.bubbles.y = self.scale_y + 1.2 + 0.3 * math.sin(now * 2)
+        self.bubbles.rotation_x += 20 * time.dt
+        
+    def complete_processing(self, recipe):
+        # Other slots may still be busy
+        self.showing_progress = self.state.is_processing
+        self.interaction_zone.visible = self.showing_progress
+        self.update_queue_text()
         
-    def determine_card_type(self, title):
-        type_mappings = {
-            "Mana": "mana",
-            "Iron Ore": "ingredient",
-            "Iron Ingot": "ingredient", 
-            "Iron Blade": "tool",
-            "Simple Wand": "tool",
-            "Basic Forging": "knowledge",
-            "Elemental Theory": "knowledge",
-            "Spell: Ignite": "spell",
-            "Flame Essence": "essence",
-            "Minor Potion": "potion",
-            "Potion of Fire Resistance": "potion",
-            "Charged Crystal": "crystal",
-            "Crystal Shard": "crystal",
-            "Herb": "herb"
-        }
-        return type_mappings.get(title, "generic")
+        # Create success effect
+        success_flash = effect_pool.acquire(
+            scale=3,
+            color=color.yellow,
+            position=self.position + Vec3(0, self.scale_y, 0),
+            alpha=0.7
+        )
+        success_flash.animate_scale(0, duration=0.5, curve=curve.out_expo)
+        effect_pool.release(success_flash, delay=0.5)
         
-    def create_processing_particles(self):
+        print(f"Created {recipe.output} from {list(recipe.inputs)}")
+        
+    def create_processing_particles(self, duration):
         for i in range(5):
-            particle = Entity(
-                model="sphere",
+            particle = effect_pool.acquire(
                 scale=0.1,
                 color=self.color * 1.5,
                 position=self.position + Vec3(0, self.scale_y, 0)
@@ -338,8 +316,8 @@ class Verb3D(Entity):
             direction = Vec3(random.uniform(-1, 1), random.uniform(0.5, 2), random.uniform(-1, 1))
             particle.animate_position(
                 particle.position + direction,
-                duration=self.process_duration,
+                duration=duration,
                 curve=curve.linear
             )
-            particle.animate_scale(0, duration=self.process_duration)
-            destroy(particle, delay=self.process_duration)
\ No newline at end of file
+            particle.animate_scale(0, duration=duration)
+            effect_pool.release(particle, delay=duration)
\ No newline at end of file
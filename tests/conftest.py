@@ -0,0 +1,52 @@
+# Most tests are headless; view tests ask for the offscreen app fixture,
+# so ursina is only imported when they run
+
+import os
+
+import pytest
+
+from wizards_workshop.content import VERB_LAYOUT
+from wizards_workshop.recipes import Recipe, RecipeBook
+from wizards_workshop.simulation import Workshop
+
+RECIPES = [
+    Recipe("forge", ("Iron Ore", "Coal"), "Iron Ingot", 3.0),
+    Recipe("study", ("Mysterious Tome",), "Basic Forging", 5.0),
+    Recipe("alchemy", ("Herb", "Mana"), "Minor Potion", 4.0),
+    Recipe("ritual", ("Mana", "Mana", "Crystal Shard"), "Charged Crystal", 6.0),
+]
+
+
+@pytest.fixture(autouse=True, scope="session")
+def content_cache(tmp_path_factory):
+    # Card types still come from the content packs; keep their compiled cache out of ~/.cache
+    os.environ["WIZARDS_WORKSHOP_CACHE"] = str(tmp_path_factory.mktemp("content_cache"))
+
+
+@pytest.fixture(scope="session")
+def app():
+    # One offscreen Ursina app for every view test in the run
+    pytest.importorskip("ursina")
+    from panda3d.core import loadPrcFileData
+    loadPrcFileData("", "load-display p3headlessgl\nwindow-type offscreen\naudio-library-name null")
+    from ursina import Ursina
+    return Ursina(window_type="offscreen", development_mode=False)
+
+
+@pytest.fixture
+def book():
+    return RecipeBook(RECIPES)
+
+
+@pytest.fixture
+def workshop(book):
+    # The game's stations, at 10 Hz, with no generators or starter cards
+    workshop = Workshop(recipe_book=book, tick_rate=10, seed=1)
+    for layout in VERB_LAYOUT:
+        workshop.add_verb(**layout)
+    return workshop
+
+
+@pytest.fixture
+def verbs(workshop):
+    return {verb.name: verb for verb in workshop.verbs}
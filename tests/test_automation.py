@@ -0,0 +1,95 @@
+import pytest
+
+from wizards_workshop.automation import Automation, Conveyor
+from wizards_workshop.events import RecipeRejected
+from wizards_workshop.recipes import Recipe
+
+
+def test_routes_feed_a_station_from_generators(workshop, verbs):
+    alchemy = verbs["alchemy"]
+    automation = Automation(workshop)
+    rejected = []
+    workshop.events.subscribe(RecipeRejected, rejected.append)
+    for card_type, x in (("herb", 20), ("mana", -20)):
+        automation.route(workshop.add_generator(card_type, (x, 0.5, 0), interval=1.0), alchemy)
+
+    workshop.run(100)
+    # A set a second, four seconds a craft: later sets queue up to max_backlog, the rest wait
+    assert alchemy.crafted == 4 and len(alchemy.crafts) == 3 and alchemy.queue_depth == 2
+    assert not rejected
+    metrics = automation.metrics()
+    assert metrics["delivered"] == 2 * (4 + 3 + 2) + len(alchemy.active_cards)
+    assert metrics["waiting"] == 20 - metrics["delivered"]
+
+
+def test_chain_moves_outputs_to_the_next_station(workshop, verbs, book):
+    forge, alchemy = verbs["forge"], verbs["alchemy"]
+    book.add_recipe(Recipe("alchemy", ("Iron Ingot", "Herb"), "Iron Tonic", 4.0))
+    automation = Automation(workshop)
+    automation.chain(forge, alchemy)
+    for title in ("Iron Ore", "Coal"):
+        workshop.place_card(workshop.create_card((0, 0.1, 0), title), forge)
+
+    workshop.run(31)
+    [ingot] = workshop.cards.with_title("Iron Ingot")
+    assert ingot.verb is alchemy and alchemy.active_cards == [ingot]
+
+
+def test_route_holds_cards_the_target_cannot_use(workshop, verbs):
+    forge = verbs["forge"]
+    automation = Automation(workshop)
+    automation.route(workshop.add_generator("herb", (20, 0.5, 0), interval=1.0), forge)
+    workshop.run(25)
+    assert not forge.active_cards
+    assert automation.metrics()["waiting"] == 2
+
+
+def test_conveyor_carries_cards_off_the_table(workshop, verbs):
+    alchemy = verbs["alchemy"]
+    automation = Automation(workshop)
+    generator = workshop.add_generator("herb", (20, 0.5, 0), interval=1.0)
+    belt = Conveyor((generator.position, (4, 0.5, 0)), speed=8)  # two seconds
+    automation.route(generator, alchemy, conveyor=belt)
+
+    workshop.run(15)  # spawned at 1 s, a quarter of the way along
+    [(card, position)] = automation.in_transit(workshop.time)
+    assert position == pytest.approx((16, 0.5, 0))
+    assert not workshop.is_position_occupied(card.position, 0.1)
+    workshop.run(16)
+    assert card.verb is alchemy
+
+
+def test_released_cards_are_left_to_the_player(workshop, verbs):
+    forge = verbs["forge"]
+    automation = Automation(workshop)
+    automation.route(workshop.add_generator("herb", (20, 0.5, 0), interval=1.0), forge)
+    workshop.run(10)
+    [herb] = workshop.cards.with_title("Herb")
+    assert automation.release(herb)
+    assert not automation.release(herb)
+    assert automation.metrics()["waiting"] == 0
+
+
+def test_unroute_lands_cards_on_the_belt(workshop, verbs):
+    alchemy = verbs["alchemy"]
+    automation = Automation(workshop)
+    generator = workshop.add_generator("herb", (20, 0.5, 0), interval=1.0)
+    route = automation.route(generator, alchemy, conveyor=Conveyor((generator.position, (4, 0.5, 0)), speed=8))
+    workshop.run(15)
+    [herb] = workshop.cards.with_title("Herb")
+    automation.unroute(route)
+    assert herb.position == (4, 0.5, 0) and herb.verb is None
+    assert workshop.is_position_occupied(herb.position, 0.1)
+    metrics = automation.metrics()
+    assert (metrics["routes"], metrics["waiting"], metrics["in_transit"]) == (0, 0, 0)
+
+
+def test_bad_routes_and_conveyors_are_refused(workshop, verbs, book):
+    automation = Automation(workshop)
+    with pytest.raises(ValueError):
+        Conveyor(((0, 0, 0),))
+    with pytest.raises(ValueError):
+        Conveyor(((0, 0, 0), (1, 0, 0)), speed=0)
+    stranger = type(workshop)(recipe_book=book).add_verb("forge", (0, 0, 0))
+    with pytest.raises(ValueError):
+        automation.route(verbs["forge"], stranger)
@@ -0,0 +1,26 @@
+from wizards_workshop.batch import InstanceSpec, build_instance, run_batch, run_instance, summarize
+
+
+def test_instances_are_deterministic_per_seed():
+    spec = InstanceSpec(seed=3, duration=120.0)
+    first, second = run_instance(spec), run_instance(spec)
+    assert (first.crafted, first.first_target, first.peak_cards) == (second.crafted, second.first_target, second.peak_cards)
+    assert first.crafted > 0
+
+
+def test_seeds_jitter_generator_intervals():
+    first = [generator.interval for generator in build_instance(InstanceSpec(seed=1)).generators]
+    second = [generator.interval for generator in build_instance(InstanceSpec(seed=2)).generators]
+    assert first != second
+    assert [verb.slots for verb in build_instance(InstanceSpec(seed=1, slots=4)).verbs] == [4, 4, 4, 4]
+
+
+def test_inline_batch_returns_every_instance_and_summarizes():
+    specs = [InstanceSpec(seed=seed, duration=60.0, interval_scale=scale) for seed in range(3) for scale in (0.5, 1.0)]
+    results = list(run_batch(specs, processes=1))
+    assert [result.index for result in results] == list(range(len(specs)))
+    assert [result.crafted for result in results] == [run_instance(spec).crafted for spec in specs]
+
+    summary = summarize(results, by=lambda spec: spec.interval_scale)
+    assert sorted(summary) == [0.5, 1.0]
+    assert all(group["instances"] == 3 for group in summary.values())
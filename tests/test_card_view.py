@@ -0,0 +1,93 @@
+import pytest
+
+from wizards_workshop.content import content_pack
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_cards_of_every_type_build(app, workshop, batched):
+    from wizards_workshop.card import Card
+    from wizards_workshop.card_renderer import CardRenderer
+    from ursina import destroy
+
+    renderer = CardRenderer() if batched else None
+    titles = {card_type: title for title, card_type in content_pack().card_types.items()}
+    for card_type, title in titles.items():
+        state = workshop.create_card((0, 0.1, 0), title, lifetime=10.0)
+        card = Card(state, workshop, renderer=renderer)
+        assert card.card_type == card_type
+        if not batched:
+            assert card.border.color == card.border_color
+            assert card.lifetime_bar.scale_x == pytest.approx(1.4)
+        destroy(card)
+    if renderer:
+        destroy(renderer)
+
+
+def test_unbatched_game_sets_up(app):
+    from wizards_workshop.game_manager import GameManager
+    from ursina import destroy
+
+    game = GameManager(batch_cards=False, seed=1)
+    game.setup()
+    app.step()
+    assert game.cards and all(card.renderer is None for card in game.cards.values())
+    destroy(game)
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_lifetime_bar_shrinks_in_visible_steps(app, workshop, batched):
+    from wizards_workshop.card import LIFETIME_BAR_STEPS, Card
+    from wizards_workshop.card_renderer import CardRenderer
+    from ursina import destroy
+
+    renderer = CardRenderer() if batched else None
+    state = workshop.create_card((0, 0.1, 0), "Mana", lifetime=LIFETIME_BAR_STEPS)
+    card = Card(state, workshop, renderer=renderer)
+    # No bar steps on the simulation's scheduler, only the expiry
+    assert len(workshop.scheduler.timers) == 1
+
+    syncs = []
+    if renderer:
+        sync = renderer.sync
+        renderer.sync = lambda view: syncs.append(view) or sync(view)
+    workshop.run(5)
+    card.refresh_lifetime_bar()
+    assert card.lifetime_remaining == 1.0 and not syncs
+    workshop.run(10)
+    card.refresh_lifetime_bar()
+    assert card.lifetime_remaining == pytest.approx((LIFETIME_BAR_STEPS - 1) / LIFETIME_BAR_STEPS)
+    if batched:
+        assert syncs == [card]
+    else:
+        assert card.lifetime_bar.scale_x == pytest.approx(1.4 * card.lifetime_remaining)
+    destroy(card)
+    if renderer:
+        destroy(renderer)
+
+
+def test_game_keeps_lifetime_views_for_the_bar_pass(app):
+    from wizards_workshop.game_manager import GameManager
+    from ursina import destroy
+
+    game = GameManager(seed=1)
+    game.setup()
+    state = game.workshop.create_card((0, 0.1, 0), "Mana", lifetime=2.0)
+    card = game.add_card_view(state)
+    assert card in game.lifetime_cards
+    game.scheduler.run(60)
+    game.update_lifetime_bars(game.lifetime_bar_interval)
+    assert card.lifetime_remaining == pytest.approx(0.5)
+    game.remove_card_view(state, "expired")
+    assert card not in game.lifetime_cards
+    destroy(game)
+
+
+def test_generators_take_their_colour_from_the_content_pack(app, workshop):
+    from wizards_workshop.card import content_color
+    from wizards_workshop.card_generator import CardGenerator
+    from ursina import destroy
+
+    for card_type, config in content_pack().generators.items():
+        generator = CardGenerator(workshop.add_generator(card_type, (0, 0, 0), 5.0))
+        assert generator.color == content_color(config["color"])
+        destroy(generator)
@@ -0,0 +1,62 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from wizards_workshop.content_pack import BASE_PACK, ContentPackError, load_packs
+
+MOD = {
+    "card_types": {"Herb": "reagent", "Moonpetal": "reagent"},
+    "generators": {"herb": {"title": "Moon Garden", "card_title": "Moonpetal"}},
+    "recipes": [{"verb": "alchemy", "inputs": ["Moonpetal", "Mana"], "output": "Moon Draught", "time": 2}],
+}
+
+
+def test_later_packs_override_and_add(tmp_path):
+    mod = tmp_path / "mod.json"
+    mod.write_text(json.dumps(MOD))
+    base = load_packs([BASE_PACK], tmp_path / "cache")
+    pack = load_packs([BASE_PACK, mod], tmp_path / "cache")
+    assert pack.card_types["Herb"] == "reagent" and pack.card_types["Iron Ore"] == "ingredient"
+    assert pack.generators["herb"]["card_title"] == "Moonpetal"
+    # A generator without a colour is white; the base pack's keep theirs
+    assert pack.generators["herb"]["color"] == "white" and pack.generators["mana"]["color"] == "cyan"
+    assert pack.recipes[:len(base.recipes)] == base.recipes
+    assert pack.recipes[-1].inputs == ("Moonpetal", "Mana") and pack.recipes[-1].time == 2.0
+
+
+def test_cached_load_matches_the_parsed_packs(tmp_path):
+    parsed = load_packs([BASE_PACK], tmp_path)
+    assert len(list(tmp_path.glob("*.wwcp"))) == 1
+    cached = load_packs([BASE_PACK], tmp_path)
+    assert cached == parsed
+    assert {config["color"] for config in cached.generators.values()} == {"cyan", "green", "violet"}
+
+
+def test_changed_pack_gets_a_new_cache(tmp_path):
+    mod = tmp_path / "mod.json"
+    mod.write_text(json.dumps(MOD))
+    load_packs([BASE_PACK, mod], tmp_path / "cache")
+    mod.write_text(json.dumps(dict(MOD, card_types={"Moonpetal": "herb"})))
+    assert load_packs([BASE_PACK, mod], tmp_path / "cache").card_types["Moonpetal"] == "herb"
+    assert len(list((tmp_path / "cache").glob("*.wwcp"))) == 2
+
+
+def test_malformed_packs_raise_content_pack_error(tmp_path):
+    broken = tmp_path / "broken.json"
+    broken.write_text('{"recipes": [{"verb": "forge"}]}')
+    with pytest.raises(ContentPackError):
+        load_packs([broken], tmp_path)
+    broken.write_text("{not json")
+    with pytest.raises(ContentPackError):
+        load_packs([broken], tmp_path)
+
+
+def test_importing_the_simulation_loads_no_content(tmp_path):
+    # The packs are loaded, and their cache written, on first use only
+    script = "import wizards_workshop.simulation, wizards_workshop.snapshot, wizards_workshop.content as c; print(c._pack)"
+    env = {"WIZARDS_WORKSHOP_CACHE": str(tmp_path), "PYTHONPATH": str(BASE_PACK.parents[2])}
+    output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "None"
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,146 @@
+import random
+
+import pytest
+
+from wizards_workshop.events import RecipeQueued
+from wizards_workshop.snapshot import dumps, loads
+
+
+def craft(workshop, verb, *titles):
+    cards = [workshop.create_card((0, 0.1, 0), title) for title in titles]
+    for card in cards:
+        workshop.place_card(card, verb)
+    return cards
+
+
+def test_slots_craft_in_parallel_and_queue_the_rest(workshop, verbs):
+    forge = verbs["forge"]  # two slots
+    queued = []
+    workshop.events.subscribe(RecipeQueued, queued.append)
+    for _ in range(3):
+        craft(workshop, forge, "Iron Ore", "Coal")
+    assert len(forge.crafts) == 2 and forge.queue_depth == 1
+    assert [event.verb for event in queued] == [forge]
+    assert not forge.active_cards
+
+    workshop.run(30)
+    assert forge.crafted == 2 and len(forge.crafts) == 1 and forge.queue_depth == 0
+    workshop.run(30)
+    assert forge.crafted == 3 and not forge.is_processing
+    assert len(workshop.cards.with_title("Iron Ingot")) == 3
+
+
+def test_more_slots_start_the_backlog(workshop, verbs):
+    study = verbs["study"]  # one slot
+    for _ in range(3):
+        craft(workshop, study, "Mysterious Tome")
+    assert len(study.crafts) == 1 and study.queue_depth == 2
+    workshop.set_slots(study, 3)
+    assert len(study.crafts) == 3 and study.queue_depth == 0
+    with pytest.raises(ValueError):
+        workshop.set_slots(study, 0)
+
+
+def test_metrics_count_busy_slot_time(workshop, verbs):
+    forge = verbs["forge"]
+    craft(workshop, forge, "Iron Ore", "Coal")
+    workshop.run(60)
+    metrics = forge.metrics(workshop.time)
+    assert metrics["crafted"] == 1
+    assert metrics["utilisation"] == pytest.approx(0.25)  # one slot of two, half the time
+    assert metrics["per_minute"] == pytest.approx(10.0)
+
+
+def test_moved_card_leaves_its_previous_tray(workshop, verbs):
+    alchemy, ritual = verbs["alchemy"], verbs["ritual"]
+    [herb] = craft(workshop, alchemy, "Herb")
+    assert workshop.place_card(herb, ritual)
+    assert herb not in alchemy.active_cards and ritual.active_cards == [herb]
+
+    # Mana alone on alchemy makes nothing; the herb is no longer there
+    craft(workshop, alchemy, "Mana")
+    assert not alchemy.is_processing and herb.alive
+    loaded = loads(dumps(workshop)).workshop
+    assert [card.title for card in loaded.verbs[2].active_cards] == ["Herb"]
+
+
+def test_card_in_a_running_craft_stays_put(workshop, verbs):
+    alchemy, ritual = verbs["alchemy"], verbs["ritual"]
+    herb, mana = craft(workshop, alchemy, "Herb", "Mana")
+    assert not workshop.place_card(herb, ritual)
+    assert herb.verb is alchemy and not ritual.active_cards
+    workshop.run(40)
+    assert not herb.alive and alchemy.crafted == 1
+    loads(dumps(workshop))
+
+
+def test_card_already_on_the_verb_is_not_placed_twice(workshop, verbs):
+    forge = verbs["forge"]
+    [ore] = craft(workshop, forge, "Iron Ore")
+    assert not workshop.place_card(ore, forge)
+    assert forge.active_cards == [ore]
+
+
+def test_moving_a_queued_card_returns_the_rest_to_the_tray(workshop, verbs):
+    study, ritual = verbs["study"], verbs["ritual"]
+    craft(workshop, study, "Mysterious Tome")
+    [tome] = craft(workshop, study, "Mysterious Tome")
+    assert study.queue_depth == 1
+    assert workshop.place_card(tome, ritual)
+    assert study.queue_depth == 0 and ritual.active_cards == [tome]
+
+    forge = verbs["forge"]
+    craft(workshop, forge, "Iron Ore", "Coal")
+    craft(workshop, forge, "Iron Ore", "Coal")
+    ore, coal = craft(workshop, forge, "Iron Ore", "Coal")
+    assert forge.queue_depth == 1
+    workshop.place_card(coal, ritual)
+    assert forge.queue_depth == 0 and forge.active_cards == [ore]
+
+
+def assert_trays_consistent(workshop):
+    # Every card on a tray or in a queued set is alive, on one verb only, and
+    # knows which. A running craft keeps a card that expires under it.
+    placed = []
+    for verb in workshop.verbs:
+        for card in [*verb.active_cards, *(card for craft in verb.backlog for card in craft.cards)]:
+            assert card.alive and card.verb is verb
+            placed.append(card)
+        placed.extend(card for craft in verb.crafts for card in craft.cards if card.alive)
+    assert len(placed) == len(set(placed))
+
+
+def test_trays_stay_consistent_through_moves_and_removals(workshop, verbs):
+    rng = random.Random(7)
+    titles = [title for recipe in workshop.recipe_book.recipes for title in recipe.inputs]
+    for _ in range(2000):
+        cards = list(workshop.cards.values())
+        roll = rng.random()
+        if roll < 0.3 or not cards:
+            card = workshop.create_card((0, 0.1, 0), rng.choice(titles), lifetime=rng.choice([None, 2.0]))
+            workshop.place_card(card, rng.choice(workshop.verbs))
+        elif roll < 0.6:
+            workshop.place_card(rng.choice(cards), rng.choice(workshop.verbs))
+        elif roll < 0.8:
+            workshop.remove_card(rng.choice(cards), "consumed")
+        else:
+            workshop.run(rng.randint(1, 20))
+        assert_trays_consistent(workshop)
+    assert sum(verb.crafted for verb in workshop.verbs)
+
+
+def test_running_and_queued_crafts_survive_a_snapshot(workshop, verbs, book):
+    forge = verbs["forge"]
+    for _ in range(3):
+        craft(workshop, forge, "Iron Ore", "Coal")
+    craft(workshop, forge, "Iron Ore")
+    workshop.run(10)
+
+    loaded = loads(dumps(workshop), book).workshop
+    loaded_forge = loaded.verbs[0]
+    assert len(loaded_forge.crafts) == 2 and loaded_forge.queue_depth == 1
+    assert [card.title for card in loaded_forge.active_cards] == ["Iron Ore"]
+    workshop.run(60)
+    loaded.run(60)
+    assert loaded_forge.crafted == forge.crafted == 3
+    assert sorted(card.title for card in loaded.cards.values()) == sorted(card.title for card in workshop.cards.values())
@@ -0,0 +1,48 @@
+from wizards_workshop.events import (CardConsumed, CardCreated, CardDropped, EventBus, RecipeCompleted,
+                                     RecipeStarted)
+
+
+def test_handlers_get_events_of_their_exact_type_in_order():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(CardCreated, lambda event: seen.append(("first", event.card)))
+    bus.subscribe(CardCreated, lambda event: seen.append(("second", event.card)))
+    bus.subscribe(CardConsumed, lambda event: seen.append(("consumed", event.card)))
+    bus.publish(CardCreated("a"))
+    assert seen == [("first", "a"), ("second", "a")]
+
+
+def test_unsubscribed_handlers_stop_getting_events():
+    bus = EventBus()
+    seen = []
+    handler = bus.subscribe(CardCreated, seen.append)
+    bus.unsubscribe(CardCreated, handler)
+    bus.unsubscribe(CardCreated, handler)  # twice is harmless
+    bus.publish(CardCreated("a"))
+    assert seen == []
+
+
+def test_batched_handlers_get_a_list_per_flush():
+    bus = EventBus()
+    batches = []
+    bus.subscribe(CardCreated, batches.append, batched=True)
+    bus.publish(CardCreated("a"))
+    bus.publish(CardCreated("b"))
+    assert batches == []
+    bus.flush()
+    assert [[event.card for event in batch] for batch in batches] == [["a", "b"]]
+    bus.flush()
+    assert len(batches) == 1
+    assert bus.latency(CardCreated)["CardCreated"]["events"] == 2
+
+
+def test_workshop_publishes_a_craft_in_order(workshop, verbs):
+    forge = verbs["forge"]
+    seen = []
+    for event_type in (CardCreated, CardDropped, RecipeStarted, CardConsumed, RecipeCompleted):
+        workshop.events.subscribe(event_type, lambda event: seen.append(type(event).__name__))
+    for title in ("Iron Ore", "Coal"):
+        workshop.place_card(workshop.create_card((0, 0.1, 0), title), forge)
+    workshop.run(30)
+    assert seen == ["CardCreated", "CardDropped", "CardCreated", "CardDropped", "RecipeStarted",
+                    "CardConsumed", "CardConsumed", "CardCreated", "RecipeCompleted"]
@@ -0,0 +1,24 @@
+import gc
+
+import pytest
+
+from wizards_workshop.gcutil import gc_paused
+
+
+def test_gc_is_off_inside_and_back_on_after_an_error():
+    assert gc.isenabled()
+    with pytest.raises(ValueError):
+        with gc_paused():
+            assert not gc.isenabled()
+            raise ValueError
+    assert gc.isenabled()
+
+
+def test_gc_left_off_by_the_caller_stays_off():
+    gc.disable()
+    try:
+        with gc_paused():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
@@ -0,0 +1,23 @@
+def test_counts_follow_spawns_crafts_and_expiry(workshop, verbs):
+    inventory = workshop.inventory
+    ore = workshop.create_card((0, 0.1, 0), "Iron Ore")
+    coal = workshop.create_card((2, 0.1, 0), "Coal")
+    workshop.create_card((4, 0.1, 0), "Mana", lifetime=1.0)
+    assert len(inventory) == 3 and inventory.count("Mana") == 1
+
+    workshop.place_card(ore, verbs["forge"])
+    workshop.place_card(coal, verbs["forge"])
+    workshop.run(30)
+    assert dict(inventory.titles) == {"Iron Ingot": 1}
+    assert inventory.count_type(ore.card_type) == 1  # the ingot is an ingredient too
+
+
+def test_watchers_hear_only_their_changes(workshop):
+    counts, types = [], []
+    workshop.inventory.watch("Coal", counts.append)
+    workshop.inventory.watch_type("mana", types.append)
+    coal = workshop.create_card((0, 0.1, 0), "Coal")
+    workshop.create_card((2, 0.1, 0), "Herb")
+    workshop.remove_card(coal, "consumed")
+    assert counts == [0, 1, 0]
+    assert types == [0]
@@ -0,0 +1,124 @@
+import csv
+import json
+
+import pytest
+
+from wizards_workshop.profiler import FrameProfiler
+
+
+class Base:
+    def step(self):
+        return "base"
+
+
+class Child(Base):
+    def tick(self, value):
+        return value + 1
+
+
+def frame(number, frame_ms, sections, counters=None):
+    return {"frame": number, "frame_ms": frame_ms, "sections": sections, "counters": counters or {}}
+
+
+@pytest.fixture
+def profiler():
+    profiler = FrameProfiler()
+    yield profiler
+    profiler.disable()
+
+
+def test_sections_time_and_count_calls_per_frame(profiler):
+    profiler.watch(Child, "tick", "ticks")
+    profiler.enable()
+    child = Child()
+    assert [child.tick(value) for value in range(3)] == [1, 2, 3]
+    profiler.count("cards", 12)
+    profiler.end_frame()
+    child.tick(0)
+    profiler.end_frame()
+
+    first, second = profiler.frames
+    ms, calls = first["sections"]["ticks"]
+    assert calls == 3 and 0 < ms <= first["frame_ms"]
+    assert second["sections"]["ticks"][1] == 1
+    assert first["counters"] == {"cards": 12} and profiler.frame_count == 2
+
+
+def test_watching_while_enabled_installs_at_once(profiler):
+    profiler.enable()
+    profiler.watch(Child, "tick", "ticks")
+    Child().tick(1)
+    profiler.end_frame()
+    assert profiler.frames[-1]["sections"]["ticks"][1] == 1
+
+
+def test_disable_restores_own_methods_and_unshadows_inherited_ones(profiler):
+    tick = vars(Child)["tick"]
+    profiler.watch(Child, "tick", "ticks")
+    profiler.watch(Child, "step", "steps")  # inherited from Base
+    profiler.enable()
+    assert vars(Child)["tick"] is not tick and "step" in vars(Child)
+    assert Child().step() == "base"
+
+    profiler.disable()
+    assert vars(Child)["tick"] is tick
+    assert "step" not in vars(Child) and Child.step is Base.step
+    counted = {name: list(entry) for name, entry in profiler.sections.items()}
+    Child().tick(1)
+    profiler.end_frame()  # ignored while disabled
+    assert profiler.sections == counted and not profiler.frames
+
+    # Enabling again wraps them afresh
+    profiler.enable()
+    Child().step()
+    profiler.end_frame()
+    assert profiler.frames[-1]["sections"]["steps"][1] == 1
+
+
+def test_a_watched_instance_gets_its_own_wrapper(profiler):
+    watched, other = Child(), Child()
+    profiler.watch(watched, "tick", "ticks")
+    profiler.enable()
+    watched.tick(1)
+    other.tick(1)
+    profiler.end_frame()
+    assert profiler.frames[-1]["sections"]["ticks"][1] == 1
+    profiler.disable()
+    assert "tick" not in vars(watched)
+
+
+def test_summary_over_synthetic_frames(profiler):
+    assert profiler.summary()["frames"] == 0
+    profiler.frames.extend([
+        frame(1, 10.0, {"simulation": (2.0, 1), "ui": (1.0, 4)}, {"cards": 5}),
+        frame(2, 20.0, {"simulation": (6.0, 3)}, {"cards": 7}),
+        frame(3, 30.0, {"simulation": (4.0, 2), "ui": (5.0, 2)}, {"cards": 9}),
+    ])
+    summary = profiler.summary()
+    assert summary["frames"] == 3
+    assert summary["frame_ms"] == {"mean": 20.0, "p95": 30.0, "max": 30.0}
+    # Sections by mean time, a frame without one counting as zero
+    assert list(summary["sections"]) == ["simulation", "ui"]
+    assert summary["sections"]["simulation"] == {"mean_ms": 4.0, "max_ms": 6.0, "calls": 2.0}
+    assert summary["sections"]["ui"] == {"mean_ms": 2.0, "max_ms": 5.0, "calls": 2.0}
+    assert summary["counters"] == {"cards": 9}
+
+
+def test_exports_over_synthetic_frames(profiler, tmp_path):
+    profiler.frames.extend([
+        frame(1, 10.0, {"simulation": (2.0, 1)}, {"cards": 5}),
+        frame(2, 12.5, {"simulation": (3.0, 2), "ui": (0.5, 1)}, {"cards": 6, "events": 2}),
+    ])
+
+    profiler.export_json(tmp_path / "frames.json")
+    exported = json.loads((tmp_path / "frames.json").read_text())
+    assert exported["summary"]["frames"] == 2
+    assert [entry["frame"] for entry in exported["frames"]] == [1, 2]
+    assert exported["frames"][1]["sections"]["ui"] == [0.5, 1]
+
+    profiler.export_csv(tmp_path / "frames.csv")
+    with open(tmp_path / "frames.csv", newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["frame", "frame_ms", "simulation ms", "simulation calls", "ui ms", "ui calls", "cards", "events"]
+    assert rows[1] == ["1", "10.0", "2.0", "1", "0.0", "0", "5", ""]
+    assert rows[2] == ["2", "12.5", "3.0", "2", "0.5", "1", "6", "2"]
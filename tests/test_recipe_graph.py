@@ -0,0 +1,117 @@
+import random
+import time
+
+from wizards_workshop.recipe_graph import RecipeGraph
+from wizards_workshop.recipes import Recipe, RecipeBook
+
+SOURCES = ["Ore", "Coal", "Tome", "Unused"]
+RECIPES = [
+    Recipe("forge", ("Ore", "Coal"), "Ingot"),            # depth 1
+    Recipe("study", ("Tome",), "Lore"),                   # depth 1
+    Recipe("forge", ("Ingot", "Lore"), "Blade"),          # depth 2
+    Recipe("forge", ("Blade", "Ingot"), "Sword"),         # depth 3 this way...
+    Recipe("ritual", ("Ore", "Tome", "Tome"), "Sword"),   # ...but 1 this way
+    Recipe("ritual", ("Blade", "Stardust"), "Relic"),     # Stardust is never available
+    Recipe("alchemy", ("Ouroboros",), "Serpent"),         # a loop nothing starts
+    Recipe("alchemy", ("Serpent",), "Ouroboros"),
+]
+
+
+def synthetic_recipes(size, seed):
+    # Mostly built on recent items; some need titles nobody makes or loop back
+    rng = random.Random(seed)
+    sources = [f"Start {i}" for i in range(10)]
+    recipes = []
+    for i in range(size):
+        inputs = []
+        for _ in range(rng.randint(1, 3)):
+            roll = rng.random()
+            if i < 20 or roll < 0.2:
+                inputs.append(rng.choice(sources))
+            elif roll < 0.202:
+                inputs.append(f"Lost {rng.randrange(100)}")
+            elif roll < 0.23:
+                inputs.append(f"Item {rng.randrange(size)}")
+            else:
+                inputs.append(f"Item {rng.randrange(max(0, i - 1000), i)}")
+        recipes.append(Recipe("forge", tuple(inputs), f"Item {i}"))
+    return recipes, sources
+
+
+def report(graph):
+    return (graph.depth, graph.unreachable_outputs(), graph.missing_inputs(), graph.unused_inputs(),
+            sorted(map(repr, graph.dead_recipes())))
+
+
+def test_depth_is_the_shortest_way_to_craft():
+    graph = RecipeGraph(RECIPES, SOURCES)
+    assert {title: graph.depth[title] for title in ("Ore", "Ingot", "Lore", "Blade", "Sword")} == {
+        "Ore": 0, "Ingot": 1, "Lore": 1, "Blade": 2, "Sword": 1}
+    assert graph.is_reachable("Blade") and not graph.is_reachable("Relic")
+
+
+def test_reports_of_what_can_never_be_made():
+    graph = RecipeGraph(RECIPES, SOURCES)
+    assert graph.unreachable_outputs() == {"Relic", "Serpent", "Ouroboros"}
+    assert [recipe.output for recipe in graph.dead_recipes()] == ["Relic", "Serpent", "Ouroboros"]
+    assert graph.missing_inputs() == {"Stardust"}  # the loop's titles are produced, just never started
+    assert graph.unused_inputs() == {"Unused"}
+
+
+def test_recipes_without_inputs_fire_from_nothing():
+    graph = RecipeGraph([Recipe("study", (), "Idea"), Recipe("study", ("Idea",), "Plan")], [])
+    assert graph.depth == {"Idea": 1, "Plan": 2}
+
+
+def test_adding_recipes_and_sources_matches_a_rebuild():
+    recipes, sources = synthetic_recipes(3000, seed=1)
+    graph = RecipeGraph(recipes[:1000], sources[:5])
+    for recipe in recipes[1000:]:
+        graph.add_recipe(recipe)
+    for title in sources[5:] + ["Lost 7"]:
+        graph.add_source(title)
+    assert report(graph) == report(RecipeGraph(recipes, sources + ["Lost 7"]))
+
+
+def test_added_shortcut_lowers_depths_downstream():
+    graph = RecipeGraph(RECIPES, SOURCES)
+    graph.add_recipe(Recipe("forge", ("Ore",), "Blade"))
+    assert graph.depth["Blade"] == 1
+    graph.add_source("Stardust")
+    assert graph.depth["Relic"] == 2 and not graph.missing_inputs()
+
+
+def test_book_keeps_its_graph_in_step_with_its_recipes():
+    book = RecipeBook(RECIPES[:3])
+    book.graph.add_source("Ore")  # the book's sources are the game's starting cards
+    graph = book.graph
+    book.add_recipe(Recipe("forge", ("Ingot",), "Nail"))
+    assert book.graph is graph and "Nail" in graph.produced_by
+
+    book.remove_recipe(RECIPES[0])
+    assert book.graph is not graph
+    assert "Ingot" not in book.graph.produced_by and not book.graph.is_reachable("Nail")
+
+
+def test_fixed_point_does_work_in_proportion_to_the_book():
+    # Each recipe fires at most once per input that settled, not once per pass over the book
+    class Counting(RecipeGraph):
+        fires = 0
+
+        def _fire(self, index, changed):
+            Counting.fires += 1
+            super()._fire(index, changed)
+
+    recipes, sources = synthetic_recipes(20_000, seed=2)
+    Counting(recipes, sources)
+    assert Counting.fires <= sum(len(set(recipe.inputs)) for recipe in recipes)
+
+
+def test_hundred_thousand_recipes_analyse_within_a_second():
+    recipes, sources = synthetic_recipes(100_000, seed=3)
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        RecipeGraph(recipes, sources).unreachable_outputs()
+        best = min(best, time.perf_counter() - start)
+    assert best < 1.0, f"full analysis took {best:.2f} s"
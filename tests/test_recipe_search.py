@@ -0,0 +1,63 @@
+import pytest
+
+from wizards_workshop.recipe_search import RecipeIndex
+from wizards_workshop.recipes import Recipe, RecipeBook
+
+RECIPES = [
+    Recipe("forge", ("Iron Ore", "Coal"), "Iron Ingot"),
+    Recipe("forge", ("Iron Ingot", "Basic Forging"), "Iron Blade"),
+    Recipe("study", ("Elemental Theory", "Simple Wand"), "Spell: Ignite"),
+    Recipe("alchemy", ("Herb", "Mana"), "Minor Potion"),
+    Recipe("alchemy", ("Flame Essence", "Minor Potion"), "Potion of Fire Resistance"),
+]
+
+
+@pytest.fixture
+def index():
+    return RecipeIndex(RECIPES)
+
+
+def outputs(index, query):
+    return [RECIPES[position].output for position in index.search(query)]
+
+
+def test_empty_query_lists_every_recipe_in_book_order(index):
+    assert list(index.search("")) == list(range(len(RECIPES)))
+    assert list(index.search("  ")) == list(range(len(RECIPES)))
+
+
+def test_short_terms_match_word_prefixes(index):
+    assert outputs(index, "ir") == ["Iron Ingot", "Iron Blade"]  # not the "ir" inside "fire"
+    assert outputs(index, "re") == ["Potion of Fire Resistance"]  # not the "re" inside "ore" or "fire"
+
+
+def test_longer_terms_match_any_substring(index):
+    assert outputs(index, "otio") == ["Minor Potion", "Potion of Fire Resistance"]
+    assert outputs(index, "gnit") == ["Spell: Ignite"]
+    assert outputs(index, "xyz") == []
+
+
+def test_terms_are_anded_and_case_blind(index):
+    assert outputs(index, "IRON coal") == ["Iron Ingot"]
+    assert outputs(index, "potion fire") == ["Potion of Fire Resistance"]
+    assert outputs(index, "iron herb") == []
+
+
+def test_punctuation_splits_words_like_the_index(index):
+    assert outputs(index, "Spell: Ignite") == ["Spell: Ignite"]
+    assert outputs(index, "spell:") == ["Spell: Ignite"]
+    assert outputs(index, "iron-ore") == ["Iron Ingot"]
+
+
+def test_each_keystroke_narrows_to_a_fresh_search(index):
+    for query in ("p", "po", "pot", "poti", "potio", "potion", "potion f", "potion fi", "potion fir"):
+        assert outputs(index, query) == outputs(RecipeIndex(RECIPES), query), query
+    # Backspacing widens again
+    assert outputs(index, "pot") == ["Minor Potion", "Potion of Fire Resistance"]
+
+
+def test_book_index_follows_added_recipes():
+    book = RecipeBook(RECIPES)
+    assert not book.search_index.search("moon")
+    book.add_recipe(Recipe("alchemy", ("Moonpetal", "Mana"), "Moon Draught"))
+    assert [book.recipes[position].output for position in book.search_index.search("moon")] == ["Moon Draught"]
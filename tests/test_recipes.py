@@ -0,0 +1,99 @@
+import pytest
+
+from wizards_workshop.planner import PlanningError
+from wizards_workshop.recipes import Recipe, RecipeBook
+
+
+def test_find_recipe_ignores_card_order(book):
+    assert book.find_recipe("forge", ["Coal", "Iron Ore"]).output == "Iron Ingot"
+    assert book.find_recipe("forge", ["Iron Ore", "Coal"]).output == "Iron Ingot"
+
+
+def test_find_recipe_counts_repeated_cards(book):
+    assert book.find_recipe("ritual", ["Mana", "Crystal Shard", "Mana"]).output == "Charged Crystal"
+    assert book.find_recipe("ritual", ["Mana", "Crystal Shard"]) is None
+    assert book.find_recipe("ritual", ["Mana", "Crystal Shard", "Crystal Shard"]) is None
+
+
+def test_find_recipe_is_per_verb(book):
+    assert book.find_recipe("study", ["Iron Ore", "Coal"]) is None
+
+
+def test_earliest_recipe_wins_a_shared_key(book):
+    book.add_recipe(Recipe("forge", ("Coal", "Iron Ore"), "Steel", 3.0))
+    assert book.find_recipe("forge", ["Iron Ore", "Coal"]).output == "Iron Ingot"
+
+
+def test_removed_recipes_stop_matching(book):
+    book.remove_recipe(book.find_recipe("forge", ["Iron Ore", "Coal"]))
+    assert book.find_recipe("forge", ["Iron Ore", "Coal"]) is None
+
+
+
+def test_plan_crafts_inputs_first_and_counts_raw_inputs(book):
+    book.add_recipe(Recipe("forge", ("Iron Ingot", "Basic Forging"), "Iron Blade", 3.0))
+    plan = book.plan("Iron Blade", count=2)
+    assert {step.recipe.output: step.count for step in plan.steps} == {
+        "Iron Ingot": 2, "Basic Forging": 2, "Iron Blade": 2}
+    assert plan.steps[-1].recipe.output == "Iron Blade"
+    assert [len(stage) for stage in plan.stages] == [2, 1]
+    assert plan.raw_inputs == {"Iron Ore": 2, "Coal": 2, "Mysterious Tome": 2}
+
+
+def test_plan_takes_what_the_inventory_has(book):
+    book.add_recipe(Recipe("forge", ("Iron Ingot", "Basic Forging"), "Iron Blade", 3.0))
+    plan = book.plan("Iron Blade", inventory={"Iron Ingot": 1})
+    assert plan.from_inventory == {"Iron Ingot": 1}
+    assert "Iron Ingot" not in {step.recipe.output for step in plan.steps}
+    assert plan.raw_inputs == {"Mysterious Tome": 1}
+
+
+def test_plan_of_an_uncraftable_title_fails(book):
+    with pytest.raises(PlanningError):
+        book.plan("Philosopher's Stone")
+
+
+def test_shared_book_is_read_only():
+    shared = RecipeBook.shared()
+    assert RecipeBook.shared() is shared
+    with pytest.raises(TypeError):
+        shared.add_recipe(Recipe("forge", ("Coal",), "Ash"))
+
+
+def test_for_verb_follows_book_changes(book):
+    assert [recipe.output for recipe in book.for_verb("forge")] == ["Iron Ingot"]
+    book.add_recipe(Recipe("forge", ("Coal",), "Ash"))
+    assert [recipe.output for recipe in book.for_verb("forge")] == ["Iron Ingot", "Ash"]
+    book.remove_recipe(book.find_recipe("forge", ["Iron Ore", "Coal"]))
+    assert [recipe.output for recipe in book.for_verb("forge")] == ["Ash"]
+
+
+def test_completions_are_recipes_the_cards_start(book):
+    assert [recipe.output for recipe in book.completions("ritual", ["Mana"])] == ["Charged Crystal"]
+    assert [recipe.output for recipe in book.completions("ritual", ["Mana", "Mana"])] == ["Charged Crystal"]
+    assert not book.completions("ritual", ["Mana", "Mana", "Mana"])
+
+
+def test_completions_follow_added_recipes(book):
+    book.completions("ritual", ["Mana"])  # builds the trie
+    book.add_recipe(Recipe("ritual", ("Mana", "Herb"), "Blessed Herb"))
+    assert [recipe.output for recipe in book.completions("ritual", ["Mana"])] == ["Charged Crystal", "Blessed Herb"]
+
+
+def test_suggest_ranks_every_completion(book):
+    # An exact match behind many longer recipes still comes first
+    for i in range(20):
+        book.add_recipe(Recipe("study", ("Crystal Shard", f"Rune {i}"), f"Ward {i}"))
+    book.add_recipe(Recipe("study", ("Crystal Shard",), "Shard Lore"))
+    suggestions = book.trie("study").suggest(["Crystal Shard"], limit=3)
+    assert suggestions == [
+        (book.find_recipe("study", ["Crystal Shard"]), []),
+        (book.find_recipe("study", ["Crystal Shard", "Rune 0"]), ["Rune 0"]),
+        (book.find_recipe("study", ["Crystal Shard", "Rune 1"]), ["Rune 1"]),
+    ]
+
+
+def test_suggest_lists_missing_cards_with_repeats(book):
+    [(recipe, missing)] = book.trie("ritual").suggest(["Crystal Shard"])
+    assert recipe.output == "Charged Crystal"
+    assert missing == ["Mana", "Mana"]
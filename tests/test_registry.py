@@ -0,0 +1,42 @@
+import pytest
+
+
+def test_lookups_by_id_title_and_type(workshop):
+    ore = workshop.create_card((0, 0.1, 0), "Iron Ore")
+    mana = workshop.create_card((2, 0.1, 0), "Mana")
+    cards = workshop.cards
+    assert cards[ore.id] is ore and ore.id in cards and len(cards) == 2
+    assert list(cards.with_title("Mana")) == [mana]
+    assert list(cards.with_type(ore.card_type)) == [ore]
+
+
+def test_removed_cards_leave_every_index(workshop):
+    card = workshop.create_card((0, 0.1, 0), "Mana")
+    workshop.remove_card(card, "consumed")
+    cards = workshop.cards
+    assert card.id not in cards and cards.get(card.id) is None
+    assert not list(cards.with_title("Mana")) and not list(cards.with_type(card.card_type))
+    assert not cards.remove(card)
+
+
+def test_stale_handles_resolve_to_none(workshop):
+    first = workshop.create_card((0, 0.1, 0), "Coal")
+    handle = first.handle
+    assert workshop.cards.resolve(handle) is first
+    workshop.remove_card(first, "consumed")
+    second = workshop.create_card((0, 0.1, 0), "Coal")
+    assert second.handle.slot == handle.slot
+    assert workshop.cards.resolve(handle) is None
+    assert workshop.cards.resolve(second.handle) is second
+
+
+def test_slots_are_reused_so_capacity_stays_flat(workshop):
+    for _ in range(1000):
+        workshop.remove_card(workshop.create_card((0, 0.1, 0), "Herb"), "expired")
+    assert workshop.cards.capacity == 1 and len(workshop.cards) == 0
+
+
+def test_duplicate_ids_are_refused(workshop):
+    card = workshop.create_card((0, 0.1, 0), "Coal")
+    with pytest.raises(ValueError):
+        workshop.cards.add(card)
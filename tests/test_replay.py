@@ -0,0 +1,94 @@
+import struct
+import zlib
+
+import pytest
+
+from wizards_workshop.replay import (DROP, ReplayDivergence, ReplayError, ReplayRecorder, _ENTRY, _HEADER,
+                                     _PAYLOADS, replay, replay_file, state_hash)
+
+
+def record_session(workshop, verbs):
+    # Generators running while the player drags their cards onto alchemy
+    workshop.add_generator("herb", (20, 0.5, 0), interval=1.0)
+    workshop.add_generator("mana", (-20, 0.5, 0), interval=1.5)
+    recorder = ReplayRecorder(workshop)
+    alchemy = verbs["alchemy"]
+    for _ in range(6):
+        workshop.run(20)
+        for title in ("Herb", "Mana"):
+            card = next(card for card in workshop.cards.with_title(title) if card.verb is None)
+            recorder.pickup(card)
+            for step in range(1, 4):
+                workshop.move_card(card, (card.position[0] * (1 - step / 4), 1, -5))
+                recorder.move(card)
+                workshop.run(1)
+            workshop.move_card(card, alchemy.position)
+            recorder.drop(card, alchemy)
+            workshop.place_card(card, alchemy)
+    workshop.run(50)
+    return recorder
+
+
+def tampered(data, change):
+    # Decompressed body, changed in place, compressed again
+    snapshot_size = _HEADER.unpack_from(data)[2]
+    body = bytearray(zlib.decompress(data[_HEADER.size:]))
+    change(body, snapshot_size)
+    return data[:_HEADER.size] + zlib.compress(body)
+
+
+def test_replay_reproduces_the_session(workshop, verbs, book):
+    recorder = record_session(workshop, verbs)
+    data = recorder.finish()
+    assert workshop.crafted_count > 0
+
+    result = replay(data, book)
+    assert result.state_hash == state_hash(workshop)
+    assert result.workshop.crafted_count == workshop.crafted_count
+    assert result.ticks == workshop.tick - recorder.start_tick
+
+
+def test_replay_from_a_file(workshop, verbs, book, tmp_path):
+    path = tmp_path / "session.replay"
+    recorder = record_session(workshop, verbs)
+    assert recorder.save(path) == path.stat().st_size
+    assert replay_file(path, book).state_hash == state_hash(workshop)
+
+
+def test_changed_input_is_a_divergence(workshop, verbs, book):
+    data = record_session(workshop, verbs).finish()
+
+    def drop_elsewhere(body, offset):
+        # The first drop lands on the forge instead
+        while body[offset] != DROP:
+            offset += _ENTRY.size + _PAYLOADS[body[offset]].size
+        payload = offset + _ENTRY.size
+        card, x, y, z, verb = _PAYLOADS[DROP].unpack_from(body, payload)
+        _PAYLOADS[DROP].pack_into(body, payload, card, x, y, z, 0)
+
+    changed = tampered(data, drop_elsewhere)
+    with pytest.raises(ReplayDivergence):
+        replay(changed, book)
+    assert replay(changed, book, verify=False).state_hash != state_hash(workshop)
+
+
+def test_changed_state_hash_is_a_divergence(workshop, verbs, book):
+    data = record_session(workshop, verbs).finish()
+
+    def flip_hash(body, offset):
+        body[-1] ^= 0xFF
+
+    with pytest.raises(ReplayDivergence, match="final state hash"):
+        replay(tampered(data, flip_hash), book)
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: b"XXXX" + data[4:],
+    lambda data: data[:4] + struct.pack("<H", 99) + data[6:],
+    lambda data: data[:_HEADER.size + 10],
+    lambda data: b"WW",
+])
+def test_damaged_replays_raise_replay_error(workshop, verbs, book, damage):
+    data = record_session(workshop, verbs).finish()
+    with pytest.raises(ReplayError):
+        replay(damage(data), book)
@@ -0,0 +1,109 @@
+from wizards_workshop.scheduler import Scheduler
+
+
+def test_events_fire_by_tick_then_insertion_order():
+    scheduler = Scheduler(tick_rate=10)
+    fired = []
+    scheduler.schedule_at(3, fired.append, "c")
+    scheduler.schedule_at(2, fired.append, "a")
+    scheduler.schedule_at(2, fired.append, "b")
+    scheduler.run(2)
+    assert fired == ["a", "b"]
+    scheduler.run(1)
+    assert fired == ["a", "b", "c"]
+
+
+def test_schedule_in_rounds_up_to_whole_ticks():
+    scheduler = Scheduler(tick_rate=60)
+    assert scheduler.ticks_for(30) == 1800
+    assert scheduler.ticks_for(0.001) == 1
+    assert scheduler.schedule_in(0.5, print).tick == 30
+
+
+def test_past_deadlines_fire_next_tick():
+    scheduler = Scheduler(tick_rate=10)
+    scheduler.run(5)
+    assert scheduler.schedule_at(1, print).tick == 6
+
+
+def test_cancelled_events_do_not_fire():
+    scheduler = Scheduler(tick_rate=10)
+    fired = []
+    event = scheduler.schedule_in(0.1, fired.append, "cancelled")
+    scheduler.schedule_in(0.1, fired.append, "kept")
+    event.cancel()
+    scheduler.run(1)
+    assert fired == ["kept"]
+    assert scheduler.pending_events() == []
+
+
+def test_events_scheduled_while_firing_wait_for_their_tick():
+    scheduler = Scheduler(tick_rate=10)
+    fired = []
+
+    def again(count):
+        fired.append(scheduler.tick)
+        if count:
+            scheduler.schedule_in(0, again, count - 1)
+
+    scheduler.schedule_at(1, again, 2)
+    scheduler.run(5)
+    assert fired == [1, 2, 3]
+
+
+def test_advance_honours_speed_pause_and_frame_cap():
+    scheduler = Scheduler(tick_rate=8)  # ticks of 0.125 s add up exactly
+    assert scheduler.advance(0.3125) == 2  # the half tick carries over
+    assert scheduler.advance(0.0625) == 1
+
+    scheduler.paused = True
+    assert scheduler.advance(1.0) == 0
+    scheduler.paused = False
+
+    scheduler.speed = 10
+    assert scheduler.advance(0.125) == 10
+
+    # A long stall catches up at most max_frame_time, then drops the rest
+    scheduler.speed = 1
+    assert scheduler.advance(5.0) == 2
+    assert scheduler.advance(0.0) == 0
+
+
+def test_seeded_schedulers_draw_the_same_numbers():
+    first, second = Scheduler(seed=7), Scheduler(seed=7)
+    assert [first.random.random() for _ in range(5)] == [second.random.random() for _ in range(5)]
+
+
+def test_timers_fire_after_heap_events_in_their_tick():
+    scheduler = Scheduler(tick_rate=10)
+    fired = []
+    scheduler.schedule_timer_in(0.2, fired.append, "timer")
+    scheduler.schedule_in(0.2, fired.append, "event")
+    scheduler.run(1)
+    assert fired == []
+    scheduler.run(1)
+    assert fired == ["event", "timer"]
+
+
+def test_timers_past_one_turn_of_the_wheel_wait_for_their_tick():
+    scheduler = Scheduler(tick_rate=10)
+    size = scheduler.timers.size
+    fired = []
+    scheduler.timers.schedule_at(size + 5, fired.append, "late")
+    scheduler.timers.schedule_at(5, fired.append, "early")
+    scheduler.run(5)
+    assert fired == ["early"]
+    scheduler.run(size - 1)
+    assert fired == ["early"]
+    scheduler.run(1)
+    assert fired == ["early", "late"]
+    assert len(scheduler.timers) == 0
+
+
+def test_cancelled_timers_do_not_fire():
+    scheduler = Scheduler(tick_rate=10)
+    fired = []
+    timer = scheduler.schedule_timer_in(0.1, fired.append, "cancelled")
+    timer.cancel()
+    scheduler.run(1)
+    assert fired == [] and len(scheduler.timers) == 0
@@ -0,0 +1,66 @@
+from wizards_workshop.events import CardExpired, RecipeCompleted, RecipeRejected
+
+
+def test_recipe_completes_after_its_time(workshop, verbs):
+    forge = verbs["forge"]
+    completed = []
+    workshop.events.subscribe(RecipeCompleted, completed.append)
+    ore = workshop.create_card((0, 0, 0), "Iron Ore")
+    coal = workshop.create_card((2, 0, 0), "Coal")
+    workshop.place_card(ore, forge)
+    workshop.place_card(coal, forge)
+    assert forge.is_processing and not forge.active_cards
+
+    workshop.run(29)
+    assert not completed
+    workshop.run(1)
+    assert [event.output.title for event in completed] == ["Iron Ingot"]
+    assert not ore.alive and not coal.alive
+    assert [card.title for card in workshop.cards.values()] == ["Iron Ingot"]
+    assert workshop.crafted_count == forge.crafted == 1
+
+
+def test_unknown_set_is_rejected_and_stays(workshop, verbs):
+    forge = verbs["forge"]
+    rejected = []
+    workshop.events.subscribe(RecipeRejected, rejected.append)
+    workshop.place_card(workshop.create_card((0, 0, 0), "Iron Ore"), forge)
+    assert not rejected  # still the start of a recipe
+    workshop.place_card(workshop.create_card((2, 0, 0), "Herb"), forge)
+    assert [event.verb for event in rejected] == [forge]
+    assert len(forge.active_cards) == 2 and not forge.is_processing
+
+
+def test_card_lifetime_expires(workshop):
+    expired = []
+    workshop.events.subscribe(CardExpired, expired.append)
+    card = workshop.create_card((0, 0, 0), "Mana", lifetime=2.0)
+    workshop.run(19)
+    assert card.alive
+    workshop.run(1)
+    assert not card.alive and card.id not in workshop.cards
+    assert [event.card for event in expired] == [card]
+    assert workshop.inventory.count("Mana") == 0
+
+
+def test_generator_spawns_every_interval(workshop):
+    workshop.add_generator("herb", (20, 0.5, 0), interval=1.0)
+    workshop.run(10)
+    assert len(workshop.cards.with_title("Herb")) == 1
+    workshop.run(10)
+    assert len(workshop.cards.with_title("Herb")) == 2
+
+
+def test_verb_at_uses_the_drawn_zone(verbs, workshop):
+    # The drawn zone is scale squared times 1.2: 2.7 across for alchemy's 1.5
+    alchemy = verbs["alchemy"]
+    x, _, z = alchemy.position
+    assert workshop.verb_at((x + 1.3, 0, z)) is alchemy
+    assert workshop.verb_at((x + 1.4, 0, z)) is None
+
+
+def test_overlapping_zones_pick_the_closest_verb(verbs, workshop):
+    forge, ritual = verbs["forge"], verbs["ritual"]
+    assert ritual.contains(forge.position)
+    assert workshop.verb_at(forge.position) is forge
+    assert workshop.verb_at(ritual.position) is ritual
@@ -0,0 +1,51 @@
+import pytest
+
+from wizards_workshop.snapshot import SnapshotError, dumps, load_snapshot, loads, save_snapshot
+
+
+def cards_of(workshop):
+    return sorted((card.id, card.title, card.card_type, card.position, card.created_at, card.lifetime,
+                   card.expiry.tick if card.expiry else None) for card in workshop.cards.values())
+
+
+def test_round_trip_keeps_cards_and_clock(workshop, book):
+    workshop.create_card((1, 0.1, 2), "Iron Ore")
+    workshop.create_card((3, 0.1, 4), "Mana", lifetime=30.0, is_resource=True)
+    workshop.run(25)
+
+    snapshot = loads(dumps(workshop, environment_time=12.5), book)
+    loaded = snapshot.workshop
+    assert snapshot.environment_time == 12.5
+    assert loaded.tick == workshop.tick and loaded.scheduler.tick_rate == 10
+    assert cards_of(loaded) == cards_of(workshop)
+    assert loaded.inventory.count("Mana") == 1
+
+
+def test_loaded_workshop_runs_on_like_the_original(workshop, book):
+    workshop.add_generator("herb", (20, 0.5, 0), interval=1.5)
+    workshop.add_generator("mana", (-20, 0.5, 0), interval=2.0)
+    workshop.run(37)
+
+    loaded = loads(dumps(workshop), book).workshop
+    workshop.run(300)
+    loaded.run(300)
+    assert cards_of(loaded) == cards_of(workshop)
+    assert loaded.random.getstate() == workshop.random.getstate()
+
+
+def test_save_and_load_a_file(workshop, book, tmp_path):
+    workshop.create_card((0, 0.1, 0), "Coal")
+    path = tmp_path / "workshop.save"
+    assert save_snapshot(path, workshop) == path.stat().st_size
+    assert cards_of(load_snapshot(path, book).workshop) == cards_of(workshop)
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: data[:len(data) // 2],
+    lambda data: b"NOPE" + data[4:],
+    lambda data: b"",
+])
+def test_damaged_snapshots_raise_snapshot_error(workshop, damage):
+    workshop.create_card((0, 0.1, 0), "Coal")
+    with pytest.raises(SnapshotError):
+        loads(damage(dumps(workshop)))
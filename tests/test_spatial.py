@@ -0,0 +1,28 @@
+from wizards_workshop.spatial import SpatialGrid
+
+
+def test_any_within_is_exact_across_cells():
+    grid = SpatialGrid(cell_size=2.0)
+    grid.insert("card", (1.9, 0, 0))
+    assert grid.any_within((2.1, 0, 0), 0.3)
+    assert grid.any_within((3.3, 0, 0), 1.5)
+    assert not grid.any_within((3.5, 0, 0), 1.5)
+
+
+def test_moved_and_removed_items_leave_their_cells():
+    grid = SpatialGrid(cell_size=2.0)
+    grid.insert("card", (0, 0, 0))
+    grid.move("card", (10, 0, 10))
+    assert not grid.any_within((0, 0, 0), 1.0)
+    assert list(grid.nearby((10, 0, 10))) == ["card"]
+    grid.remove("card")
+    assert "card" not in grid and len(grid) == 0
+    assert not list(grid.nearby((10, 0, 10)))
+
+
+def test_extents_cover_every_cell_they_overlap():
+    grid = SpatialGrid(cell_size=4.0)
+    grid.insert("ritual", (0, 0, 5), extent=5.4)
+    for position in ((-5, 0, 0), (5, 0, 10), (0, 0, 5)):
+        assert "ritual" in set(grid.nearby(position))
+    assert "ritual" not in set(grid.nearby((20, 0, 20)))